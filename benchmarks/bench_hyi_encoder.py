@@ -0,0 +1,85 @@
+"""
+HYİ Paket Kodlayıcı Mikro Benchmark'ı
+create_hyi_packet ile HYIPacketEncoder'ı karşılaştırır ve çıktıların aynı olduğunu doğrular
+
+Kullanım:
+    python benchmarks/bench_hyi_encoder.py [--packets N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from modules.protocol import HYIProtocol, HYIPacketEncoder  # noqa: E402
+
+
+def random_telemetry(rng: random.Random) -> dict:
+    """Rastgele bir telemetri örneği üretir"""
+    return {
+        'irtifa': rng.uniform(0, 3000),
+        'gps_irtifa': rng.uniform(0, 3000),
+        'enlem': 39.9 + rng.uniform(-0.01, 0.01),
+        'boylam': 32.8 + rng.uniform(-0.01, 0.01),
+        'ivme_x': rng.uniform(-20, 20),
+        'ivme_y': rng.uniform(-20, 20),
+        'ivme_z': rng.uniform(-20, 20),
+        'jiroskop_x': rng.uniform(-500, 500),
+        'jiroskop_y': rng.uniform(-500, 500),
+        'jiroskop_z': rng.uniform(-500, 500),
+        'aci': rng.uniform(0, 90),
+        'durum': rng.randint(0, 255),
+    }
+
+
+def verify(samples, encoder: HYIPacketEncoder) -> int:
+    """Her örnek için iki yolun bayt bayt aynı paket ürettiğini doğrular"""
+    for counter, sample in enumerate(samples):
+        reference = HYIProtocol.create_hyi_packet(
+            team_id=counter * 7, packet_counter=counter,
+            **HYIProtocol.parse_telemetry_data(sample)
+        )
+        fast = encoder.encode_telemetry(counter * 7, counter, sample)
+        if reference != fast:
+            raise AssertionError(f"Çıktılar farklı (örnek {counter})")
+    return len(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="HYİ paket kodlayıcı benchmark'ı")
+    parser.add_argument("--packets", type=int, default=20000, help="Ölçülen paket sayısı")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    samples = [random_telemetry(rng) for _ in range(1000)]
+    encoder = HYIPacketEncoder()
+
+    checked = verify(samples, encoder)
+    print(f"Doğrulandı: {checked} paket bayt bayt aynı")
+
+    def reference_path():
+        for counter, sample in enumerate(samples):
+            HYIProtocol.create_hyi_packet(
+                team_id=1, packet_counter=counter, **HYIProtocol.parse_telemetry_data(sample)
+            )
+
+    def fast_path():
+        for counter, sample in enumerate(samples):
+            encoder.encode_telemetry(1, counter, sample)
+
+    rounds = max(1, args.packets // len(samples))
+    reference = min(timeit.repeat(reference_path, number=rounds, repeat=5))
+    fast = min(timeit.repeat(fast_path, number=rounds, repeat=5))
+    packets = rounds * len(samples)
+
+    print(f"create_hyi_packet : {reference / packets * 1e6:8.2f} µs/paket")
+    print(f"HYIPacketEncoder  : {fast / packets * 1e6:8.2f} µs/paket")
+    print(f"Hızlanma          : {reference / fast:8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
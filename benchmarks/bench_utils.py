@@ -0,0 +1,116 @@
+"""
+Benchmark Yardımcıları
+Gecikme örnekleme, yüzdelik hesaplama, bellek ölçümü ve JSON sonuç kaydı
+"""
+
+import gc
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC_DIR)
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Sıralı değerlerde en yakın sıra yöntemiyle yüzdelik"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+def peak_rss_mb() -> float:
+    """Sürecin şimdiye kadarki en yüksek bellek kullanımı (MB, Linux)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def summarize(name: str, latencies: List[float], total_time: float, samples: int,
+              params: Optional[Dict[str, Any]] = None, peak_traced: int = 0,
+              extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Ölçümleri makinece okunabilir tek bir sonuç kaydına dönüştürür"""
+    ordered = sorted(latencies)
+    result = {
+        'name': name,
+        'params': params or {},
+        'samples': samples,
+        'seconds': total_time,
+        'samples_per_sec': samples / total_time if total_time > 0 else 0.0,
+        'p50_us': percentile(ordered, 0.50) * 1e6,
+        'p99_us': percentile(ordered, 0.99) * 1e6,
+        'max_us': (ordered[-1] if ordered else 0.0) * 1e6,
+        'peak_traced_kb': peak_traced / 1024,
+        'peak_rss_mb': peak_rss_mb()
+    }
+    if extra:
+        result.update(extra)
+    return result
+
+
+def time_each(operation: Callable[[Any], Any], items: Sequence[Any]) -> List[float]:
+    """Her öğe için işlemin süresini (saniye) ölçer"""
+    clock = time.perf_counter
+    latencies = []
+    append = latencies.append
+    for item in items:
+        started = clock()
+        operation(item)
+        append(clock() - started)
+    return latencies
+
+
+def traced_peak(operation: Callable[[], Any]) -> int:
+    """İşlemin tracemalloc ile ölçülen en yüksek ek Python bellek kullanımı (bayt)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        operation()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def micro_benchmark(name: str, operation: Callable[[Any], Any], items: Sequence[Any],
+                    params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Öğe başına gecikme ve toplam hız ölçer; bellek ayrı, kısa bir geçişte ölçülür"""
+    operation(items[0])  # ısınma
+    started = time.perf_counter()
+    latencies = time_each(operation, items)
+    total = time.perf_counter() - started
+    sample = items[:min(len(items), 1000)]
+    peak = traced_peak(lambda: [operation(item) for item in sample])
+    return summarize(name, latencies, total, len(items), params, peak)
+
+
+def environment() -> Dict[str, Any]:
+    """Sonuçların karşılaştırılabilmesi için ortam ve sürüm bilgisi"""
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=SRC_DIR,
+            capture_output=True, text=True, timeout=5
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        revision = ""
+    return {
+        'revision': revision,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S")
+    }
+
+
+def print_result(result: Dict[str, Any]):
+    """Tek satırlık okunabilir özet"""
+    print(
+        f"{result['name']:<34} {result['samples_per_sec']:>12.0f}/s  "
+        f"p50 {result['p50_us']:>9.1f} µs  p99 {result['p99_us']:>9.1f} µs  "
+        f"bellek {result['peak_traced_kb']:>8.0f} kB",
+        flush=True
+    )
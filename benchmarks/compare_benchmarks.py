@@ -0,0 +1,71 @@
+"""
+Benchmark Sonuç Karşılaştırıcı
+run_benchmarks.py'nin iki JSON çıktısını karşılaştırır ve gerilemeleri raporlar
+
+Kullanım:
+    python benchmarks/compare_benchmarks.py onceki.json sonraki.json [--threshold 0.10]
+
+Hız (samples_per_sec) eşikten fazla düşer ya da p99 gecikmesi eşikten fazla
+artarsa çıkış kodu 1 olur.
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, Tuple
+
+
+def load_results(path: str) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """Sonuçları (ad, parametreler) anahtarıyla yükler"""
+    with open(path, encoding="utf-8") as handle:
+        report = json.load(handle)
+    return {
+        (result['name'], json.dumps(result['params'], sort_keys=True)): result
+        for result in report['results']
+    }
+
+
+def change(before: float, after: float) -> float:
+    """Göreli değişim (önceki değer 0 ise 0)"""
+    return (after - before) / before if before else 0.0
+
+
+def describe(result: Dict[str, Any]) -> str:
+    """Parametreleri kısa metin olarak döndürür"""
+    return ",".join(f"{name}={value}" for name, value in result['params'].items())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark sonuçlarını karşılaştırır")
+    parser.add_argument("baseline", help="Önceki sürümün sonuç dosyası")
+    parser.add_argument("current", help="Yeni sürümün sonuç dosyası")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Gerileme sayılan göreli değişim (varsayılan 0.10)")
+    args = parser.parse_args()
+
+    baseline = load_results(args.baseline)
+    current = load_results(args.current)
+    regressions = 0
+
+    print(f"{'benchmark':<34} {'parametre':<22} {'hız':>9} {'p99':>9}")
+    for key in sorted(baseline.keys() & current.keys()):
+        before = baseline[key]
+        after = current[key]
+        throughput = change(before['samples_per_sec'], after['samples_per_sec'])
+        p99 = change(before['p99_us'], after['p99_us'])
+        regressed = throughput < -args.threshold or p99 > args.threshold
+        regressions += regressed
+        marker = "  GERİLEME" if regressed else ""
+        print(f"{key[0]:<34} {describe(before):<22} {throughput:>+8.1%} {p99:>+8.1%}{marker}")
+
+    for key in sorted(baseline.keys() - current.keys()):
+        print(f"{key[0]:<34} {describe(baseline[key]):<22} yalnızca önceki sonuçlarda")
+    for key in sorted(current.keys() - baseline.keys()):
+        print(f"{key[0]:<34} {describe(current[key]):<22} yalnızca yeni sonuçlarda")
+
+    print(f"{regressions} gerileme (eşik {args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
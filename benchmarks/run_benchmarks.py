@@ -0,0 +1,404 @@
+"""
+Yer İstasyonu Benchmark Takımı
+Kodlayıcı, ayrıştırıcı, veritabanı ve uçtan uca seri hattın hız, gecikme ve bellek ölçümleri
+
+Mikro benchmark'lar tek tek işlemlerin gecikmesini ölçer. Uçtan uca benchmark
+simülatör örneklerini bir sözde terminal (pty) çiftinden SerialManager'a yazar,
+GroundStation hattından geçirir ve hakem bağlantısının pty'sinden HYİ çerçevesi
+olarak geri okur; gecikme örneğin yazılmasından çerçevenin okunmasına kadardır.
+Her benchmark varsayılan olarak ayrı bir süreçte çalışır, böylece en yüksek RSS
+değerleri birbirini etkilemez. Sonuçlar JSON olarak kaydedilir ve
+compare_benchmarks.py ile sürümler arasında karşılaştırılabilir.
+
+Kullanım:
+    python benchmarks/run_benchmarks.py [--quick] [--sizes 1000,10000,100000]
+                                        [--only ad1,ad2] [--output sonuc.json]
+                                        [--rate HZ] [--ingest json|binary]
+"""
+
+import argparse
+import json
+import os
+import select
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+from bench_utils import (  # noqa: E402 (src dizinini sys.path'e ekler)
+    environment, micro_benchmark, peak_rss_mb, print_result, summarize, time_each, traced_peak
+)
+
+from modules.binary_telemetry import BinaryFrameDecoder, encode_frame  # noqa: E402
+from modules.database_manager import DatabaseManager  # noqa: E402
+from modules.protocol import HYIProtocol, HYIPacketEncoder, HYIFrameDecoder  # noqa: E402
+from modules.telemetry_simulator import (  # noqa: E402
+    TelemetrySimulator, FORMAT_BINARY, FORMAT_JSON, open_pty, fd_writer
+)
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+QUICK_SIZES = (1000, 10000)
+SYNC_LOG_LIMIT = 2000
+
+
+def simulated_samples(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Tekrarlanabilir simülatör örnekleri (iniş sonrası da sabit adımla devam eder)"""
+    return list(TelemetrySimulator(rate_hz=100.0, seed=seed).samples(count))
+
+
+# --- Mikro benchmark'lar ---
+
+def bench_protocol(options) -> List[Dict[str, Any]]:
+    """HYİ paket üretimi ve gelen satır/çerçeve ayrıştırma"""
+    samples = simulated_samples(options.packets)
+    encoder = HYIPacketEncoder()
+    lines = [json.dumps(sample) for sample in samples]
+    frames = [encode_frame(sample, counter) for counter, sample in enumerate(samples)]
+    decoder = BinaryFrameDecoder()
+    params = {'packets': len(samples)}
+
+    return [
+        micro_benchmark(
+            "hyi.create_hyi_packet",
+            lambda sample: HYIProtocol.create_hyi_packet(
+                team_id=1, packet_counter=0, **HYIProtocol.parse_telemetry_data(sample)
+            ),
+            samples, params
+        ),
+        micro_benchmark(
+            "hyi.encode_telemetry", lambda sample: encoder.encode_telemetry(1, 0, sample),
+            samples, params
+        ),
+        micro_benchmark("ingest.json_parse", json.loads, lines, params),
+        micro_benchmark("ingest.binary_decode", decoder.feed, frames, params),
+    ]
+
+
+def wait_for_pyramids(manager: DatabaseManager, timeout: float = 60.0):
+    """end_flight'ın arka planda başlattığı piramit hesaplarının bitmesini bekler"""
+    deadline = time.monotonic() + timeout
+    while manager._pyramid_builds and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+
+def repeat_query(name: str, query: Callable[[], Any], repeat: int,
+                 params: Dict[str, Any], extra: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Sorguyu tekrar tekrar çalıştırır; örnek sayısı sorgu sayısıdır"""
+    query()  # ısınma (sayfa önbelleği)
+    started = time.perf_counter()
+    latencies = time_each(lambda _: query(), range(repeat))
+    total = time.perf_counter() - started
+    return summarize(name, latencies, total, repeat, params, traced_peak(query), extra)
+
+
+def bench_database(options) -> List[Dict[str, Any]]:
+    """log_telemetry (write-behind ve senkron) ile istatistik/grafik/sayfa sorguları"""
+    results = []
+    for size in options.sizes:
+        samples = simulated_samples(size)
+        params = {'size': size}
+        with tempfile.TemporaryDirectory() as directory:
+            db_path = os.path.join(directory, "bench.db")
+            manager = DatabaseManager(db_path, live_buffer_capacity=0)
+            flight_id = manager.start_flight(f"bench_{size}")
+
+            # Write-behind: çağrı başına gecikme kuyruğa bırakma süresidir, hız diske
+            # yazılmanın (flush) bitişine kadar ölçülür
+            log = manager.log_telemetry
+            started = time.perf_counter()
+            latencies = time_each(log, samples)
+            manager.flush()
+            total = time.perf_counter() - started
+            results.append(summarize("db.log_telemetry.write_behind", latencies, total, size, params))
+
+            # Akan istatistikler GroundStation'da her örnekte güncellenir; uçuş sonunda
+            # kayıtlı özet bunlardan oluşur
+            capture_times = [1.0e9 + index * 0.01 for index in range(size)]
+            add = manager.live_statistics.add
+            started = time.perf_counter()
+            latencies = time_each(lambda index: add(samples[index], capture_times[index]), range(size))
+            total = time.perf_counter() - started
+            results.append(summarize("stats.live_add", latencies, total, size, params))
+
+            manager.end_flight(flight_id)
+            wait_for_pyramids(manager)
+
+            repeat = max(3, min(50, 200000 // size))
+            results.append(repeat_query(
+                "db.get_flight_statistics.summary",
+                lambda: manager.get_flight_statistics(flight_id), repeat, params
+            ))
+            results.append(repeat_query(
+                "db.flight_statistics.compute",
+                lambda: manager._compute_flight_statistics(flight_id), repeat, params
+            ))
+            results.append(repeat_query(
+                "db.graph.raw",
+                lambda: manager.get_flight_data_for_graph(flight_id, 'irtifa'), repeat, params
+            ))
+            results.append(repeat_query(
+                "db.graph.lttb_1000",
+                lambda: manager._reduce_points(
+                    manager._read_graph_points(flight_id, 'irtifa', 0, None), 1000, 'lttb'
+                ),
+                repeat, params
+            ))
+            results.append(repeat_query(
+                "db.graph.pyramid_1000",
+                lambda: manager.get_flight_data_for_graph(flight_id, 'irtifa', max_points=1000),
+                repeat, params
+            ))
+
+            # Sayfalı okuma: örnek sayısı okunan satır, gecikme sayfa başınadır
+            pages = manager.iter_logs(flight_id)
+            started = time.perf_counter()
+            page_latencies = time_each(lambda _: next(pages, None), range(size // 500 + 1))
+            total = time.perf_counter() - started
+            results.append(summarize("db.iter_logs.page", page_latencies, total, size, params))
+            manager.close()
+
+        # Senkron yol her kayıtta bağlantı açıp commit ettiği için örnek sayısı sınırlıdır
+        sync_count = min(size, SYNC_LOG_LIMIT)
+        with tempfile.TemporaryDirectory() as directory:
+            manager = DatabaseManager(os.path.join(directory, "bench.db"), write_behind=False,
+                                      live_buffer_capacity=0)
+            manager.start_flight(f"bench_sync_{size}")
+            started = time.perf_counter()
+            latencies = time_each(manager.log_telemetry, samples[:sync_count])
+            total = time.perf_counter() - started
+            results.append(summarize(
+                "db.log_telemetry.sync", latencies, total, sync_count,
+                {'size': size, 'logged': sync_count}
+            ))
+    return results
+
+
+# --- Uçtan uca benchmark ---
+
+def bench_pipeline(options) -> List[Dict[str, Any]]:
+    """pty → SerialManager → GroundStation → hakem pty hattı"""
+    from modules.ground_station import GroundStation
+    from modules.ingest_queue import POLICY_BLOCK
+    from modules.judge_transmitter import POLICY_FIFO
+    from modules.serial_manager import ROLE_JUDGE
+
+    count = options.pipeline_samples
+    fmt = FORMAT_BINARY if options.ingest == 'binary' else FORMAT_JSON
+    results = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Her örnek hakeme ulaşmalı: alım kuyruğu atlamak yerine bekletir, hakem
+        # gönderimi sıralıdır ve kuyruğu tüm örnekleri alır
+        station = GroundStation(
+            db_path=os.path.join(directory, "bench.db"), live_buffer_capacity=0,
+            judge_policy=POLICY_FIFO, judge_queue_size=count, ingest_policy=POLICY_BLOCK,
+            metrics_enabled=not options.no_metrics
+        )
+        rocket_master, rocket_port = open_pty()
+        judge_master, judge_port = open_pty()
+        write = fd_writer(rocket_master)
+
+        sent_at: List[float] = [0.0] * count
+        latencies: List[float] = []
+        received = [0]
+        done = threading.Event()
+        stop = threading.Event()
+
+        def read_judge():
+            # Örnekler irtifa alanında sıra numarasını taşır; çerçeve bununla eşlenir
+            decoder = HYIFrameDecoder()
+            clock = time.perf_counter
+            while not stop.is_set():
+                ready, _, _ = select.select([judge_master], [], [], 0.1)
+                if not ready:
+                    continue
+                try:
+                    data = os.read(judge_master, 65536)
+                except OSError:
+                    break
+                now = clock()
+                for frame in decoder.feed(data):
+                    index = int(round(frame.altitude))
+                    if 0 <= index < count:
+                        latencies.append(now - sent_at[index])
+                    received[0] += 1
+                if received[0] >= count:
+                    done.set()
+
+        reader = threading.Thread(target=read_judge, daemon=True)
+        reader.start()
+
+        if not station.connect(rocket_port, team_id=1, ingest_mode=options.ingest,
+                               flight_name="bench_pipeline"):
+            raise RuntimeError(f"Porta bağlanılamadı: {rocket_port}")
+        if not station.add_link(ROLE_JUDGE, judge_port):
+            raise RuntimeError(f"Hakem portuna bağlanılamadı: {judge_port}")
+
+        simulator = TelemetrySimulator(rate_hz=options.rate or 1000.0, seed=7)
+        clock = time.perf_counter
+        produced = [0]
+
+        def send(sample: Dict[str, Any]):
+            index = produced[0]
+            sample['irtifa'] = float(index)
+            payload = simulator.encode(sample, fmt, index)
+            sent_at[index] = clock()
+            write(payload)
+            produced[0] = index + 1
+
+        started = clock()
+        if options.rate:
+            simulator.run(send, count=count)
+        else:
+            for sample in simulator.samples(count):
+                send(sample)
+        sent_seconds = clock() - started
+
+        # Son örneklerin hakeme ulaşması için en fazla son ilerlemeden sonra 5 sn beklenir
+        last_received = -1
+        while not done.wait(5.0) and received[0] != last_received:
+            last_received = received[0]
+        total = clock() - started
+
+        stop.set()
+        reader.join(1.0)
+        stats = station.stats()
+        stages = station.metrics.snapshot()['stages'] if station.metrics.enabled else {}
+        station.shutdown()
+        wait_for_pyramids(station.database_manager)
+        os.close(rocket_master)
+        os.close(judge_master)
+
+    results.append(summarize(
+        "pipeline.pty_to_judge", latencies, total, received[0],
+        {'samples': count, 'ingest': options.ingest, 'rate_hz': options.rate,
+         'metrics': not options.no_metrics},
+        extra={
+            'sent': count,
+            'received': received[0],
+            'lost': count - received[0],
+            'send_seconds': sent_seconds,
+            'judge_dropped': stats['judge']['dropped'],
+            'ingest_high_water': stats['ingest']['high_water'],
+            'parse_errors': stats['parse_errors'],
+            'stages': stages
+        }
+    ))
+    return results
+
+
+BENCHMARKS = {
+    'protocol': bench_protocol,
+    'database': bench_database,
+    'pipeline': bench_pipeline,
+}
+
+
+def run_isolated(name: str, argv: List[str]) -> List[Dict[str, Any]]:
+    """Benchmark'ı ayrı süreçte çalıştırır ve sonuçlarını okur"""
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as handle:
+        output = handle.name
+    try:
+        command = [sys.executable, os.path.abspath(__file__), *argv,
+                   "--only", name, "--in-process", "--output", output, "--no-env"]
+        completed = subprocess.run(command)
+        if completed.returncode != 0:
+            print(f"{name} benchmark'ı başarısız oldu (çıkış kodu {completed.returncode})")
+            return []
+        with open(output, encoding="utf-8") as handle:
+            return json.load(handle)['results']
+    finally:
+        os.unlink(output)
+
+
+def parse_sizes(text: str) -> List[int]:
+    return [int(part) for part in text.split(",") if part.strip()]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Yer istasyonu benchmark takımı")
+    parser.add_argument("--quick", action="store_true",
+                        help="Küçük boyutlarla hızlı çalıştırma (CI için)")
+    parser.add_argument("--sizes", type=parse_sizes, default=None,
+                        help="Veritabanı uçuş boyutları, virgülle ayrılmış")
+    parser.add_argument("--packets", type=int, default=None,
+                        help="Protokol benchmark'ındaki örnek sayısı")
+    parser.add_argument("--pipeline-samples", type=int, default=None,
+                        help="Uçtan uca hatta gönderilen örnek sayısı")
+    parser.add_argument("--rate", type=float, default=0.0,
+                        help="Uçtan uca gönderim hızı (Hz, 0: beklemeden)")
+    parser.add_argument("--ingest", choices=["json", "binary"], default="json",
+                        help="Uçtan uca hattın roket veri biçimi")
+    parser.add_argument("--no-metrics", action="store_true",
+                        help="Uçtan uca hatta aşama ölçümlerini kapatır (ek yükü görmek için)")
+    parser.add_argument("--only", default=",".join(BENCHMARKS),
+                        help=f"Çalıştırılacak benchmark'lar ({', '.join(BENCHMARKS)})")
+    parser.add_argument("--output", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--in-process", action="store_true",
+                        help="Tüm benchmark'ları aynı süreçte çalıştır")
+    parser.add_argument("--no-env", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.sizes is None:
+        args.sizes = list(QUICK_SIZES if args.quick else DEFAULT_SIZES)
+    if args.packets is None:
+        args.packets = 5000 if args.quick else 20000
+    if args.pipeline_samples is None:
+        args.pipeline_samples = 2000 if args.quick else 20000
+
+    selected = [name.strip() for name in args.only.split(",") if name.strip()]
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Bilinmeyen benchmark: {', '.join(unknown)}")
+
+    # Alt süreçlere aynı ayarlar aktarılır
+    child_argv = [
+        "--sizes", ",".join(str(size) for size in args.sizes),
+        "--packets", str(args.packets),
+        "--pipeline-samples", str(args.pipeline_samples),
+        "--rate", str(args.rate),
+        "--ingest", args.ingest,
+    ]
+    if args.no_metrics:
+        child_argv.append("--no-metrics")
+
+    results: List[Dict[str, Any]] = []
+    for name in selected:
+        if args.in_process:
+            batch = BENCHMARKS[name](args)
+            if not args.no_env:
+                for result in batch:
+                    print_result(result)
+        else:
+            batch = run_isolated(name, child_argv)
+            for result in batch:
+                print_result(result)
+        results.extend(batch)
+
+    report = {
+        'environment': {} if args.no_env else environment(),
+        'settings': {
+            'sizes': args.sizes,
+            'packets': args.packets,
+            'pipeline_samples': args.pipeline_samples,
+            'rate_hz': args.rate,
+            'ingest': args.ingest
+        },
+        'peak_rss_mb': peak_rss_mb(),
+        'results': results
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2, ensure_ascii=False)
+        if not args.no_env:
+            print(f"Sonuçlar kaydedildi: {args.output}")
+    else:
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    return 0 if results else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Humbaba Yer İstasyonu - Uçuş Dışa Aktarma
+Kayıtlı bir uçuşu sabit bellekle CSV, .npy/.npz ya da sıkı ikili biçime aktarır
+
+Kullanım:
+    python src/export_flight.py --list
+    python src/export_flight.py 3 --format csv --output ucus3.csv
+    python src/export_flight.py 3 --format npz --channels irtifa,hiz --start-time 10 --end-time 60
+    python src/export_flight.py 3 --format npy --output ucus3_kanallar --float32
+"""
+
+import argparse
+import os
+import sys
+
+from modules.database_manager import DatabaseManager, DEFAULT_CHUNK_SIZE
+from modules.flight_export import (
+    FlightExporter, FORMATS, FORMAT_BINARY, FORMAT_CSV, FORMAT_NPY, FORMAT_NPZ
+)
+
+
+# Biçime göre varsayılan çıkış uzantısı (npy bir dizindir)
+EXTENSIONS = {FORMAT_CSV: '.csv', FORMAT_NPY: '', FORMAT_NPZ: '.npz', FORMAT_BINARY: '.bin'}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Humbaba uçuş dışa aktarma")
+    parser.add_argument("flight_id", type=int, nargs="?", help="Aktarılacak uçuşun ID'si")
+    parser.add_argument("--db", default="flight_logs.db", help="Veritabanı dosyası")
+    parser.add_argument("--list", action="store_true", help="Kayıtlı uçuşları listeler")
+    parser.add_argument("--format", choices=FORMATS, default=FORMAT_CSV, help="Çıkış biçimi")
+    parser.add_argument("--output", default=None,
+                        help="Çıkış dosyası (npy için dizin; varsayılan: ucus_<ID>.<uzantı>)")
+    parser.add_argument("--channels", default=None,
+                        help="Virgülle ayrılmış kanal listesi (varsayılan: tüm tipli kanallar)")
+    parser.add_argument("--start-time", type=float, default=None,
+                        help="Başlangıç (uçuşun ilk örneğinden itibaren saniye)")
+    parser.add_argument("--end-time", type=float, default=None,
+                        help="Bitiş (uçuşun ilk örneğinden itibaren saniye, hariç)")
+    parser.add_argument("--float32", action="store_true",
+                        help="npy/npz/ikili biçimde kanal değerlerini float32 yazar")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Veritabanından bir seferde okunan satır sayısı")
+    return parser
+
+
+def print_flights(database_manager: DatabaseManager):
+    """Kayıtlı uçuşları tablo olarak yazdırır"""
+    print(f"{'ID':>5}  {'durum':<10} {'başlangıç':<26} {'örnek':>8} {'süre':>8} "
+          f"{'tepe (m)':>9}  ad")
+    for flight in database_manager.get_flight_list():
+        samples = flight['sample_count']
+        duration = f"{flight['duration']:.1f}" if flight['duration'] is not None else "-"
+        apogee = f"{flight['max_altitude']:.1f}" if flight['max_altitude'] is not None else "-"
+        print(f"{flight['id']:>5}  {flight['status'] or '':<10} {flight['start_time'] or '':<26} "
+              f"{samples if samples is not None else '-':>8} {duration:>8} {apogee:>9}  "
+              f"{flight['name']}")
+
+
+def main() -> int:
+    """Dışa aktarma ana fonksiyonu"""
+    parser = build_parser()
+    args = parser.parse_args()
+    if not os.path.exists(args.db):
+        parser.error(f"Veritabanı bulunamadı: {args.db}")
+
+    database_manager = DatabaseManager(args.db, write_behind=False, live_buffer_capacity=0)
+    try:
+        if args.list:
+            print_flights(database_manager)
+            return 0
+        if args.flight_id is None:
+            parser.error("Uçuş ID'si ya da --list verilmelidir")
+
+        channels = [name.strip() for name in args.channels.split(",")] if args.channels else None
+        output = args.output or f"ucus_{args.flight_id}{EXTENSIONS[args.format]}"
+        exporter = FlightExporter(database_manager, args.flight_id, channels,
+                                  start_time=args.start_time, end_time=args.end_time,
+                                  chunk_size=args.chunk_size, float32=args.float32)
+        try:
+            summary = exporter.export(output, args.format)
+        except OSError as e:
+            print(f"Dışa aktarma hatası: {e}")
+            return 1
+
+        print(
+            f"Uçuş {args.flight_id}: {summary['rows']} satır, {len(summary['channels'])} kanal → "
+            f"{output} ({summary['bytes'] / 1024:.1f} KB, {summary['seconds']:.2f} s, "
+            f"{summary['rows_per_sec']:.0f} satır/s)",
+            flush=True
+        )
+        return 0 if summary['rows'] else 1
+    finally:
+        database_manager.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""
+Humbaba Yer İstasyonu - Başsız (Headless) Çalıştırıcı
+QML arayüzü olmadan seri alım → SQLite → hakem gönderimi hattını çalıştırır
+
+Kullanım:
+    python src/headless.py --port /dev/ttyUSB0 --baud 115200 --team-id 7 \\
+        --link payload=/dev/ttyUSB1:57600 --link judge=/dev/ttyUSB2:19200
+
+    # Kayıtlı 3 numaralı uçuşu en yüksek hızda hattan geçirip ulaşılan hızı ölçmek için
+    python src/headless.py --replay 3 --replay-speed 0
+"""
+
+import argparse
+import signal
+import sys
+import threading
+import time
+
+from modules.database_manager import DatabaseManager
+from modules.flight_replay import FlightReplay
+from modules.ground_station import GroundStation
+from modules.ingest_queue import POLICIES, POLICY_DROP_OLDEST
+from modules.serial_manager import INGEST_BINARY, INGEST_JSON
+
+
+def parse_link(value: str):
+    """'rol=port[:baud[:kip]]' biçimindeki bağlantı tanımını çözer"""
+    role, _, spec = value.partition("=")
+    if not role or not spec:
+        raise argparse.ArgumentTypeError(f"Geçersiz bağlantı tanımı: {value}")
+
+    baudrate, ingest_mode = 9600, INGEST_JSON
+    head, _, tail = spec.rpartition(":")
+    if head and tail in (INGEST_JSON, INGEST_BINARY):
+        ingest_mode, spec = tail, head
+    head, _, tail = spec.rpartition(":")
+    if head and tail.isdigit():
+        baudrate, spec = int(tail), head
+    return role, spec, baudrate, ingest_mode
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Humbaba başsız yer istasyonu")
+    parser.add_argument("--port", default=None, help="Roket alıcısının seri portu")
+    parser.add_argument("--baud", type=int, default=9600, help="Roket alıcısı baud hızı")
+    parser.add_argument("--team-id", type=int, default=1, help="HYİ takım ID'si")
+    parser.add_argument("--ingest", choices=(INGEST_JSON, INGEST_BINARY), default=INGEST_JSON,
+                        help="Roket alıcısının veri biçimi")
+    parser.add_argument("--link", type=parse_link, action="append", default=[],
+                        metavar="ROL=PORT[:BAUD[:KİP]]",
+                        help="Ek bağlantı (payload, stage, judge); birden fazla verilebilir")
+    parser.add_argument("--judge-rate", type=float, default=0.0,
+                        help="Hakem paket gönderim hızı (Hz, 0: sınırsız)")
+    parser.add_argument("--db", default="flight_logs.db", help="Veritabanı dosyası")
+    parser.add_argument("--flight-name", default=None, help="Uçuş adı")
+    parser.add_argument("--live-buffer", type=int, default=0,
+                        help="Canlı halka tampon kapasitesi (0: kapalı, NumPy yüklenmez)")
+    parser.add_argument("--status-interval", type=float, default=5.0,
+                        help="Durum satırı aralığı (saniye, 0: kapalı)")
+    parser.add_argument("--replay", type=int, default=None, metavar="UÇUŞ_ID",
+                        help="Kayıtlı uçuşu seri port yerine hattan yeniden geçirir")
+    parser.add_argument("--replay-speed", type=float, default=1.0,
+                        help="Oynatma hızı (1: gerçek zaman, N: N kat, 0: en yüksek hız)")
+    parser.add_argument("--replay-db", default=None,
+                        help="Oynatılacak uçuşun okunacağı veritabanı (varsayılan: --db)")
+    parser.add_argument("--ingest-queue", type=int, default=1024,
+                        help="Okuma ile işleme arasındaki kuyruk boyutu (0: kuyruksuz)")
+    parser.add_argument("--ingest-policy", choices=POLICIES, default=POLICY_DROP_OLDEST,
+                        help="Kuyruk dolduğunda politika (atlanan örnekler yine de kaydedilir)")
+    parser.add_argument("--metrics-file", default=None,
+                        help="Aşama gecikme ölçümlerinin JSON satırı olarak ekleneceği dosya")
+    parser.add_argument("--metrics-interval", type=float, default=10.0,
+                        help="Ölçüm dökümü aralığı (saniye)")
+    parser.add_argument("--no-metrics", action="store_true",
+                        help="Aşama gecikme ölçümlerini kapatır")
+    parser.add_argument("--archive", action="store_true",
+                        help="Biten uçuşu sıkıştırılmış arşive taşır")
+    parser.add_argument("--journal", default=None, metavar="DİZİN",
+                        help="Alınan ham baytları kurtarma için bu dizindeki günlüğe yazar")
+    parser.add_argument("--journal-segment-mb", type=int, default=64,
+                        help="Önceden ayrılan günlük segmenti boyutu (MB)")
+    return parser
+
+
+def print_status(station: GroundStation, started: float, received: list):
+    """Tek satırlık durum özeti yazdırır"""
+    stats = station.stats()
+    judge = stats['judge']
+    ingest = stats['ingest']
+    elapsed = time.monotonic() - started
+    queue = ""
+    if ingest:
+        queue = (f"  kuyruk: {ingest['depth']} (en fazla {ingest['high_water']}), "
+                 f"{ingest['displaced']} yalnızca kaydedildi")
+    writer = stats['writer']
+    if writer and writer['failed']:
+        queue += f"  yazılamayan kayıt: {writer['failed']}"
+    print(
+        f"[{elapsed:7.1f} s] örnek: {received[0]}  hakem: {judge['sent']} gönderildi / "
+        f"{judge['dropped']} atıldı  bekleyen kayıt: {stats['pending_writes']}  "
+        f"ayrıştırma hatası: {stats['parse_errors']}{queue}",
+        flush=True
+    )
+
+
+def print_replay_summary(stats: dict, flush_time: float):
+    """Oynatma sonunda ulaşılan hızı ve kayıt boşaltma süresini yazdırır"""
+    total = stats['elapsed'] + flush_time
+    print(
+        f"Tekrar oynatma: {stats['replayed']} örnek, {stats['elapsed']:.2f} s "
+        f"({stats['rate']:.0f} örnek/s), en büyük gecikme {stats['max_lag'] * 1000:.1f} ms, "
+        f"kayıt boşaltma {flush_time * 1000:.0f} ms, "
+        f"kalıcı hız {stats['replayed'] / total if total > 0 else 0.0:.0f} örnek/s",
+        flush=True
+    )
+
+
+def main() -> int:
+    """Başsız çalıştırıcı ana fonksiyonu"""
+    parser = build_parser()
+    args = parser.parse_args()
+    if args.port is None and args.replay is None:
+        parser.error("--port ya da --replay verilmelidir")
+
+    station = GroundStation(args.db, live_buffer_capacity=args.live_buffer,
+                            judge_rate=args.judge_rate, metrics_enabled=not args.no_metrics,
+                            ingest_queue_size=args.ingest_queue, ingest_policy=args.ingest_policy,
+                            journal_dir=args.journal,
+                            journal_segment_size=args.journal_segment_mb * 1024 * 1024)
+    station.database_manager.archive_completed = args.archive
+    if args.metrics_file and not args.no_metrics:
+        station.metrics.start_dump(args.metrics_file, args.metrics_interval)
+    station.connection_status_changed.connect(lambda ok, message: print(message, flush=True))
+    station.link_status_changed.connect(
+        lambda role, ok, message: print(f"{role}: {message}", flush=True)
+    )
+
+    received = [0]
+
+    def count_sample(data):
+        received[0] += 1
+
+    station.telemetry_received.connect(count_sample)
+
+    for role, port, baudrate, ingest_mode in args.link:
+        station.add_link(role, port, baudrate, ingest_mode)
+    if args.port is not None:
+        if not station.connect(args.port, args.team_id, args.baud, args.ingest, args.flight_name):
+            station.shutdown()
+            return 1
+    else:
+        station.judge_transmitter.team_id = args.team_id
+        station.database_manager.start_flight(
+            args.flight_name or f"Tekrar_{args.replay}_{int(time.time())}"
+        )
+
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+
+    replay = None
+    if args.replay is not None:
+        source = station.database_manager
+        if args.replay_db:
+            source = DatabaseManager(args.replay_db, write_behind=False, live_buffer_capacity=0)
+        replay = FlightReplay(source, station.process_telemetry,
+                              on_finished=lambda stats: stop.set())
+        replay.start(args.replay, args.replay_speed)
+
+    started = time.monotonic()
+    interval = args.status_interval if args.status_interval > 0 else 1.0
+    while not stop.wait(interval):
+        if args.status_interval > 0:
+            print_status(station, started, received)
+
+    if replay is not None:
+        replay.stop()
+        flushed = time.monotonic()
+        station.database_manager.flush()
+        print_replay_summary(replay.stats(), time.monotonic() - flushed)
+        # Oynatma uçuşu seri bağlantıya bağlı değildir; özet, piramit ve arşiv için
+        # burada kapatılır
+        flight_id = station.database_manager.current_flight_id
+        if flight_id:
+            station.database_manager.end_flight(flight_id)
+
+    station.shutdown()
+    # Uçuş sonu piramit, rota ve (istenirse) arşivleme arka planda sürer; süreç
+    # bitmeden tamamlanmalı
+    station.database_manager.wait_background()
+    station.metrics.stop_dump()
+    print_status(station, started, received)
+    if station.metrics.enabled:
+        print(station.metrics.report())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
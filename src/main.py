@@ -3,21 +3,28 @@ Humbaba Yer İstasyonu - Ana Uygulama
 Roket telemetri sistemi ve hakem yer istasyonu entegrasyonu
 """
 
+import argparse
 import sys
 import os
-from PyQt5.QtCore import QUrl
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtQml import QQmlApplicationEngine
-from PyQt5.QtGui import QPixmap
-from PyQt5.QtWidgets import QSplashScreen
-from PyQt5.QtCore import Qt
 
-# Modülleri import et
-from modules.ui_bridge import TelemetryBridge, SpeechHelper, LogManager
+from modules.startup_profiler import StartupProfiler
+
+def build_parser() -> argparse.ArgumentParser:
+    """Uygulama seçenekleri; tanınmayan argümanlar Qt'ye bırakılır"""
+    parser = argparse.ArgumentParser(description="Humbaba yer istasyonu arayüzü")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Açılış aşamalarının sürelerini yazdırır")
+    parser.add_argument("--journal", default=None, metavar="DİZİN",
+                        help="Alınan ham baytları çökme sonrası kurtarma için bu dizindeki günlüğe yazar")
+    return parser
 
 
 def create_splash_screen():
     """Splash screen oluşturur"""
+    from PyQt5.QtGui import QPixmap
+    from PyQt5.QtWidgets import QSplashScreen
+    from PyQt5.QtCore import Qt
+    
     try:
         logo = QPixmap("assets/images/LOGO.PNG")
         splash = QSplashScreen(logo)
@@ -30,27 +37,50 @@ def create_splash_screen():
 
 def main():
     """Ana uygulama fonksiyonu"""
-    app = QApplication(sys.argv)
+    args, qt_args = build_parser().parse_known_args()
+    profiler = StartupProfiler(enabled=args.profile_startup)
+    argv = sys.argv[:1] + qt_args
+    
+    with profiler.phase("Qt importları"):
+        from PyQt5.QtCore import QUrl, QTimer
+        from PyQt5.QtWidgets import QApplication
+        from PyQt5.QtQml import QQmlApplicationEngine
+    
+    with profiler.phase("QApplication"):
+        app = QApplication(argv)
     
     # Splash screen göster
-    splash = create_splash_screen()
-    if splash:
-        splash.show()
-        app.processEvents()
+    with profiler.phase("splash screen"):
+        splash = create_splash_screen()
+        if splash:
+            splash.show()
+            app.processEvents()
+    
+    # Modülleri import et (ses ve veritabanı işleri ilk kullanıma/arka plana ertelenir)
+    with profiler.phase("modül importları"):
+        from modules.ui_bridge import TelemetryBridge, SpeechHelper, LogManager
     
     # QML engine oluştur
-    engine = QQmlApplicationEngine()
+    with profiler.phase("QML engine"):
+        engine = QQmlApplicationEngine()
     
     # Modül nesnelerini oluştur
-    telemetry_bridge = TelemetryBridge()
-    speech_helper = SpeechHelper()
-    log_manager = LogManager()
+    with profiler.phase("köprü nesneleri"):
+        telemetry_bridge = TelemetryBridge(journal_dir=args.journal)
+        speech_helper = SpeechHelper()
+        # Geçmiş ekranı canlı hatla aynı DatabaseManager'ı ve günlük dizinini kullanır
+        log_manager = LogManager(telemetry_bridge.database_manager, args.journal)
+    
+    # Kapanışta bekleyen telemetri kayıtlarını diske yaz
+    app.aboutToQuit.connect(log_manager.shutdown)
+    app.aboutToQuit.connect(telemetry_bridge.shutdown)
     
     # QML context'e nesneleri ekle
-    context = engine.rootContext()
-    context.setContextProperty("telemetryBridge", telemetry_bridge)
-    context.setContextProperty("speechHelper", speech_helper)
-    context.setContextProperty("logManager", log_manager)
+    with profiler.phase("context ayarı"):
+        context = engine.rootContext()
+        context.setContextProperty("telemetryBridge", telemetry_bridge)
+        context.setContextProperty("speechHelper", speech_helper)
+        context.setContextProperty("logManager", log_manager)
     
     # QML dosyasını yükle
     qml_file = "src/ui/Main.qml"
@@ -58,7 +88,8 @@ def main():
         print(f"QML dosyası bulunamadı: {qml_file}")
         return -1
     
-    engine.load(QUrl.fromLocalFile(qml_file))
+    with profiler.phase("QML yükleme"):
+        engine.load(QUrl.fromLocalFile(qml_file))
     
     # QML yüklenemediyse hata ver
     if not engine.rootObjects():
@@ -69,6 +100,14 @@ def main():
     if splash:
         splash.finish(None)
     
+    if profiler.enabled:
+        def report():
+            profiler.mark("ilk olay döngüsü")
+            print(profiler.report(), flush=True)
+            if not log_manager.database_manager.wait_ready(0):
+                print("  (veritabanı hâlâ arka planda hazırlanıyor)", flush=True)
+        QTimer.singleShot(0, report)
+    
     # Uygulamayı başlat
     return app.exec_()
 
@@ -0,0 +1,105 @@
+"""
+Humbaba Yer İstasyonu - Veritabanı Bakımı
+Tamamlanmış uçuşları sıkıştırılmış arşive taşır, saklama politikası uygular ve dosyayı küçültür
+
+Kullanım:
+    python src/maintain_db.py --stats
+    python src/maintain_db.py --compact 3 --compact 4 --vacuum
+    python src/maintain_db.py --archive-after 7 --delete-after 180 --keep-flights 50
+"""
+
+import argparse
+import os
+import sys
+
+from modules.database_manager import DatabaseManager
+
+
+def print_storage(database_manager: DatabaseManager):
+    """Depolama özetini yazdırır"""
+    stats = database_manager.get_storage_stats()
+    if not stats:
+        return
+    archived = stats['archived_samples']
+    per_sample = stats['archived_bytes'] / archived if archived else 0.0
+    print(
+        f"Dosya: {stats['file_bytes'] / 1048576:.1f} MB (WAL {stats['wal_bytes'] / 1048576:.1f} MB, "
+        f"boş {stats['free_bytes'] / 1048576:.1f} MB, vacuum: {stats['auto_vacuum']})\n"
+        f"Ham örnek: {stats['raw_samples']}  arşivlenmiş: {archived} örnek / "
+        f"{stats['archived_flights']} uçuş ({per_sample:.1f} bayt/örnek)",
+        flush=True
+    )
+
+
+def print_compaction(result: dict):
+    """Arşivleme sonucunu yazdırır"""
+    print(
+        f"Uçuş {result['flight_id']}: {result['samples']} örnek, {result['blocks']} blok, "
+        f"{result['bytes'] / 1024:.1f} KB ({result['bytes_per_sample']:.1f} bayt/örnek), "
+        f"{result['seconds']:.2f} s",
+        flush=True
+    )
+
+
+def main() -> int:
+    """Bakım ana fonksiyonu"""
+    parser = argparse.ArgumentParser(description="Humbaba veritabanı bakımı")
+    parser.add_argument("--db", default="flight_logs.db", help="Veritabanı dosyası")
+    parser.add_argument("--stats", action="store_true", help="Depolama özetini yazdırır")
+    parser.add_argument("--compact", type=int, action="append", default=[], metavar="UÇUŞ_ID",
+                        help="Uçuşu sıkıştırılmış arşive taşır; birden fazla verilebilir")
+    parser.add_argument("--compact-all", action="store_true",
+                        help="Arşivlenmemiş tüm tamamlanmış uçuşları arşive taşır")
+    parser.add_argument("--archive-after", type=float, default=None, metavar="GÜN",
+                        help="Bitişinden bu yana GÜN geçen uçuşları arşive taşır")
+    parser.add_argument("--delete-after", type=float, default=None, metavar="GÜN",
+                        help="Bitişinden bu yana GÜN geçen uçuşları siler")
+    parser.add_argument("--keep-flights", type=int, default=None, metavar="N",
+                        help="En yeni N tamamlanmış uçuş dışındakileri siler")
+    parser.add_argument("--vacuum", action="store_true",
+                        help="Boş sayfaları dosyadan geri verir")
+    args = parser.parse_args()
+    if not os.path.exists(args.db):
+        parser.error(f"Veritabanı bulunamadı: {args.db}")
+
+    database_manager = DatabaseManager(args.db, write_behind=False, live_buffer_capacity=0)
+    failed = False
+    try:
+        if args.compact_all:
+            args.archive_after = 0.0 if args.archive_after is None else args.archive_after
+        for flight_id in args.compact:
+            result = database_manager.compact_flight(flight_id)
+            if result:
+                print_compaction(result)
+            else:
+                failed = True
+
+        if (args.archive_after is not None or args.delete_after is not None
+                or args.keep_flights is not None):
+            result = database_manager.apply_retention(
+                args.archive_after, args.delete_after, args.keep_flights, vacuum=False
+            )
+            if not result:
+                failed = True
+            else:
+                print(f"Arşivlenen uçuşlar: {result['archived'] or '-'}  "
+                      f"silinen uçuşlar: {result['deleted'] or '-'}", flush=True)
+
+        if args.vacuum:
+            result = database_manager.vacuum()
+            if result:
+                print(f"Vacuum ({result['mode']}): {result['freed_bytes'] / 1048576:.1f} MB geri verildi",
+                      flush=True)
+            else:
+                failed = True
+
+        if args.stats or not (args.compact or args.vacuum or args.archive_after is not None
+                              or args.delete_after is not None or args.keep_flights is not None):
+            print_storage(database_manager)
+    finally:
+        database_manager.close()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
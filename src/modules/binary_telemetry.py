@@ -0,0 +1,119 @@
+"""
+İkili Telemetri Modülü
+Roketten gelen sabit düzenli ikili telemetri çerçevelerinin kodlanması ve çözülmesi
+"""
+
+import struct
+from typing import Any, Dict, List
+
+
+# Çerçeve düzeni (little-endian):
+#   senkron (2) | sayaç uint16 | irtifa, gps_irtifa f32 | enlem, boylam f64 |
+#   hiz, ivme_x/y/z, jiroskop_x/y/z, aci f32 | durum uint8 | sağlama uint8
+SYNC_WORD = b'\xA5\x5A'
+FRAME = struct.Struct('<2sHffdd8fBB')
+FRAME_SIZE = FRAME.size
+
+FRAME_FIELDS = (
+    'irtifa', 'gps_irtifa', 'enlem', 'boylam', 'hiz',
+    'ivme_x', 'ivme_y', 'ivme_z',
+    'jiroskop_x', 'jiroskop_y', 'jiroskop_z',
+    'aci', 'durum'
+)
+
+
+def checksum(payload) -> int:
+    """Senkron ile sağlama baytı arasındaki baytların 8 bitlik toplamı"""
+    return sum(payload) & 0xFF
+
+
+def encode_frame(data: Dict[str, Any], counter: int) -> bytes:
+    """Telemetri sözlüğünü ikili çerçeveye kodlar (simülasyon ve testler için)"""
+    buffer = bytearray(FRAME_SIZE)
+    FRAME.pack_into(
+        buffer, 0, SYNC_WORD, counter & 0xFFFF,
+        *(float(data.get(name, 0.0)) for name in FRAME_FIELDS[:-1]),
+        int(data.get('durum', 0)) & 0xFF, 0
+    )
+    buffer[-1] = checksum(memoryview(buffer)[2:-1])
+    return bytes(buffer)
+
+
+class BinaryFrameDecoder:
+    """
+    Akış halindeki baytlardan ikili telemetri çerçevelerini çözer.
+    Tampon yeniden kullanılır; yarım kalan çerçeve sonraki okumaya taşınır.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._last_counter = None
+        self.frame_count = 0
+        self.checksum_errors = 0
+        self.skipped_bytes = 0
+        self.lost_frames = 0
+
+    def reset(self):
+        """Tamponu ve sayaç takibini sıfırlar"""
+        self._buffer.clear()
+        self._last_counter = None
+
+    def feed(self, data: bytes) -> List[Dict[str, Any]]:
+        """Yeni baytları ekler ve tamamlanan çerçeveleri tipli sözlükler olarak döndürür"""
+        buffer = self._buffer
+        buffer += data
+        end = len(buffer)
+        samples = []
+        pos = 0
+
+        view = memoryview(buffer)
+        try:
+            while True:
+                index = buffer.find(SYNC_WORD, pos)
+                if index < 0:
+                    # Son bayt bir senkron kelimesinin ilk yarısı olabilir
+                    keep = end - 1 if end and buffer[-1] == SYNC_WORD[0] else end
+                    self.skipped_bytes += max(0, keep - pos)
+                    pos = max(pos, keep)
+                    break
+
+                self.skipped_bytes += index - pos
+                frame_end = index + FRAME_SIZE
+                if frame_end > end:
+                    pos = index
+                    break
+
+                if checksum(view[index + 2:frame_end - 1]) != buffer[frame_end - 1]:
+                    # Bozuk çerçeve: bir sonraki senkron adayından yeniden eşitlen
+                    self.checksum_errors += 1
+                    self.skipped_bytes += 1
+                    pos = index + 1
+                    continue
+
+                values = FRAME.unpack_from(buffer, index)
+                samples.append(dict(zip(FRAME_FIELDS, values[2:-1])))
+                self._track_counter(values[1])
+                pos = frame_end
+        finally:
+            view.release()
+
+        del buffer[:pos]
+        return samples
+
+    def _track_counter(self, counter: int):
+        """Çerçeve sayacındaki boşluklardan kayıp çerçeve sayısını çıkarır"""
+        self.frame_count += 1
+        if self._last_counter is not None:
+            gap = (counter - self._last_counter - 1) & 0xFFFF
+            if gap < 0x8000:
+                self.lost_frames += gap
+        self._last_counter = counter
+
+    def stats(self) -> Dict[str, int]:
+        """Çözücü sayaçlarını döndürür"""
+        return {
+            'frames': self.frame_count,
+            'checksum_errors': self.checksum_errors,
+            'skipped_bytes': self.skipped_bytes,
+            'lost_frames': self.lost_frames
+        }
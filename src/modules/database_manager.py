@@ -3,60 +3,392 @@ Veritabanı Yönetimi Modülü
 SQLite veritabanı işlemleri ve uçuş logları
 """
 
+import os
 import sqlite3
 import json
+import time
+import atexit
 import datetime
-from typing import List, Dict, Any, Optional
-from PyQt5.QtCore import QObject, pyqtSignal
+import functools
+import itertools
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Iterator, Optional, Sequence, Tuple, TYPE_CHECKING
 
+from .signals import Signal
+from .telemetry_writer import TelemetryWriter
+from .flight_statistics import FlightStatistics, GeoBounds, build_summary
+from .downsampling import MinMaxPyramid, bucket_size, buckets_to_points, lttb, min_max_decimate
+from .flight_archive import LOG_CHANNELS, ArchiveReader, archive_flight, create_block_table
+from .flight_track import (
+    Bounds, LiveTrack, Vertex, bounds_intersect, clip_track, create_track_table,
+    simplify_track, tolerance_level, valid_position
+)
+from .query_service import ReadConnectionPool
+from .telemetry_schema import (
+    COLUMN_DEFINITIONS, COLUMN_LIST, EXTRA_COLUMN, FIELD_NAMES, INSERT_SQL,
+    LOG_SELECT_COLUMNS, channel_expression, insert_params, row_to_log, split_sample
+)
 
-class DatabaseManager(QObject):
-    """Veritabanı yönetimi sınıfı"""
+if TYPE_CHECKING:
+    from .ring_buffer import TelemetryRingBuffer
+
+
+# PRAGMA user_version ile tutulan şema sürümü
+SCHEMA_VERSION = 8
+
+# iter_logs için varsayılan sayfa boyutu
+DEFAULT_PAGE_SIZE = 500
+
+# iter_columns için varsayılan blok boyutu
+DEFAULT_CHUNK_SIZE = 5000
+
+# Uçuş listesiyle birlikte döndürülen, flight_summaries'te tutulan özet sütunları
+SUMMARY_COLUMNS = (
+    'sample_count', 'duration', 'max_altitude', 'max_speed',
+    'min_latitude', 'max_latitude', 'min_longitude', 'max_longitude'
+)
+
+# Aktif uçuşun özeti kayıt sürerken en fazla bu aralıkla (saniye) diske yazılır
+SUMMARY_INTERVAL = 5.0
+
+# Bellekte tutulan en fazla (uçuş, rota düzeyi) köşe listesi
+TRACK_CACHE_SIZE = 32
+
+# Konum yokken gönderilen 0, 0 sınırlayıcı kutuya katılmaz
+_VALID_POSITION = "enlem IS NOT NULL AND boylam IS NOT NULL AND NOT (enlem = 0 AND boylam = 0)"
+
+
+def _after_init(method):
+    """Veritabanı arka planda hazırlanırken çağrılan metodu şema hazır olana kadar bekletir"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._ready.wait()
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+class DatabaseManager:
+    """Veritabanı yönetimi sınıfı (Qt gerektirmez)"""
     
     # Sinyaller
-    log_updated = pyqtSignal()
-    flight_list_updated = pyqtSignal()
+    log_updated = Signal()
+    flight_list_updated = Signal()
     
-    def __init__(self, db_path: str = "flight_logs.db"):
-        super().__init__()
+    def __init__(self, db_path: str = "flight_logs.db", write_behind: bool = True,
+                 statistics_quantiles: Sequence[float] = (0.5, 0.95),
+                 live_buffer_capacity: int = 60000, background_init: bool = False,
+                 archive_completed: bool = False, read_connections: int = 4):
         self.db_path = db_path
         self.current_flight_id: Optional[int] = None
-        self.init_database()
+        self._sequence = itertools.count()
+        self.logged_count = 0
+        
+        # Aktif uçuşun akan istatistikleri (TelemetryBridge tarafından beslenir)
+        self.statistics_quantiles = tuple(statistics_quantiles)
+        self.live_statistics: Optional[FlightStatistics] = None
+        
+        # Aktif uçuşun son örnekleri için bellek içi halka tampon (ilk uçuşta ayrılır,
+        # kapasite 0 ise kullanılmaz ve NumPy hiç yüklenmez)
+        self.live_buffer_capacity = live_buffer_capacity
+        self.live_buffer: Optional["TelemetryRingBuffer"] = None
+        
+        # Aktif uçuşun artımlı sadeleştirilen harita rotası; tamamlanan uçuşların
+        # rotaları flight_tracks tablosunda, son okunan düzeyleri bellekte tutulur
+        self.live_track: Optional[LiveTrack] = None
+        self._track_cache: "OrderedDict[Tuple[int, int], List[Vertex]]" = OrderedDict()
+        self._track_lock = threading.Lock()
+        
+        # Arka planda çözünürlük piramidi hesaplanan uçuşlar
+        self._pyramid_builds: set = set()
+        self._pyramid_lock = threading.Lock()
+        
+        # archive_completed ile biten uçuşlar piramitten sonra sıkıştırılmış bloklara taşınır;
+        # arşivlenmiş uçuşlar okuma metodlarında ham loglar gibi görünür
+        self.archive_completed = archive_completed
+        self.archive = ArchiveReader()
+        
+        # Salt okuma metodları bağlantılarını havuzdan alır; yazıcı bağlantısı ayrıdır
+        self.readers = ReadConnectionPool(db_path, max_idle=read_connections)
+        
+        # Uçuş listesi önbelleği: flight_list_updated ile geçersiz olur. Nesil sayacı,
+        # sorgu sürerken gelen bir değişikliğin eski listeyi önbelleğe yazmasını önler.
+        self._flight_list_cache: Optional[List[Dict[str, Any]]] = None
+        self._flight_list_generation = 0
+        self._flight_list_lock = threading.Lock()
+        self.flight_list_updated.connect(self._invalidate_flight_list)
+        self._summary_stored_at = 0.0
+        
+        # Write-behind modunda kayıtlar arka plandaki yazıcı thread'inde toplu yazılır
+        self.writer: Optional[TelemetryWriter] = None
+        if write_behind:
+            self.writer = TelemetryWriter(self.db_path, on_commit=self._on_batch_committed)
+            atexit.register(self.close)
+        
+        # background_init ile şema hazırlığı/taşıma açılışı bekletmeden ayrı thread'de yapılır;
+        # veritabanına dokunan metodlar hazır olana kadar bekler
+        self._ready = threading.Event()
+        if background_init:
+            threading.Thread(target=self._initialize, daemon=True).start()
+        else:
+            self._initialize()
+    
+    def _initialize(self):
+        """Şemayı hazırlar ve yazıcı thread'ini başlatır"""
+        try:
+            self.init_database()
+            if self.writer:
+                self.writer.start()
+        finally:
+            self._ready.set()
+    
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Veritabanı hazırlığı bitene kadar bekler"""
+        return self._ready.wait(timeout)
     
     def init_database(self):
-        """Veritabanını başlatır ve tabloları oluşturur"""
+        """Veritabanını başlatır, tabloları oluşturur ve eski şemaları taşır"""
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
             
-            # Uçuşlar tablosu
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS flights (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    start_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    end_time TIMESTAMP,
-                    status TEXT DEFAULT 'active'
-                )
-            ''')
+            # Yeni veritabanlarında silinen uçuşların sayfaları vacuum() ile parça parça
+            # geri verilebilsin; tablo içeren dosyalarda etkisizdir
+            cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
             
-            # Telemetri logları tablosu
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS telemetry_logs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    flight_id INTEGER,
-                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    data TEXT,
-                    FOREIGN KEY (flight_id) REFERENCES flights (id)
-                )
-            ''')
+            # WAL kipi okuyucuların yazıcıyı beklemesini engeller
+            cursor.execute("PRAGMA journal_mode=WAL")
             
+            # Yazma kilidi baştan alınır; aynı dosyayı eşzamanlı açan başka bir
+            # yönetici taşımayı bitirene kadar bekler ve güncel sürümü okur
+            cursor.execute("BEGIN IMMEDIATE")
+            version = cursor.execute("PRAGMA user_version").fetchone()[0]
+            
+            if version == 0 and not self._table_exists(cursor, 'telemetry_logs'):
+                # Boş veritabanı: güncel şemayı doğrudan oluştur
+                self._create_schema(cursor)
+            else:
+                # Sürüm 0 ve tablo var: JSON 'data' sütunlu ilk şema
+                if version < 2:
+                    self._migrate_json_logs(cursor)
+                if version < 3:
+                    self._migrate_sequence_numbers(cursor)
+                if version < 4:
+                    self._create_summary_table(cursor)
+                if version < 5:
+                    self._create_pyramid_table(cursor)
+                if version < 6:
+                    create_block_table(cursor)
+                if version < 7:
+                    self._migrate_summary_columns(cursor)
+                if version < 8:
+                    create_track_table(cursor)
+            
+            self._create_indexes(cursor)
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
             conn.commit()
             conn.close()
             
         except Exception as e:
             print(f"Veritabanı başlatma hatası: {e}")
     
+    @staticmethod
+    def _table_exists(cursor: sqlite3.Cursor, table: str) -> bool:
+        """Tablo veritabanında var mı"""
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        )
+        return cursor.fetchone() is not None
+    
+    def _create_schema(self, cursor: sqlite3.Cursor):
+        """Güncel şemadaki tabloları oluşturur"""
+        # Uçuşlar tablosu
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS flights (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                start_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                end_time TIMESTAMP,
+                status TEXT DEFAULT 'active'
+            )
+        ''')
+        
+        self._create_telemetry_table(cursor, 'telemetry_logs')
+        self._create_summary_table(cursor)
+        self._create_pyramid_table(cursor)
+        create_block_table(cursor)
+        create_track_table(cursor)
+    
+    @staticmethod
+    def _create_telemetry_table(cursor: sqlite3.Cursor, table: str):
+        """Tipli sütunlu telemetri log tablosunu oluşturur"""
+        cursor.execute(f'''
+            CREATE TABLE IF NOT EXISTS {table} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                flight_id INTEGER,
+                sequence INTEGER,
+                capture_time REAL,
+                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                {COLUMN_DEFINITIONS},
+                {EXTRA_COLUMN} TEXT,
+                FOREIGN KEY (flight_id) REFERENCES flights (id)
+            )
+        ''')
+    
+    @staticmethod
+    def _create_summary_table(cursor: sqlite3.Cursor):
+        """
+        Uçuş özetleri tablosunu oluşturur: kayıt sürerken düzenli aralıklarla
+        güncellenir, uçuş sonunda kesinleşir.
+        """
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS flight_summaries (
+                flight_id INTEGER PRIMARY KEY,
+                sample_count INTEGER,
+                duration REAL,
+                statistics TEXT,
+                max_altitude REAL,
+                max_speed REAL,
+                min_latitude REAL,
+                max_latitude REAL,
+                min_longitude REAL,
+                max_longitude REAL,
+                FOREIGN KEY (flight_id) REFERENCES flights (id)
+            )
+        ''')
+    
+    def _migrate_summary_columns(self, cursor: sqlite3.Cursor):
+        """
+        Sürüm 6 → 7: özet tablosuna irtifa, hız ve konum kutusu sütunlarını ekler.
+        Mevcut özetler kayıtlı istatistiklerden, konum kutusu ham loglardan doldurulur
+        (arşivlenmiş uçuşlarda istatistiklerdeki enlem/boylam sınırları kullanılır).
+        """
+        cursor.execute("PRAGMA table_info(flight_summaries)")
+        existing = {row[1] for row in cursor.fetchall()}
+        for column in SUMMARY_COLUMNS[2:]:
+            if column not in existing:
+                cursor.execute(f"ALTER TABLE flight_summaries ADD COLUMN {column} REAL")
+        
+        cursor.execute('''
+            UPDATE flight_summaries SET
+                max_altitude = json_extract(statistics, '$.max_altitude'),
+                max_speed = json_extract(statistics, '$.max_speed')
+        ''')
+        bounds = ", ".join(
+            f"{column} = (SELECT {function}({field}) FROM telemetry_logs "
+            f"WHERE flight_id = flight_summaries.flight_id AND {_VALID_POSITION})"
+            for column, function, field in (
+                ('min_latitude', 'MIN', 'enlem'), ('max_latitude', 'MAX', 'enlem'),
+                ('min_longitude', 'MIN', 'boylam'), ('max_longitude', 'MAX', 'boylam')
+            )
+        )
+        cursor.execute(f"UPDATE flight_summaries SET {bounds}")
+        cursor.execute('''
+            UPDATE flight_summaries SET
+                min_latitude = json_extract(statistics, '$.fields.enlem.min'),
+                max_latitude = json_extract(statistics, '$.fields.enlem.max'),
+                min_longitude = json_extract(statistics, '$.fields.boylam.min'),
+                max_longitude = json_extract(statistics, '$.fields.boylam.max')
+            WHERE min_latitude IS NULL
+        ''')
+    
+    @staticmethod
+    def _create_pyramid_table(cursor: sqlite3.Cursor):
+        """Grafik seyreltmesi için min/max çözünürlük piramidi tablosunu oluşturur"""
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS graph_pyramid (
+                flight_id INTEGER,
+                field TEXT,
+                level INTEGER,
+                bucket INTEGER,
+                min_sequence INTEGER,
+                min_time REAL,
+                min_value REAL,
+                max_sequence INTEGER,
+                max_time REAL,
+                max_value REAL,
+                PRIMARY KEY (flight_id, field, level, bucket)
+            ) WITHOUT ROWID
+        ''')
+    
+    def _migrate_json_logs(self, cursor: sqlite3.Cursor):
+        """JSON 'data' sütunlu eski log tablosunu tipli sütunlara taşır"""
+        print("Telemetri logları tipli sütun şemasına taşınıyor...")
+        cursor.execute("ALTER TABLE telemetry_logs RENAME TO telemetry_logs_json")
+        self._create_telemetry_table(cursor, 'telemetry_logs')
+        
+        placeholders = ", ".join("?" * (len(FIELD_NAMES) + 4))
+        insert_sql = (
+            f"INSERT INTO telemetry_logs (id, flight_id, timestamp, {COLUMN_LIST}, {EXTRA_COLUMN}) "
+            f"VALUES ({placeholders})"
+        )
+        
+        read_cursor = cursor.connection.cursor()
+        read_cursor.execute(
+            "SELECT id, flight_id, timestamp, data FROM telemetry_logs_json ORDER BY id"
+        )
+        while True:
+            rows = read_cursor.fetchmany(1000)
+            if not rows:
+                break
+            converted = []
+            for row_id, flight_id, timestamp, data in rows:
+                try:
+                    sample = json.loads(data) if data else {}
+                    if not isinstance(sample, dict):
+                        sample = {'raw': sample}
+                except ValueError:
+                    sample = {'raw': data}
+                values, extra = split_sample(sample)
+                converted.append((row_id, flight_id, timestamp, *values, extra))
+            cursor.executemany(insert_sql, converted)
+        
+        cursor.execute("DROP TABLE telemetry_logs_json")
+    
+    def _migrate_sequence_numbers(self, cursor: sqlite3.Cursor):
+        """Mevcut loglara uçuş içi sıra numarası ve yakalama zamanı ekler"""
+        cursor.execute("PRAGMA table_info(telemetry_logs)")
+        columns = {row[1] for row in cursor.fetchall()}
+        for name, sql_type in (('sequence', 'INTEGER'), ('capture_time', 'REAL')):
+            if name not in columns:
+                cursor.execute(f"ALTER TABLE telemetry_logs ADD COLUMN {name} {sql_type}")
+        
+        # Eski kayıtlarda sıra, ekleme sırasıdır; zaman saniye çözünürlüğündeki timestamp'ten gelir
+        cursor.execute(
+            "UPDATE telemetry_logs SET capture_time = CAST(strftime('%s', timestamp) AS REAL) "
+            "WHERE capture_time IS NULL"
+        )
+        read_cursor = cursor.connection.cursor()
+        read_cursor.execute(
+            "SELECT id, flight_id FROM telemetry_logs WHERE sequence IS NULL ORDER BY flight_id, id"
+        )
+        last_flight = None
+        sequence = 0
+        while True:
+            rows = read_cursor.fetchmany(1000)
+            if not rows:
+                break
+            updates = []
+            for row_id, flight_id in rows:
+                if flight_id != last_flight:
+                    last_flight = flight_id
+                    sequence = 0
+                updates.append((sequence, row_id))
+                sequence += 1
+            cursor.executemany("UPDATE telemetry_logs SET sequence = ? WHERE id = ?", updates)
+    
+    @staticmethod
+    def _create_indexes(cursor: sqlite3.Cursor):
+        """Uçuş içi aralık sorguları ve uçuş listesi sıralaması için indeksleri oluşturur"""
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_telemetry_flight_sequence "
+            "ON telemetry_logs (flight_id, sequence)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_flights_start_time ON flights (start_time)"
+        )
+    
+    @_after_init
     def start_flight(self, flight_name: str) -> int:
         """Yeni bir uçuş başlatır"""
         try:
@@ -70,6 +402,16 @@ class DatabaseManager(QObject):
             
             flight_id = cursor.lastrowid
             self.current_flight_id = flight_id
+            self._sequence = itertools.count()
+            self.logged_count = 0
+            self.live_statistics = FlightStatistics(quantiles=self.statistics_quantiles)
+            self._summary_stored_at = time.monotonic()
+            self.live_track = LiveTrack()
+            if self.live_buffer is not None:
+                self.live_buffer.clear()
+            elif self.live_buffer_capacity > 0:
+                from .ring_buffer import TelemetryRingBuffer
+                self.live_buffer = TelemetryRingBuffer(self.live_buffer_capacity)
             
             conn.commit()
             conn.close()
@@ -81,8 +423,25 @@ class DatabaseManager(QObject):
             print(f"Uçuş başlatma hatası: {e}")
             return -1
     
-    def end_flight(self, flight_id: int) -> bool:
-        """Uçuşu sonlandırır"""
+    @_after_init
+    def end_flight(self, flight_id: int, archive: Optional[bool] = None) -> bool:
+        """
+        Uçuşu sonlandırır.
+        archive (varsayılan: archive_completed) açıksa uçuş piramidi hesaplandıktan
+        sonra arka planda sıkıştırılmış bloklara taşınır.
+        """
+        # Uçuş kapanmadan önce bekleyen tüm örnekler yazılmalı
+        self.flush()
+        
+        # Aktif uçuşun özeti biriktiriciden, diğerleri loglardan çıkarılır. Yük altında
+        # yalnızca kaydedilip biriktiriciye girmeyen örnekler varsa özet loglardan hesaplanır.
+        live_statistics = self.live_statistics
+        if (flight_id == self.current_flight_id and live_statistics
+                and live_statistics.sample_count == self.logged_count):
+            summary = live_statistics.summary()
+        else:
+            summary = self._compute_flight_statistics(flight_id)
+        
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
@@ -92,65 +451,209 @@ class DatabaseManager(QObject):
                 (datetime.datetime.now(), flight_id)
             )
             
+            if summary:
+                self._store_summary(cursor, flight_id, summary)
+            
             if flight_id == self.current_flight_id:
                 self.current_flight_id = None
+                self.live_statistics = None
+                self.live_track = None
             
             conn.commit()
             conn.close()
             
             self.flight_list_updated.emit()
+            self._schedule_pyramid_build(
+                flight_id, self.archive_completed if archive is None else archive
+            )
             return True
             
         except Exception as e:
             print(f"Uçuş sonlandırma hatası: {e}")
             return False
     
-    def get_flight_list(self) -> List[Dict[str, Any]]:
-        """Tüm uçuşları listeler"""
+    @staticmethod
+    def _store_summary(cursor: sqlite3.Cursor, flight_id: int, summary: Dict[str, Any]):
+        """Uçuş özetini ve liste sütunlarını yazar (varsa değiştirir)"""
+        bounds = summary.get('bounds') or {}
+        cursor.execute(
+            f"INSERT OR REPLACE INTO flight_summaries (flight_id, statistics, {', '.join(SUMMARY_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * (len(SUMMARY_COLUMNS) + 2))})",
+            (flight_id, json.dumps(summary), summary['total_logs'], summary['duration'],
+             summary['max_altitude'], summary['max_speed'], bounds.get('min_latitude'),
+             bounds.get('max_latitude'), bounds.get('min_longitude'), bounds.get('max_longitude'))
+        )
+    
+    def _store_live_summary(self, force: bool = False):
+        """
+        Aktif uçuşun akan özetini en fazla SUMMARY_INTERVAL aralıkla diske yazar;
+        böylece çökmeden sonra da uçuş listesinde güncel bir özet bulunur.
+        """
+        flight_id = self.current_flight_id
+        live_statistics = self.live_statistics
+        now = time.monotonic()
+        if (not flight_id or not live_statistics
+                or (not force and now - self._summary_stored_at < SUMMARY_INTERVAL)):
+            return
+        self._summary_stored_at = now
+        summary = live_statistics.summary()
+        if not summary:
+            return
         try:
             conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT id, name, start_time, end_time, status
-                FROM flights
-                ORDER BY start_time DESC
-            ''')
-            
-            flights = []
-            for row in cursor.fetchall():
-                flights.append({
-                    'id': row[0],
-                    'name': row[1],
-                    'start_time': row[2],
-                    'end_time': row[3],
-                    'status': row[4]
-                })
-            
+            self._store_summary(conn.cursor(), flight_id, summary)
+            conn.commit()
             conn.close()
-            return flights
+        except Exception as e:
+            print(f"Uçuş özeti kaydetme hatası: {e}")
+    
+    @_after_init
+    def get_flight_list(self, offset: int = 0, limit: int = 0) -> List[Dict[str, Any]]:
+        """
+        Uçuşları en yeniden eskiye, özet sütunlarıyla listeler.
+        Liste bellekte tutulur ve flight_list_updated ile yenilenir; limit > 0 ise
+        yalnızca [offset, offset + limit) sayfası döner. Aktif uçuşun özeti akan
+        istatistiklerden güncellenir.
+        """
+        flights = self._flight_list_cache
+        if flights is None:
+            flights = self._load_flight_list()
+        page = flights[offset:offset + limit] if limit > 0 else flights[offset:]
+        page = [dict(flight) for flight in page]
+        
+        flight_id = self.current_flight_id
+        live_statistics = self.live_statistics
+        if flight_id and live_statistics:
+            for flight in page:
+                if flight['id'] == flight_id:
+                    flight.update(self._summary_fields(live_statistics.summary()))
+                    break
+        return page
+    
+    @_after_init
+    def get_flight_count(self) -> int:
+        """Kayıtlı uçuş sayısı (önbellekteki listeden)"""
+        flights = self._flight_list_cache
+        if flights is None:
+            flights = self._load_flight_list()
+        return len(flights)
+    
+    def _invalidate_flight_list(self):
+        """Uçuş listesi değiştiğinde önbelleği geçersiz kılar"""
+        with self._flight_list_lock:
+            self._flight_list_generation += 1
+            self._flight_list_cache = None
+    
+    def _load_flight_list(self) -> List[Dict[str, Any]]:
+        """Uçuş listesini özet tablosuyla birlikte okur ve önbelleğe alır"""
+        generation = self._flight_list_generation
+        try:
+            with self.readers.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute(f'''
+                    SELECT flights.id, flights.name, flights.start_time, flights.end_time,
+                           flights.status,
+                           EXISTS (SELECT 1 FROM telemetry_blocks
+                                   WHERE flight_id = flights.id AND channel = 'sequence'),
+                           {', '.join('flight_summaries.' + column for column in SUMMARY_COLUMNS)}
+                    FROM flights
+                    LEFT JOIN flight_summaries ON flight_summaries.flight_id = flights.id
+                    ORDER BY flights.start_time DESC
+                ''')
+                
+                flights = []
+                for row in cursor.fetchall():
+                    flight = {
+                        'id': row[0],
+                        'name': row[1],
+                        'start_time': row[2],
+                        'end_time': row[3],
+                        'status': row[4],
+                        'archived': bool(row[5])
+                    }
+                    flight.update(zip(SUMMARY_COLUMNS, row[6:]))
+                    flights.append(flight)
             
         except Exception as e:
             print(f"Uçuş listesi alma hatası: {e}")
             return []
+        
+        # Özet tablosundan önceki sürümlerde tamamlanmış uçuşların özeti yoktur;
+        # ilk listelemede bir kez hesaplanıp saklanır
+        missing = [
+            flight for flight in flights
+            if flight['status'] == 'completed' and flight['sample_count'] is None
+        ]
+        if missing:
+            self._backfill_summaries(missing)
+        
+        with self._flight_list_lock:
+            if generation == self._flight_list_generation:
+                self._flight_list_cache = flights
+        return flights
     
-    def log_telemetry(self, data: Dict[str, Any]) -> bool:
-        """Telemetri verisini loglar"""
-        if not self.current_flight_id:
+    def _backfill_summaries(self, flights: List[Dict[str, Any]]):
+        """Özeti olmayan uçuşların özetini loglardan hesaplar, kaydeder ve listeye işler"""
+        summaries = []
+        for flight in flights:
+            summary = self._compute_flight_statistics(flight['id'])
+            if summary:
+                flight.update(self._summary_fields(summary))
+                summaries.append((flight['id'], summary))
+        if not summaries:
+            return
+        
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            for flight_id, summary in summaries:
+                self._store_summary(cursor, flight_id, summary)
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            print(f"Uçuş özeti kaydetme hatası: {e}")
+    
+    @staticmethod
+    def _summary_fields(summary: Dict[str, Any]) -> Dict[str, Any]:
+        """İstatistik özetinden uçuş listesi özet sütunlarını çıkarır"""
+        bounds = summary.get('bounds') or {}
+        return {
+            'sample_count': summary.get('total_logs', 0),
+            'duration': summary.get('duration', 0.0),
+            'max_altitude': summary.get('max_altitude'),
+            'max_speed': summary.get('max_speed'),
+            'min_latitude': bounds.get('min_latitude'),
+            'max_latitude': bounds.get('max_latitude'),
+            'min_longitude': bounds.get('min_longitude'),
+            'max_longitude': bounds.get('max_longitude')
+        }
+    
+    def log_telemetry(self, data: Dict[str, Any], capture_time: Optional[float] = None) -> bool:
+        """Telemetri verisini uçuş içi sıra numarası ve yakalama zamanıyla loglar"""
+        flight_id = self.current_flight_id
+        if not flight_id:
             return False
+        
+        sequence = next(self._sequence)
+        self.logged_count = sequence + 1
+        if capture_time is None:
+            capture_time = time.time()
+        
+        if self.writer and self.writer.is_running():
+            self.writer.submit(flight_id, sequence, capture_time, data)
+            return True
             
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
             
-            cursor.execute(
-                "INSERT INTO telemetry_logs (flight_id, data) VALUES (?, ?)",
-                (self.current_flight_id, json.dumps(data))
-            )
+            cursor.execute(INSERT_SQL, insert_params(flight_id, sequence, capture_time, data))
             
             conn.commit()
             conn.close()
             
+            self._store_live_summary()
             self.log_updated.emit()
             return True
             
@@ -158,75 +661,892 @@ class DatabaseManager(QObject):
             print(f"Telemetri loglama hatası: {e}")
             return False
     
+    @_after_init
+    def flush(self):
+        """Yazma kuyruğundaki bekleyen kayıtları diske yazar"""
+        if self.writer:
+            self.writer.flush()
+    
+    @_after_init
+    def close(self):
+        """Bekleyen kayıtları yazar, yazıcı thread'ini durdurur ve okuma bağlantılarını kapatır"""
+        if self.writer:
+            self.writer.close()
+        self.readers.close()
+    
+    def _on_batch_committed(self, count: int):
+        """Yazıcı thread'i bir grup kaydı commit ettiğinde çağrılır"""
+        self._store_live_summary()
+        self.log_updated.emit()
+    
     def get_logs_for_flight(self, flight_id: int) -> List[Dict[str, Any]]:
-        """Belirli bir uçuşun loglarını getirir"""
+        """Belirli bir uçuşun tüm loglarını getirir (büyük uçuşlarda iter_logs tercih edilmeli)"""
+        logs = []
+        for page in self.iter_logs(flight_id):
+            logs.extend(page)
+        return logs
+    
+    @_after_init
+    def iter_logs(self, flight_id: int, start: Optional[int] = None, end: Optional[int] = None,
+                  page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Uçuş loglarını sıra numarasına göre sayfa sayfa döndürür.
+        start dahil, end hariç sıra numarası aralığıdır; None sınırsız demektir.
+        """
+        try:
+            conn = self.readers.acquire()
+        except Exception as e:
+            print(f"Log alma hatası: {e}")
+            return
+        
         try:
-            conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
-            
-            cursor.execute(
-                "SELECT timestamp, data FROM telemetry_logs WHERE flight_id = ? ORDER BY timestamp",
-                (flight_id,)
-            )
-            
-            logs = []
-            for row in cursor.fetchall():
-                logs.append({
-                    'timestamp': row[0],
-                    'data': json.loads(row[1])
-                })
-            
-            conn.close()
-            return logs
-            
+            next_sequence = start if start is not None else -1
+            inclusive = start is not None
+            while True:
+                page = self._fetch_log_page(cursor, flight_id, next_sequence, inclusive,
+                                            end, page_size)
+                if not page:
+                    break
+                yield page
+                if len(page) < page_size:
+                    break
+                next_sequence = page[-1]['sequence']
+                inclusive = False
         except Exception as e:
             print(f"Log alma hatası: {e}")
-            return []
+        finally:
+            self.readers.release(conn)
     
-    def get_flight_statistics(self, flight_id: int) -> Dict[str, Any]:
-        """Uçuş istatistiklerini hesaplar"""
-        logs = self.get_logs_for_flight(flight_id)
+    @_after_init
+    def get_logs_page(self, flight_id: int, after: int = -1,
+                      page_size: int = DEFAULT_PAGE_SIZE) -> Dict[str, Any]:
+        """
+        Tek bir log sayfası döndürür.
+        'next_cursor' sonraki çağrıda 'after' olarak verilir; -1 ise sayfa kalmamıştır.
+        """
+        try:
+            with self.readers.connection() as conn:
+                logs = self._fetch_log_page(conn.cursor(), flight_id, after, False, None, page_size)
+        except Exception as e:
+            print(f"Log sayfası alma hatası: {e}")
+            logs = []
         
-        if not logs:
-            return {}
+        next_cursor = logs[-1]['sequence'] if len(logs) == page_size else -1
+        return {'logs': logs, 'next_cursor': next_cursor}
+    
+    def _fetch_log_page(self, cursor: sqlite3.Cursor, flight_id: int, from_sequence: int,
+                        inclusive: bool, end: Optional[int], limit: int) -> List[Dict[str, Any]]:
+        """
+        (flight_id, sequence) indeksini kullanarak bir log sayfası okur.
+        Ham satır yoksa sayfa arşiv bloklarından kurulur.
+        """
+        query = (
+            f"SELECT {LOG_SELECT_COLUMNS} FROM telemetry_logs "
+            f"WHERE flight_id = ? AND sequence {'>=' if inclusive else '>'} ?"
+        )
+        params: List[Any] = [flight_id, from_sequence]
+        if end is not None:
+            query += " AND sequence < ?"
+            params.append(end)
+        query += " ORDER BY sequence LIMIT ?"
+        params.append(limit)
         
-        # İstatistikleri hesapla
-        altitudes = [log['data'].get('irtifa', 0) for log in logs]
-        speeds = [log['data'].get('hiz', 0) for log in logs]
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+        if not rows:
+            sequences, capture_times, columns = self.archive.read(
+                cursor, flight_id, LOG_CHANNELS,
+                after=from_sequence - 1 if inclusive else from_sequence, end=end, limit=limit
+            )
+            rows = zip(sequences, capture_times, *columns)
+        return [row_to_log(row) for row in rows]
+    
+    @_after_init
+    def get_flight_bounds(self, flight_id: int) -> Optional[Dict[str, Any]]:
+        """Uçuşun ilk/son sıra numarası ve yakalama zamanı; log yoksa None"""
+        try:
+            with self.readers.connection() as conn:
+                cursor = conn.cursor()
+                bounds = []
+                for order in ("ASC", "DESC"):
+                    cursor.execute(
+                        "SELECT sequence, capture_time FROM telemetry_logs WHERE flight_id = ? "
+                        f"ORDER BY sequence {order} LIMIT 1",
+                        (flight_id,)
+                    )
+                    bounds.append(cursor.fetchone())
+        except Exception as e:
+            print(f"Uçuş sınırları alma hatası: {e}")
+            return None
         
+        first, last = bounds
+        if first is None:
+            try:
+                with self.readers.connection() as conn:
+                    return self.archive.bounds(conn.cursor(), flight_id)
+            except Exception as e:
+                print(f"Uçuş sınırları alma hatası: {e}")
+                return None
         return {
-            'total_logs': len(logs),
-            'max_altitude': max(altitudes) if altitudes else 0,
-            'min_altitude': min(altitudes) if altitudes else 0,
-            'avg_altitude': sum(altitudes) / len(altitudes) if altitudes else 0,
-            'max_speed': max(speeds) if speeds else 0,
-            'avg_speed': sum(speeds) / len(speeds) if speeds else 0,
-            'duration': len(logs)  # Basit süre hesaplama
+            'first_sequence': first[0],
+            'last_sequence': last[0],
+            'first_time': first[1],
+            'last_time': last[1]
         }
     
+    @_after_init
+    def iter_columns(self, flight_id: int, channels: Sequence[str],
+                     start: Optional[int] = None, end: Optional[int] = None,
+                     start_time: Optional[float] = None, end_time: Optional[float] = None,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE
+                     ) -> Iterator[Tuple[List[int], List[float], List[Tuple[Any, ...]]]]:
+        """
+        Seçilen kanalları sıra numarasına göre sütun blokları halinde döndürür:
+        (sıra numaraları, yakalama zamanları, kanal başına değer demetleri).
+        start/end sıra numarası, start_time/end_time yakalama zamanı aralığıdır
+        (başlangıç dahil, bitiş hariç). Tipli sütunu olmayan kanallar taşma
+        sütunundan okunur; tipli kanalların sütuna uymayan değerleri de sayıya
+        çevrilerek taşma sütunundan alınır. Eksik değerler None'dır. Arşivlenmiş uçuşlar bloklardan okunur.
+        """
+        expressions = []
+        params: List[Any] = []
+        for channel in channels:
+            if channel in FIELD_NAMES:
+                expressions.append(channel_expression(channel))
+            else:
+                expressions.append(f"json_extract({EXTRA_COLUMN}, ?)")
+                params.append(f'$."{channel}"')
+        
+        query = (
+            f"SELECT sequence, capture_time{''.join(', ' + e for e in expressions)} "
+            "FROM telemetry_logs WHERE flight_id = ? AND sequence > ?"
+        )
+        filters: List[Any] = []
+        if end is not None:
+            query += " AND sequence < ?"
+            filters.append(end)
+        if start_time is not None:
+            query += " AND capture_time >= ?"
+            filters.append(start_time)
+        if end_time is not None:
+            query += " AND capture_time < ?"
+            filters.append(end_time)
+        query += " ORDER BY sequence LIMIT ?"
+        
+        try:
+            conn = self.readers.acquire()
+        except Exception as e:
+            print(f"Kanal okuma hatası: {e}")
+            return
+        
+        try:
+            cursor = conn.cursor()
+            after = start - 1 if start is not None else -1
+            archived = False
+            while True:
+                if not archived:
+                    cursor.execute(query, (*params, flight_id, after, *filters, chunk_size))
+                    rows = cursor.fetchall()
+                    if rows:
+                        columns = list(zip(*rows))
+                        sequences, capture_times, values = list(columns[0]), list(columns[1]), columns[2:]
+                    else:
+                        # Ham satır kalmadı: uçuş arşivlenmişse (okuma sırasında arşivlenmiş
+                        # olabilir) kalan kısım bloklardan devam eder
+                        archived = True
+                if archived:
+                    sequences, capture_times, values = self.archive.read(
+                        cursor, flight_id, channels, after, end, start_time, end_time, chunk_size
+                    )
+                    if not sequences:
+                        break
+                yield sequences, capture_times, values
+                if len(sequences) < chunk_size:
+                    break
+                after = sequences[-1]
+        except Exception as e:
+            print(f"Kanal okuma hatası: {e}")
+        finally:
+            self.readers.release(conn)
+    
+    @_after_init
+    def get_flight_statistics(self, flight_id: int) -> Dict[str, Any]:
+        """
+        Uçuş istatistiklerini döndürür.
+        Aktif uçuş için akan biriktirici, tamamlanmış uçuşlar için kayıtlı özet kullanılır.
+        """
+        live_statistics = self.live_statistics
+        if flight_id == self.current_flight_id and live_statistics:
+            return live_statistics.summary()
+        
+        try:
+            with self.readers.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT statistics FROM flight_summaries WHERE flight_id = ?", (flight_id,)
+                )
+                row = cursor.fetchone()
+            if row and row[0]:
+                return json.loads(row[0])
+        except Exception as e:
+            print(f"Uçuş özeti alma hatası: {e}")
+        
+        return self._compute_flight_statistics(flight_id)
+    
+    def _compute_flight_statistics(self, flight_id: int) -> Dict[str, Any]:
+        """Özeti olmayan uçuşlar için istatistikleri SQLite içinde hesaplar"""
+        aggregates = ", ".join(
+            f"COUNT({name}), MIN({name}), MAX({name}), AVG({name}), AVG({name} * {name})"
+            for name in FIELD_NAMES
+        )
+        # Sütuna uymayıp taşma sütununa yazılmış değerler de hesaba katılır
+        typed_columns = ", ".join(f"{channel_expression(name)} AS {name}" for name in FIELD_NAMES)
+        try:
+            with self.readers.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"SELECT COUNT(*), MIN(capture_time), MAX(capture_time), {aggregates}, "
+                    f"MIN(CASE WHEN {_VALID_POSITION} THEN enlem END), "
+                    f"MAX(CASE WHEN {_VALID_POSITION} THEN enlem END), "
+                    f"MIN(CASE WHEN {_VALID_POSITION} THEN boylam END), "
+                    f"MAX(CASE WHEN {_VALID_POSITION} THEN boylam END) "
+                    f"FROM (SELECT capture_time, {typed_columns} "
+                    "FROM telemetry_logs WHERE flight_id = ?)",
+                    (flight_id,)
+                )
+                row = cursor.fetchone()
+            
+        except Exception as e:
+            print(f"İstatistik hesaplama hatası: {e}")
+            return {}
+        
+        if not row or not row[0]:
+            return self._compute_archived_statistics(flight_id)
+        
+        bounds = None
+        position = 3 + len(FIELD_NAMES) * 5
+        if row[position] is not None:
+            bounds = dict(zip(('min_latitude', 'max_latitude', 'min_longitude', 'max_longitude'),
+                              row[position:position + 4]))
+        return self._build_statistics(row[0], row[1], row[2], [
+            row[3 + i * 5: 8 + i * 5] for i in range(len(FIELD_NAMES))
+        ], bounds)
+    
+    def _compute_archived_statistics(self, flight_id: int) -> Dict[str, Any]:
+        """Arşivlenmiş uçuşun istatistiklerini bloklardan hesaplar"""
+        total = 0
+        first_time = last_time = None
+        sums = [[0, None, None, 0.0, 0.0] for _ in FIELD_NAMES]
+        bounds = GeoBounds()
+        latitude_index, longitude_index = FIELD_NAMES.index('enlem'), FIELD_NAMES.index('boylam')
+        for _, capture_times, columns in self.iter_columns(flight_id, FIELD_NAMES):
+            for latitude, longitude in zip(columns[latitude_index], columns[longitude_index]):
+                bounds.add(latitude, longitude)
+            total += len(capture_times)
+            times = [t for t in capture_times if t is not None]
+            if times:
+                low, high = min(times), max(times)
+                first_time = low if first_time is None else min(first_time, low)
+                last_time = high if last_time is None else max(last_time, high)
+            for accumulator, values in zip(sums, columns):
+                present = [value for value in values if value is not None]
+                if not present:
+                    continue
+                low, high = min(present), max(present)
+                accumulator[0] += len(present)
+                accumulator[1] = low if accumulator[1] is None else min(accumulator[1], low)
+                accumulator[2] = high if accumulator[2] is None else max(accumulator[2], high)
+                accumulator[3] += sum(present)
+                accumulator[4] += sum(value * value for value in present)
+        
+        if not total:
+            return {}
+        aggregates = [
+            (count, minimum, maximum, total_sum / count if count else None,
+             square_sum / count if count else None)
+            for count, minimum, maximum, total_sum, square_sum in sums
+        ]
+        return self._build_statistics(total, first_time, last_time, aggregates, bounds.to_dict())
+    
+    @staticmethod
+    def _build_statistics(total: int, first_time: Optional[float], last_time: Optional[float],
+                          aggregates: Sequence[Sequence[Any]],
+                          bounds: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """(sayı, min, max, ortalama, kare ortalaması) toplamlarından uçuş özetini kurar"""
+        fields = {}
+        for name, (count, minimum, maximum, mean, mean_square) in zip(FIELD_NAMES, aggregates):
+            if not count:
+                continue
+            variance = max(0.0, mean_square - mean * mean) * count / (count - 1) if count > 1 else 0.0
+            fields[name] = {
+                'count': count,
+                'min': minimum,
+                'max': maximum,
+                'avg': mean,
+                'variance': variance,
+                'std': variance ** 0.5
+            }
+        
+        duration = (last_time - first_time) if first_time is not None else 0.0
+        return build_summary(total, duration, fields, bounds)
+    
     def get_current_flight_statistics(self) -> Dict[str, Any]:
         """Mevcut uçuşun istatistiklerini getirir"""
         if self.current_flight_id:
             return self.get_flight_statistics(self.current_flight_id)
         return {}
     
-    def get_flight_data_for_graph(self, flight_id: int, field: str) -> List[Dict[str, Any]]:
-        """Grafik için uçuş verilerini getirir"""
-        logs = self.get_logs_for_flight(flight_id)
+    @_after_init
+    def get_flight_data_for_graph(self, flight_id: int, field: str, max_points: int = 0,
+                                  start: Optional[int] = None, end: Optional[int] = None,
+                                  method: str = 'lttb') -> List[Dict[str, Any]]:
+        """
+        Grafik için uçuş verilerini getirir.
+        max_points > 0 ise [start, end) sıra aralığı en fazla max_points noktaya seyreltilir
+        ('lttb' ya da 'minmax'); tamamlanmış uçuşlarda önceden hesaplanmış piramit kullanılır.
+        """
+        start = start or 0
+        points = None
+        if max_points > 0 and field in FIELD_NAMES and flight_id != self.current_flight_id:
+            points = self._read_pyramid_points(flight_id, field, max_points, start, end)
+        if points is None:
+            points = self._read_graph_points(flight_id, field, start, end)
+        if max_points > 0:
+            points = self._reduce_points(points, max_points, method)
         
         graph_data = []
-        for i, log in enumerate(logs):
-            value = log['data'].get(field, 0)
+        for sequence, capture_time, value in points:
             graph_data.append({
-                'x': i,
+                'x': sequence,
                 'y': value,
-                'timestamp': log['timestamp']
+                'timestamp': capture_time
             })
         
         return graph_data
     
-    def get_current_flight_data_for_graph(self, field: str) -> List[Dict[str, Any]]:
-        """Mevcut uçuşun grafik verilerini getirir"""
-        if self.current_flight_id:
-            return self.get_flight_data_for_graph(self.current_flight_id, field)
-        return []
+    def _read_graph_points(self, flight_id: int, field: str, start: int,
+                           end: Optional[int]) -> List[Tuple[int, float, Any]]:
+        """Ham (sequence, capture_time, value) noktalarını okur"""
+        range_clause = "flight_id = ? AND sequence >= ?"
+        params: List[Any] = [flight_id, start]
+        if end is not None:
+            range_clause += " AND sequence < ?"
+            params.append(end)
+        
+        try:
+            with self.readers.connection() as conn:
+                cursor = conn.cursor()
+                
+                if field in FIELD_NAMES:
+                    # Tipli sütun: yalnızca istenen alan okunur
+                    cursor.execute(
+                        f"SELECT sequence, capture_time, COALESCE({channel_expression(field)}, 0) "
+                        f"FROM telemetry_logs WHERE {range_clause} ORDER BY sequence",
+                        params
+                    )
+                    rows = cursor.fetchall()
+                else:
+                    # Bilinmeyen alanlar taşma sütunundan çözülür
+                    cursor.execute(
+                        f"SELECT sequence, capture_time, {EXTRA_COLUMN} FROM telemetry_logs "
+                        f"WHERE {range_clause} ORDER BY sequence",
+                        params
+                    )
+                    rows = [
+                        (sequence, capture_time, json.loads(extra).get(field, 0) if extra else 0)
+                        for sequence, capture_time, extra in cursor.fetchall()
+                    ]
+                
+                if not rows:
+                    sequences, capture_times, (values,) = self.archive.read(
+                        cursor, flight_id, (field,), after=start - 1, end=end
+                    )
+                    rows = [
+                        (sequence, capture_time, 0 if value is None else value)
+                        for sequence, capture_time, value in zip(sequences, capture_times, values)
+                    ]
+            return rows
+            
+        except Exception as e:
+            print(f"Grafik verisi alma hatası: {e}")
+            return []
+    
+    def _read_pyramid_points(self, flight_id: int, field: str, max_points: int, start: int,
+                             end: Optional[int]) -> Optional[List[Tuple[int, float, float]]]:
+        """
+        Aralığı ekrandaki nokta sayısının birkaç katı kadar kova ile karşılayan
+        en ince piramit düzeyini okur. Piramit yoksa ya da ham okuma yeterince
+        ucuzsa None döner.
+        """
+        try:
+            with self.readers.connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute(
+                    "SELECT MAX(level) FROM graph_pyramid WHERE flight_id = ? AND field = ?",
+                    (flight_id, field)
+                )
+                top_level = cursor.fetchone()[0]
+                if top_level is None:
+                    self._schedule_pyramid_build(flight_id)
+                    return None
+                
+                cursor.execute(
+                    "SELECT MAX(sequence) FROM telemetry_logs WHERE flight_id = ?", (flight_id,)
+                )
+                last_sequence = cursor.fetchone()[0]
+                if last_sequence is None:
+                    bounds = self.archive.bounds(cursor, flight_id)
+                    last_sequence = bounds['last_sequence'] if bounds else None
+                if last_sequence is None:
+                    return None
+                stop = last_sequence + 1 if end is None else min(end, last_sequence + 1)
+                total = stop - start
+                
+                # Ham okuma ekran nokta sayısının birkaç katını geçmiyorsa piramide gerek yok
+                budget = 4 * max_points
+                if total <= budget:
+                    return None
+                
+                level = 0
+                while level < top_level and 2 * total / bucket_size(level) > budget:
+                    level += 1
+                size = bucket_size(level)
+                
+                cursor.execute(
+                    "SELECT min_sequence, min_time, min_value, max_sequence, max_time, max_value "
+                    "FROM graph_pyramid WHERE flight_id = ? AND field = ? AND level = ? "
+                    "AND bucket BETWEEN ? AND ? ORDER BY bucket",
+                    (flight_id, field, level, start // size, (stop - 1) // size)
+                )
+                buckets = cursor.fetchall()
+                return buckets_to_points(buckets, start, stop)
+            
+        except Exception as e:
+            print(f"Piramit okuma hatası: {e}")
+            return None
+    
+    @staticmethod
+    def _reduce_points(points: List[Tuple[int, float, Any]], max_points: int,
+                       method: str) -> List[Tuple[int, float, Any]]:
+        """Noktaları en fazla max_points noktaya seyreltir"""
+        if len(points) <= max_points:
+            return points
+        ys = [point[2] for point in points]
+        if method == 'minmax':
+            indices = min_max_decimate(ys, max_points // 2)
+        else:
+            xs = [point[0] for point in points]
+            indices = lttb(xs, ys, max_points)
+        return [points[i] for i in indices]
+    
+    def _schedule_pyramid_build(self, flight_id: int, archive: bool = False):
+        """Tamamlanmış bir uçuşun piramidini (ve istenirse arşivini) arka planda hesaplar"""
+        if flight_id == self.current_flight_id:
+            return
+        with self._pyramid_lock:
+            if flight_id in self._pyramid_builds:
+                return
+            self._pyramid_builds.add(flight_id)
+        threading.Thread(target=self._finish_flight, args=(flight_id, archive), daemon=True).start()
+    
+    def wait_background(self, timeout: Optional[float] = None) -> bool:
+        """Arka plandaki piramit ve arşivleme işleri bitene kadar bekler"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._pyramid_builds:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+    
+    def _finish_flight(self, flight_id: int, archive: bool):
+        """Arka plan thread'i: piramidi hesaplar, ardından uçuşu arşivler"""
+        try:
+            self.build_graph_pyramid(flight_id)
+            self.build_flight_track(flight_id)
+            if archive:
+                self.compact_flight(flight_id)
+        finally:
+            with self._pyramid_lock:
+                self._pyramid_builds.discard(flight_id)
+    
+    @_after_init
+    def build_graph_pyramid(self, flight_id: int) -> bool:
+        """Uçuşun tüm tipli alanları için min/max çözünürlük piramidini hesaplar ve kaydeder"""
+        pyramids = {name: MinMaxPyramid() for name in FIELD_NAMES}
+        insert_sql = "INSERT OR REPLACE INTO graph_pyramid VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+        
+        def drain(cursor: sqlite3.Cursor):
+            rows = []
+            for name, pyramid in pyramids.items():
+                for level, bucket in pyramid.drain():
+                    rows.append((flight_id, name, level, *bucket))
+            cursor.executemany(insert_sql, rows)
+        
+        try:
+            conn = sqlite3.connect(self.db_path)
+            write_cursor = conn.cursor()
+            write_cursor.execute("DELETE FROM graph_pyramid WHERE flight_id = ?", (flight_id,))
+            
+            # Uçuş ham ya da arşivlenmiş olabilir; iter_columns ikisini de okur
+            for sequences, capture_times, columns in self.iter_columns(flight_id, FIELD_NAMES):
+                for name, values in zip(FIELD_NAMES, columns):
+                    add = pyramids[name].add
+                    for sequence, capture_time, value in zip(sequences, capture_times, values):
+                        if value is not None:
+                            add(sequence, capture_time, value)
+                drain(write_cursor)
+            
+            for pyramid in pyramids.values():
+                pyramid.finish()
+            drain(write_cursor)
+            
+            conn.commit()
+            conn.close()
+            return True
+            
+        except Exception as e:
+            print(f"Piramit hesaplama hatası: {e}")
+            return False
+    
+    @_after_init
+    def build_flight_track(self, flight_id: int) -> bool:
+        """
+        Uçuşun rotasını Douglas-Peucker ile düzeylere ayırıp flight_tracks tablosuna yazar.
+        Eksik ve 0, 0 konumlar ile art arda aynı konumlar (rampada bekleme) atlanır.
+        """
+        vertices: List[Vertex] = []
+        last = None
+        for sequences, _, (latitudes, longitudes) in self.iter_columns(flight_id, ('enlem', 'boylam')):
+            for sequence, latitude, longitude in zip(sequences, latitudes, longitudes):
+                if valid_position(latitude, longitude) and (latitude, longitude) != last:
+                    vertices.append((sequence, latitude, longitude))
+                    last = (latitude, longitude)
+        
+        rows = [(flight_id, level, *vertex) for level, vertex in simplify_track(vertices)]
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM flight_tracks WHERE flight_id = ?", (flight_id,))
+            cursor.executemany("INSERT OR REPLACE INTO flight_tracks VALUES (?, ?, ?, ?, ?)", rows)
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            print(f"Rota hesaplama hatası: {e}")
+            return False
+        
+        self._forget_track(flight_id)
+        return True
+    
+    @_after_init
+    def get_flight_track(self, flight_id: int, tolerance: float = 0.0,
+                         bounds: Optional[Bounds] = None) -> List[List[Dict[str, float]]]:
+        """
+        Uçuş rotasını harita için sadeleştirilmiş çizgi parçaları olarak döndürür.
+        tolerance (metre) genellikle ekranda bir pikselin karşılığıdır; sapması bunu
+        geçmeyen en kaba düzey seçilir. bounds (min_enlem, max_enlem, min_boylam,
+        max_boylam) verilirse yalnızca görünüme giren parçalar döner. Aktif uçuş canlı
+        rotadan, tamamlanmış uçuşlar önbellekten ya da flight_tracks tablosundan okunur.
+        """
+        level = tolerance_level(tolerance)
+        live_track = self.live_track
+        if flight_id == self.current_flight_id and live_track is not None:
+            vertices = live_track.vertices(level)
+        else:
+            vertices = self._read_track(flight_id, level)
+        return [
+            [{'latitude': latitude, 'longitude': longitude} for _, latitude, longitude in segment]
+            for segment in clip_track(vertices, bounds)
+        ]
+    
+    def _read_track(self, flight_id: int, level: int) -> List[Vertex]:
+        """
+        Düzeyin köşelerini sıra numarasına göre okur ve bellekte tutar.
+        Rotası henüz hesaplanmamış (eski ya da arka plan işi sürmekte olan) uçuşlarda
+        rota bir kereliğine burada hesaplanır.
+        """
+        key = (flight_id, level)
+        with self._track_lock:
+            vertices = self._track_cache.get(key)
+            if vertices is not None:
+                self._track_cache.move_to_end(key)
+                return vertices
+        
+        query = (
+            "SELECT sequence, latitude, longitude FROM flight_tracks "
+            "WHERE flight_id = ? AND level >= ? ORDER BY sequence"
+        )
+        try:
+            with self.readers.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, (flight_id, level))
+                vertices = cursor.fetchall()
+                built = True
+                if not vertices:
+                    cursor.execute("SELECT 1 FROM flight_tracks WHERE flight_id = ? LIMIT 1", (flight_id,))
+                    built = cursor.fetchone() is not None
+            # Rota hesaplanırken okuma bağlantısı tutulmaz
+            if not built and self.build_flight_track(flight_id):
+                with self.readers.connection() as conn:
+                    vertices = conn.execute(query, (flight_id, level)).fetchall()
+        except Exception as e:
+            print(f"Rota okuma hatası: {e}")
+            return []
+        
+        with self._track_lock:
+            self._track_cache[key] = vertices
+            while len(self._track_cache) > TRACK_CACHE_SIZE:
+                self._track_cache.popitem(last=False)
+        return vertices
+    
+    def _forget_track(self, flight_id: int):
+        """Uçuşun bellekteki rota düzeylerini bırakır"""
+        with self._track_lock:
+            for key in [key for key in self._track_cache if key[0] == flight_id]:
+                del self._track_cache[key]
+    
+    @_after_init
+    def get_flights_in_bounds(self, bounds: Bounds) -> List[Dict[str, Any]]:
+        """Konum kutusu görünümle kesişen uçuşlar (önbellekteki listenin özet sütunlarından)"""
+        flights = []
+        for flight in self.get_flight_list():
+            if flight['min_latitude'] is None or flight['min_longitude'] is None:
+                continue
+            box = (flight['min_latitude'], flight['max_latitude'],
+                   flight['min_longitude'], flight['max_longitude'])
+            if bounds_intersect(box, bounds):
+                flights.append(flight)
+        return flights
+    
+    @_after_init
+    def get_tracks_in_bounds(self, bounds: Bounds, tolerance: float = 0.0,
+                             limit: int = 0) -> List[Dict[str, Any]]:
+        """
+        Görünümdeki uçuşların rotalarını birlikte döndürür (çoklu uçuş katmanı):
+        [{'flight_id', 'name', 'segments'}], en yeni uçuş önce; limit > 0 ise en fazla limit uçuş.
+        """
+        tracks = []
+        for flight in self.get_flights_in_bounds(bounds):
+            segments = self.get_flight_track(flight['id'], tolerance, bounds)
+            if segments:
+                tracks.append({'flight_id': flight['id'], 'name': flight['name'], 'segments': segments})
+                if 0 < limit <= len(tracks):
+                    break
+        return tracks
+    
+    @_after_init
+    def compact_flight(self, flight_id: int) -> Dict[str, Any]:
+        """
+        Tamamlanmış uçuşun loglarını kanal başına sıkıştırılmış bloklara taşır ve ham
+        satırları siler. Taşıma tek transaction'dır; okuyucular uçuşu ya ham ya da
+        arşivlenmiş görür. Boşalan sayfalar vacuum() ile dosyadan geri verilir.
+        """
+        if flight_id == self.current_flight_id:
+            return {}
+        
+        started = time.monotonic()
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            samples, blocks, stored = archive_flight(cursor, flight_id)
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            print(f"Uçuş arşivleme hatası: {e}")
+            return {}
+        
+        self.archive.forget(flight_id)
+        if samples:
+            self.flight_list_updated.emit()
+        return {
+            'flight_id': flight_id,
+            'samples': samples,
+            'blocks': blocks,
+            'bytes': stored,
+            'bytes_per_sample': stored / samples if samples else 0.0,
+            'seconds': time.monotonic() - started
+        }
+    
+    @_after_init
+    def delete_flight(self, flight_id: int) -> bool:
+        """Uçuşu ve tüm log, arşiv, özet ve piramit kayıtlarını siler"""
+        if flight_id == self.current_flight_id:
+            return False
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            for table, column in (('telemetry_logs', 'flight_id'), ('telemetry_blocks', 'flight_id'),
+                                  ('graph_pyramid', 'flight_id'), ('flight_tracks', 'flight_id'),
+                                  ('flight_summaries', 'flight_id'), ('flights', 'id')):
+                cursor.execute(f"DELETE FROM {table} WHERE {column} = ?", (flight_id,))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            print(f"Uçuş silme hatası: {e}")
+            return False
+        
+        self.archive.forget(flight_id)
+        self._forget_track(flight_id)
+        self.flight_list_updated.emit()
+        return True
+    
+    @_after_init
+    def apply_retention(self, archive_after_days: Optional[float] = None,
+                        delete_after_days: Optional[float] = None,
+                        keep_flights: Optional[int] = None, vacuum: bool = True) -> Dict[str, Any]:
+        """
+        Tamamlanmış uçuşlara saklama politikasını uygular: bitişinden bu yana
+        archive_after_days gün geçenleri arşivler, delete_after_days gün geçenleri
+        ve en yeni keep_flights uçuş dışındakileri siler. Aktif uçuşlara dokunulmaz.
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT id, COALESCE(end_time, start_time),
+                       EXISTS (SELECT 1 FROM telemetry_blocks
+                               WHERE flight_id = flights.id AND channel = 'sequence')
+                FROM flights
+                WHERE status = 'completed'
+                ORDER BY start_time DESC, id DESC
+            ''')
+            flights = cursor.fetchall()
+            conn.close()
+        except Exception as e:
+            print(f"Saklama politikası hatası: {e}")
+            return {}
+        
+        now = datetime.datetime.now()
+        archived: List[int] = []
+        deleted: List[int] = []
+        for index, (flight_id, ended, is_archived) in enumerate(flights):
+            if flight_id == self.current_flight_id:
+                continue
+            try:
+                age = (now - datetime.datetime.fromisoformat(str(ended))).total_seconds() / 86400
+            except ValueError:
+                age = None
+            
+            expired = delete_after_days is not None and age is not None and age >= delete_after_days
+            if (keep_flights is not None and index >= keep_flights) or expired:
+                if self.delete_flight(flight_id):
+                    deleted.append(flight_id)
+                continue
+            if (archive_after_days is not None and not is_archived and age is not None
+                    and age >= archive_after_days):
+                if self.compact_flight(flight_id):
+                    archived.append(flight_id)
+        
+        result: Dict[str, Any] = {'archived': archived, 'deleted': deleted}
+        if vacuum and (archived or deleted):
+            result['vacuum'] = self.vacuum()
+        return result
+    
+    @_after_init
+    def vacuum(self, max_pages: int = 0) -> Dict[str, Any]:
+        """
+        Boş sayfaları dosyadan geri verir (max_pages > 0 ise en fazla o kadar sayfa).
+        Artımlı vacuum kipinde olmayan eski veritabanları bir kereliğine tam VACUUM
+        ile bu kipe çevrilir. Ardından WAL dosyası kısaltılır.
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            page_size = cursor.execute("PRAGMA page_size").fetchone()[0]
+            before = cursor.execute("PRAGMA page_count").fetchone()[0]
+            
+            full = cursor.execute("PRAGMA auto_vacuum").fetchone()[0] != 2
+            if full:
+                cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                cursor.execute("VACUUM")
+            else:
+                # execute() pragmayı tek adım çalıştırıp yalnızca bir sayfa verir;
+                # executescript sonuna kadar çalıştırır
+                conn.executescript(f"PRAGMA incremental_vacuum({max(0, int(max_pages))})")
+            cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            cursor.fetchall()
+            
+            after = cursor.execute("PRAGMA page_count").fetchone()[0]
+            free_pages = cursor.execute("PRAGMA freelist_count").fetchone()[0]
+            conn.close()
+        except Exception as e:
+            print(f"Vacuum hatası: {e}")
+            return {}
+        
+        return {
+            'mode': 'full' if full else 'incremental',
+            'freed_bytes': (before - after) * page_size,
+            'file_bytes': after * page_size,
+            'free_pages': free_pages
+        }
+    
+    @_after_init
+    def get_storage_stats(self) -> Dict[str, Any]:
+        """Dosya boyutu, boş sayfalar ve ham/arşivlenmiş örnek sayıları"""
+        try:
+            with self.readers.connection() as conn:
+                cursor = conn.cursor()
+                page_size = cursor.execute("PRAGMA page_size").fetchone()[0]
+                page_count = cursor.execute("PRAGMA page_count").fetchone()[0]
+                free_pages = cursor.execute("PRAGMA freelist_count").fetchone()[0]
+                auto_vacuum = cursor.execute("PRAGMA auto_vacuum").fetchone()[0]
+                raw_samples = cursor.execute("SELECT COUNT(*) FROM telemetry_logs").fetchone()[0]
+                cursor.execute(
+                    "SELECT COUNT(DISTINCT flight_id), SUM(count) FROM telemetry_blocks "
+                    "WHERE channel = 'sequence'"
+                )
+                archived_flights, archived_samples = cursor.fetchone()
+                archived_bytes = cursor.execute(
+                    "SELECT SUM(length(payload)) FROM telemetry_blocks"
+                ).fetchone()[0]
+        except Exception as e:
+            print(f"Depolama bilgisi alma hatası: {e}")
+            return {}
+        
+        wal_path = self.db_path + "-wal"
+        return {
+            'file_bytes': page_count * page_size,
+            'wal_bytes': os.path.getsize(wal_path) if os.path.exists(wal_path) else 0,
+            'free_bytes': free_pages * page_size,
+            'auto_vacuum': {0: 'none', 1: 'full', 2: 'incremental'}.get(auto_vacuum, str(auto_vacuum)),
+            'raw_samples': raw_samples,
+            'archived_flights': archived_flights,
+            'archived_samples': archived_samples or 0,
+            'archived_bytes': archived_bytes or 0
+        }
+    
+    def get_current_flight_data_for_graph(self, field: str, max_points: int = 0) -> List[Dict[str, Any]]:
+        """Mevcut uçuşun grafik verilerini getirir (uçuş tampona sığıyorsa diske gidilmez)"""
+        if not self.current_flight_id:
+            return []
+        live_buffer = self.live_buffer
+        if (live_buffer and field in live_buffer.fields
+                and len(live_buffer) == live_buffer.total_appended):
+            return live_buffer.graph_data(field, max_points)
+        return self.get_flight_data_for_graph(self.current_flight_id, field, max_points)
+    
+    def get_current_flight_track(self, tolerance: float = 0.0,
+                                 bounds: Optional[Bounds] = None) -> List[List[Dict[str, float]]]:
+        """Aktif uçuşun canlı rotasını görünüm için döndürür (uçuş yoksa boş)"""
+        flight_id = self.current_flight_id
+        if not flight_id:
+            return []
+        return self.get_flight_track(flight_id, tolerance, bounds)
+    
+    def get_live_window(self, field: str, seconds: Optional[float] = None,
+                        count: Optional[int] = None, max_points: int = 0) -> List[Dict[str, Any]]:
+        """Aktif uçuşun son penceresini halka tampondan grafik noktaları olarak döndürür"""
+        live_buffer = self.live_buffer
+        if not self.current_flight_id or not live_buffer or field not in live_buffer.fields:
+            return []
+        return live_buffer.graph_data(field, max_points, count, seconds)
+    
+    def get_live_window_statistics(self, field: str, seconds: Optional[float] = None,
+                                   count: Optional[int] = None) -> Dict[str, Any]:
+        """Aktif uçuşun son penceresi için istatistikleri halka tampondan hesaplar"""
+        live_buffer = self.live_buffer
+        if not self.current_flight_id or not live_buffer or field not in live_buffer.fields:
+            return {}
+        return live_buffer.statistics(field, count, seconds)
@@ -0,0 +1,153 @@
+"""
+Grafik Seyreltme Modülü
+LTTB ve min/max seyreltme ile uçuş başına çok çözünürlüklü piramit
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+
+# Piramit düzeyi: (bucket, min_sequence, min_time, min_value, max_sequence, max_time, max_value)
+Bucket = Tuple[int, int, float, float, int, float, float]
+
+PYRAMID_BASE_BUCKET = 16
+PYRAMID_FACTOR = 4
+PYRAMID_MAX_LEVELS = 8
+
+
+def bucket_size(level: int) -> int:
+    """Verilen piramit düzeyinde bir kovanın kapsadığı örnek sayısı"""
+    return PYRAMID_BASE_BUCKET * PYRAMID_FACTOR ** level
+
+
+def lttb(xs: Sequence[float], ys: Sequence[float], threshold: int) -> List[int]:
+    """
+    Largest-Triangle-Three-Buckets seyreltmesi.
+    Korunacak noktaların indekslerini döndürür (ilk ve son nokta her zaman korunur).
+    """
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    every = (n - 2) / (threshold - 2)
+    selected = [0]
+    a = 0
+
+    for i in range(threshold - 2):
+        # Sonraki kovanın ortalaması üçgenin üçüncü köşesidir
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_count = avg_end - avg_start
+        avg_x = sum(xs[avg_start:avg_end]) / avg_count
+        avg_y = sum(ys[avg_start:avg_end]) / avg_count
+
+        range_start = int(i * every) + 1
+        range_end = int((i + 1) * every) + 1
+        ax = xs[a]
+        ay = ys[a]
+
+        max_area = -1.0
+        next_a = range_start
+        for j in range(range_start, range_end):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > max_area:
+                max_area = area
+                next_a = j
+
+        selected.append(next_a)
+        a = next_a
+
+    selected.append(n - 1)
+    return selected
+
+
+def min_max_decimate(ys: Sequence[float], buckets: int) -> List[int]:
+    """
+    Her kovadan en küçük ve en büyük değeri koruyan seyreltme.
+    Korunacak noktaların indekslerini sıralı olarak döndürür.
+    """
+    n = len(ys)
+    if buckets <= 0 or n <= 2 * buckets:
+        return list(range(n))
+
+    selected = []
+    for b in range(buckets):
+        start = b * n // buckets
+        end = (b + 1) * n // buckets
+        lo = hi = start
+        for j in range(start + 1, end):
+            if ys[j] < ys[lo]:
+                lo = j
+            elif ys[j] > ys[hi]:
+                hi = j
+        selected.extend(sorted({lo, hi}))
+    return selected
+
+
+class MinMaxPyramid:
+    """
+    Akış halinde beslenen min/max çözünürlük piramidi.
+    Her düzeyde yalnızca açık kova bellekte tutulur; kapanan kovalar
+    drain() ile alınıp kalıcı depoya yazılır.
+    """
+
+    def __init__(self, max_levels: int = PYRAMID_MAX_LEVELS):
+        self.max_levels = max_levels
+        self._open: List[Optional[list]] = [None] * max_levels
+        self._completed: List[Tuple[int, Bucket]] = []
+
+    def add(self, sequence: int, capture_time: float, value: float):
+        """Sıra numarası artan yeni bir örnek ekler"""
+        self._add(0, sequence // PYRAMID_BASE_BUCKET,
+                  sequence, capture_time, value, sequence, capture_time, value)
+
+    def _add(self, level: int, bucket: int, min_seq: int, min_time: float, min_value: float,
+             max_seq: int, max_time: float, max_value: float):
+        current = self._open[level]
+        if current is not None and current[0] != bucket:
+            self._close(level)
+            current = None
+
+        if current is None:
+            self._open[level] = [bucket, min_seq, min_time, min_value, max_seq, max_time, max_value]
+            return
+
+        if min_value < current[3]:
+            current[1:4] = (min_seq, min_time, min_value)
+        if max_value > current[6]:
+            current[4:7] = (max_seq, max_time, max_value)
+
+    def _close(self, level: int):
+        current = self._open[level]
+        self._open[level] = None
+        self._completed.append((level, tuple(current)))
+        if level + 1 < self.max_levels:
+            self._add(level + 1, current[0] // PYRAMID_FACTOR, *current[1:])
+
+    def finish(self):
+        """Açık kalan tüm kovaları kapatır"""
+        for level in range(self.max_levels):
+            if self._open[level] is not None:
+                self._close(level)
+
+    def drain(self) -> List[Tuple[int, Bucket]]:
+        """Kapanan kovaları (düzey, kova) çiftleri olarak alır"""
+        completed = self._completed
+        self._completed = []
+        return completed
+
+
+def buckets_to_points(buckets: Sequence[Sequence], start: int, end: Optional[int]) -> List[Tuple[int, float, float]]:
+    """
+    Piramit kovalarını sıra numarasına göre sıralı (sequence, time, value) noktalarına açar.
+    Kova sütunları: min_sequence, min_time, min_value, max_sequence, max_time, max_value.
+    """
+    points = []
+    for min_seq, min_time, min_value, max_seq, max_time, max_value in buckets:
+        pair = [(min_seq, min_time, min_value)]
+        if max_seq != min_seq:
+            pair.append((max_seq, max_time, max_value))
+            pair.sort()
+        for point in pair:
+            if point[0] >= start and (end is None or point[0] < end):
+                points.append(point)
+    return points
@@ -0,0 +1,394 @@
+"""
+Uçuş Arşivi Modülü
+Tamamlanmış uçuşların kanal başına sıkıştırılmış bloklar halinde saklanması ve okunması
+"""
+
+import array
+import bisect
+import collections
+import itertools
+import json
+import math
+import operator
+import sqlite3
+import struct
+import sys
+import threading
+import zlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .telemetry_schema import EXTRA_COLUMN, FIELD_NAMES, LOG_SELECT_COLUMNS, numeric_value
+
+
+# Bir bloktaki örnek sayısı
+BLOCK_SIZE = 4096
+
+# Arşivlenen kanallar; sıra LOG_SELECT_COLUMNS ile aynıdır
+ARCHIVE_CHANNELS: Tuple[str, ...] = ('sequence', 'capture_time', 'timestamp', *FIELD_NAMES, EXTRA_COLUMN)
+
+# Log sözlüğü kurmak için gereken kanallar (sequence ve capture_time dışında)
+LOG_CHANNELS: Tuple[str, ...] = ARCHIVE_CHANNELS[2:]
+
+# Blok kodlamaları: tamsayılar bir öncekinden farkla, ondalıklar bir öncekinin bit
+# deseniyle XOR'lanarak saklanır; ardından baytlar düzlemlere ayrılır (tüm 0. baytlar,
+# tüm 1. baytlar, ...) ve zlib ile sıkıştırılır. Yavaş değişen sinyallerde üst baytlar
+# sıfırlandığından zlib uzun sıfır dizileri görür. Alıcıdan sabit basamakla gelen
+# ondalıklar (123.45 gibi) kayıpsız olarak 10^n ile ölçeklenmiş tamsayı farkları
+# şeklinde saklanır. Diğer değerler JSON olarak saklanır.
+CODEC_INTEGER = 1
+CODEC_FLOAT = 2
+CODEC_JSON = 3
+CODEC_DECIMAL = 4
+
+# Ölçekli tamsayı olarak denenecek en fazla ondalık basamak
+_MAX_DECIMALS = 6
+
+_FLAG_NULLS = 1
+_HEADER = struct.Struct('<BB')
+_WIDTH = 8
+_BIG_ENDIAN = sys.byteorder == 'big'
+
+
+def _shuffle(raw: bytes) -> bytes:
+    """8 baytlık değerlerin baytlarını düzlemlere ayırır"""
+    return b''.join(raw[i::_WIDTH] for i in range(_WIDTH))
+
+
+def _unshuffle(data: bytes, count: int) -> bytes:
+    """_shuffle'ın tersi"""
+    out = bytearray(count * _WIDTH)
+    for i in range(_WIDTH):
+        out[i::_WIDTH] = data[i * count:(i + 1) * count]
+    return bytes(out)
+
+
+def _little_endian(values: array.array) -> bytes:
+    if _BIG_ENDIAN:
+        values = array.array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(typecode: str, raw: bytes) -> array.array:
+    values = array.array(typecode)
+    values.frombytes(raw)
+    if _BIG_ENDIAN:
+        values.byteswap()
+    return values
+
+
+def _decimal_digits(values: Sequence[float]) -> Optional[int]:
+    """Tüm değerler n / 10^d olarak kayıpsız yazılabiliyorsa en küçük d, yoksa None"""
+    for value in values:
+        if value == 0 and math.copysign(1.0, value) < 0:
+            return None  # -0.0'ın işareti tamsayıda kaybolur
+    try:
+        for digits in range(_MAX_DECIMALS + 1):
+            scale = 10 ** digits
+            if all(round(value * scale) / scale == value for value in values):
+                return digits
+    except (OverflowError, ValueError):
+        pass  # sonsuz ya da NaN
+    return None
+
+
+def _encode_deltas(values: Sequence[int]) -> bytes:
+    """Tamsayıları bir öncekinden farkla, bayt düzlemlerine ayrılmış olarak kodlar"""
+    return _shuffle(_little_endian(array.array(
+        'q', map(operator.sub, values, itertools.chain((0,), values))
+    )))
+
+
+def encode_values(values: Sequence[Any]) -> bytes:
+    """Bir kanalın blok değerlerini sıkıştırılmış yüke çevirir (None değerler korunur)"""
+    present = [value for value in values if value is not None]
+    codec = CODEC_JSON
+    if present and all(type(value) is int for value in present):
+        codec = CODEC_INTEGER
+    elif present and all(type(value) is float for value in present):
+        codec = CODEC_FLOAT
+
+    body = b''
+    if codec == CODEC_INTEGER:
+        try:
+            body = _encode_deltas(present)
+        except OverflowError:
+            codec = CODEC_JSON
+    elif codec == CODEC_FLOAT:
+        digits = _decimal_digits(present)
+        if digits is not None:
+            scale = 10 ** digits
+            try:
+                body = bytes((digits,)) + _encode_deltas([round(value * scale) for value in present])
+                codec = CODEC_DECIMAL
+            except OverflowError:
+                pass
+    if codec == CODEC_FLOAT:
+        words = _from_little_endian('Q', _little_endian(array.array('d', present)))
+        body = _shuffle(_little_endian(array.array(
+            'Q', map(operator.xor, words, itertools.chain((0,), words))
+        )))
+
+    if codec == CODEC_JSON:
+        return zlib.compress(_HEADER.pack(codec, 0) + json.dumps(list(values)).encode('utf-8'))
+
+    flags = 0
+    mask = b''
+    if len(present) != len(values):
+        flags |= _FLAG_NULLS
+        bits = bytearray((len(values) + 7) // 8)
+        for index, value in enumerate(values):
+            if value is not None:
+                bits[index >> 3] |= 1 << (index & 7)
+        mask = bytes(bits)
+    return zlib.compress(_HEADER.pack(codec, flags) + mask + body)
+
+
+def decode_values(payload: bytes, count: int) -> List[Any]:
+    """encode_values ile üretilmiş yükü değer listesine çevirir"""
+    data = zlib.decompress(payload)
+    codec, flags = _HEADER.unpack_from(data)
+    offset = _HEADER.size
+    if codec == CODEC_JSON:
+        return json.loads(data[offset:])
+
+    mask = None
+    present = count
+    if flags & _FLAG_NULLS:
+        mask = data[offset:offset + (count + 7) // 8]
+        offset += len(mask)
+        present = sum(bin(byte).count('1') for byte in mask)
+
+    scale = 1
+    if codec == CODEC_DECIMAL:
+        scale = 10 ** data[offset]
+        offset += 1
+    raw = _unshuffle(data[offset:], present)
+    if codec == CODEC_INTEGER:
+        values = list(itertools.accumulate(_from_little_endian('q', raw)))
+    elif codec == CODEC_DECIMAL:
+        values = [value / scale for value in itertools.accumulate(_from_little_endian('q', raw))]
+    else:
+        words = array.array('Q', itertools.accumulate(_from_little_endian('Q', raw), operator.xor))
+        values = array.array('d', words.tobytes()).tolist()
+
+    if mask is None:
+        return values
+    source = iter(values)
+    return [next(source) if mask[i >> 3] >> (i & 7) & 1 else None for i in range(count)]
+
+
+def create_block_table(cursor: sqlite3.Cursor):
+    """Arşiv blokları tablosunu oluşturur (blob'lar büyük olduğundan rowid'li tablo)"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS telemetry_blocks (
+            flight_id INTEGER,
+            channel TEXT,
+            block INTEGER,
+            first_sequence INTEGER,
+            last_sequence INTEGER,
+            count INTEGER,
+            min_value REAL,
+            max_value REAL,
+            payload BLOB,
+            UNIQUE (flight_id, channel, block)
+        )
+    ''')
+
+
+def archive_flight(cursor: sqlite3.Cursor, flight_id: int,
+                   block_size: int = BLOCK_SIZE) -> Tuple[int, int, int]:
+    """
+    Uçuşun loglarını bloklara yazar ve ham satırları siler; çağıran transaction'ı
+    yönetir. (örnek sayısı, blok sayısı, sıkıştırılmış bayt) döndürür.
+    """
+    insert_sql = (
+        "INSERT INTO telemetry_blocks (flight_id, channel, block, first_sequence, last_sequence, "
+        "count, min_value, max_value, payload) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+    read_cursor = cursor.connection.cursor()
+    read_cursor.execute(
+        f"SELECT {LOG_SELECT_COLUMNS} FROM telemetry_logs WHERE flight_id = ? ORDER BY sequence",
+        (flight_id,)
+    )
+
+    samples = 0
+    stored = 0
+    block = 0
+    while True:
+        rows = read_cursor.fetchmany(block_size)
+        if not rows:
+            break
+        columns = list(zip(*rows))
+        first_sequence = columns[0][0]
+        last_sequence = columns[0][-1]
+        records = []
+        for channel, values in zip(ARCHIVE_CHANNELS, columns):
+            payload = encode_values(values)
+            numbers = [value for value in values
+                       if isinstance(value, (int, float)) and not isinstance(value, bool)]
+            records.append((
+                flight_id, channel, block, first_sequence, last_sequence, len(rows),
+                min(numbers) if numbers else None, max(numbers) if numbers else None, payload
+            ))
+            stored += len(payload)
+        cursor.executemany(insert_sql, records)
+        samples += len(rows)
+        block += 1
+
+    cursor.execute("DELETE FROM telemetry_logs WHERE flight_id = ?", (flight_id,))
+    return samples, block, stored
+
+
+class ArchiveReader:
+    """
+    Arşiv bloklarını okur.
+
+    Çözülmüş kanal blokları küçük bir LRU önbellekte tutulur; sayfalı okumalar
+    aynı bloğa art arda geldiğinde blok bir kez açılır. Arşivlenmiş veri
+    değişmez, önbellek yalnızca uçuş silindiğinde ya da yeniden arşivlendiğinde
+    forget() ile temizlenir.
+    """
+
+    def __init__(self, cache_size: int = 48):
+        self.cache_size = cache_size
+        self._cache: "collections.OrderedDict[Tuple[int, str, int], List[Any]]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def forget(self, flight_id: int):
+        """Uçuşun önbellekteki bloklarını siler"""
+        with self._lock:
+            for key in [key for key in self._cache if key[0] == flight_id]:
+                del self._cache[key]
+
+    def _channel(self, cursor: sqlite3.Cursor, flight_id: int, channel: str,
+                 block: int, count: int) -> List[Any]:
+        """Bir kanal bloğunu çözülmüş olarak döndürür"""
+        key = (flight_id, channel, block)
+        with self._lock:
+            values = self._cache.get(key)
+            if values is not None:
+                self._cache.move_to_end(key)
+                return values
+
+        if channel in ARCHIVE_CHANNELS:
+            cursor.execute(
+                "SELECT payload FROM telemetry_blocks WHERE flight_id = ? AND channel = ? AND block = ?",
+                (flight_id, channel, block)
+            )
+            row = cursor.fetchone()
+            values = decode_values(row[0], count) if row else [None] * count
+            if channel in FIELD_NAMES and None in values:
+                # Tipli sütuna uymayıp taşma JSON'una yazılmış değerler sayıya çevrilir
+                extras = self._channel(cursor, flight_id, EXTRA_COLUMN, block, count)
+                values = [
+                    numeric_value(json.loads(extra).get(channel)) if value is None and extra else value
+                    for value, extra in zip(values, extras)
+                ]
+        else:
+            # Tipli sütunu olmayan kanallar taşma JSON'undan çıkarılır
+            values = [
+                json.loads(extra).get(channel) if extra else None
+                for extra in self._channel(cursor, flight_id, EXTRA_COLUMN, block, count)
+            ]
+
+        with self._lock:
+            self._cache[key] = values
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return values
+
+    @staticmethod
+    def has_flight(cursor: sqlite3.Cursor, flight_id: int) -> bool:
+        """Uçuş arşivlenmiş mi"""
+        cursor.execute(
+            "SELECT 1 FROM telemetry_blocks WHERE flight_id = ? AND channel = 'sequence' LIMIT 1",
+            (flight_id,)
+        )
+        return cursor.fetchone() is not None
+
+    def bounds(self, cursor: sqlite3.Cursor, flight_id: int) -> Optional[Dict[str, Any]]:
+        """Arşivlenmiş uçuşun ilk/son sıra numarası ve yakalama zamanı"""
+        cursor.execute(
+            "SELECT block, count, first_sequence, last_sequence FROM telemetry_blocks "
+            "WHERE flight_id = ? AND channel = 'capture_time' ORDER BY block",
+            (flight_id,)
+        )
+        blocks = cursor.fetchall()
+        if not blocks:
+            return None
+        first, last = blocks[0], blocks[-1]
+        return {
+            'first_sequence': first[2],
+            'last_sequence': last[3],
+            'first_time': self._channel(cursor, flight_id, 'capture_time', first[0], first[1])[0],
+            'last_time': self._channel(cursor, flight_id, 'capture_time', last[0], last[1])[-1]
+        }
+
+    def read(self, cursor: sqlite3.Cursor, flight_id: int, channels: Sequence[str],
+             after: int = -1, end: Optional[int] = None,
+             start_time: Optional[float] = None, end_time: Optional[float] = None,
+             limit: Optional[int] = None) -> Tuple[List[int], List[Any], List[List[Any]]]:
+        """
+        Sırası after'dan büyük ve end'den küçük örnekleri (isteğe bağlı yakalama
+        zamanı aralığıyla) en fazla limit satır olarak okur:
+        (sıra numaraları, yakalama zamanları, kanal başına değer listeleri).
+        """
+        query = (
+            "SELECT block, count FROM telemetry_blocks WHERE flight_id = ? "
+            "AND channel = 'capture_time' AND last_sequence > ?"
+        )
+        params: List[Any] = [flight_id, after]
+        if end is not None:
+            query += " AND first_sequence < ?"
+            params.append(end)
+        # Yakalama zamanı aralığının dışında kalan bloklar hiç açılmaz
+        if start_time is not None:
+            query += " AND max_value >= ?"
+            params.append(start_time)
+        if end_time is not None:
+            query += " AND min_value < ?"
+            params.append(end_time)
+        query += " ORDER BY block"
+        cursor.execute(query, params)
+        blocks = cursor.fetchall()
+
+        sequences: List[int] = []
+        capture_times: List[Any] = []
+        columns: List[List[Any]] = [[] for _ in channels]
+        timed = start_time is not None or end_time is not None
+        for block, count in blocks:
+            if limit is not None and len(sequences) >= limit:
+                break
+            block_sequences = self._channel(cursor, flight_id, 'sequence', block, count)
+            block_times = self._channel(cursor, flight_id, 'capture_time', block, count)
+            low = bisect.bisect_right(block_sequences, after)
+            high = bisect.bisect_left(block_sequences, end) if end is not None else count
+
+            if timed:
+                selected = [
+                    i for i in range(low, high)
+                    if block_times[i] is not None
+                    and (start_time is None or block_times[i] >= start_time)
+                    and (end_time is None or block_times[i] < end_time)
+                ]
+                if limit is not None:
+                    selected = selected[:limit - len(sequences)]
+                if not selected:
+                    continue
+                sequences.extend(block_sequences[i] for i in selected)
+                capture_times.extend(block_times[i] for i in selected)
+                for column, channel in zip(columns, channels):
+                    values = self._channel(cursor, flight_id, channel, block, count)
+                    column.extend(values[i] for i in selected)
+            else:
+                if limit is not None:
+                    high = min(high, low + limit - len(sequences))
+                if high <= low:
+                    continue
+                sequences.extend(block_sequences[low:high])
+                capture_times.extend(block_times[low:high])
+                for column, channel in zip(columns, channels):
+                    column.extend(self._channel(cursor, flight_id, channel, block, count)[low:high])
+
+        return sequences, capture_times, columns
@@ -0,0 +1,256 @@
+"""
+Uçuş Dışa Aktarma Modülü
+Kayıtlı uçuşu bloklar halinde okuyup CSV, kanal başına .npy/.npz ya da sıkı ikili biçime yazar
+"""
+
+import array
+import csv
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import time
+import zipfile
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .database_manager import DatabaseManager, DEFAULT_CHUNK_SIZE
+from .telemetry_schema import FIELD_NAMES, numeric_value
+
+
+# Çıkış biçimleri
+FORMAT_CSV = 'csv'
+FORMAT_NPY = 'npy'        # çıkış dizininde kanal başına bir .npy dosyası
+FORMAT_NPZ = 'npz'        # tek .npz arşivi (kanal başına bir .npy üyesi)
+FORMAT_BINARY = 'binary'  # başlık + satır satır sabit boyutlu kayıtlar
+
+FORMATS = (FORMAT_CSV, FORMAT_NPY, FORMAT_NPZ, FORMAT_BINARY)
+
+# İkili biçim: b'HMBX' | sürüm (u16) | kanal sayısı (u16) | değer tipi ('d'/'f') |
+# kanal başına: ad uzunluğu (u8) + UTF-8 ad | kayıtlar: sıra (i64), capture_time (f64),
+# kanal değerleri (değer tipi); eksik değerler NaN
+BINARY_MAGIC = b'HMBX'
+BINARY_VERSION = 1
+_BINARY_HEADER = struct.Struct('<4sHHc')
+
+# .npy başlığı sabit 128 bayttır; uzunluk yazma bitince yerinde güncellenir
+_NPY_HEADER_SIZE = 128
+_NPY_PREFIX = b'\x93NUMPY\x01\x00'
+
+_NAN = float('nan')
+
+
+def _numeric(values: Sequence[Any]) -> List[float]:
+    """
+    Kanal değerlerini sayıya çevirir. Taşma sütunundan okunan kanallar metin ya da
+    true/false içerebilir; sayıya çevrilemeyen ve eksik değerler NaN yazılır.
+    """
+    result = []
+    for value in values:
+        number = numeric_value(value)
+        result.append(_NAN if number is None else number)
+    return result
+
+
+def _npy_header(descr: str, length: int) -> bytes:
+    """Tek boyutlu dizi için sabit uzunluklu .npy (1.0) başlığı"""
+    text = "{'descr': '%s', 'fortran_order': False, 'shape': (%d,), }" % (descr, length)
+    text = text.ljust(_NPY_HEADER_SIZE - len(_NPY_PREFIX) - 2 - 1) + "\n"
+    return _NPY_PREFIX + struct.pack('<H', len(text)) + text.encode('latin1')
+
+
+class _NpyColumn:
+    """Uzunluğu önceden bilinmeyen tek bir .npy dosyasına blok blok ekleme yapar"""
+
+    def __init__(self, path: str, typecode: str, descr: str):
+        self.path = path
+        self.typecode = typecode
+        self.descr = descr
+        self.length = 0
+        self._file = open(path, 'wb')
+        self._file.write(_npy_header(descr, 0))
+
+    def append(self, values: Sequence[Any]):
+        if self.typecode != 'q':
+            values = _numeric(values)
+        block = array.array(self.typecode, values)
+        if sys.byteorder == 'big':
+            block.byteswap()
+        block.tofile(self._file)
+        self.length += len(block)
+
+    def close(self):
+        self._file.seek(0)
+        self._file.write(_npy_header(self.descr, self.length))
+        self._file.close()
+
+
+class FlightExporter:
+    """
+    Akış halinde uçuş dışa aktarıcı.
+
+    Uçuş DatabaseManager.iter_columns ile chunk_size satırlık sütun blokları
+    halinde okunur ve her blok hemen yazılır; bellek kullanımı uçuşun
+    uzunluğundan bağımsızdır. Dışa aktarma başladığı andaki son sıra
+    numarasıyla sınırlanır, böylece süren bir uçuş da tutarlı aktarılır.
+    start_time/end_time uçuşun ilk örneğine göre saniye cinsindendir.
+    """
+
+    def __init__(self, database_manager: DatabaseManager, flight_id: int,
+                 channels: Optional[Sequence[str]] = None,
+                 start_time: Optional[float] = None, end_time: Optional[float] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, float32: bool = False):
+        self.database_manager = database_manager
+        self.flight_id = flight_id
+        self.channels: List[str] = list(channels) if channels else list(FIELD_NAMES)
+        self.start_time = start_time
+        self.end_time = end_time
+        self.chunk_size = chunk_size
+        self.float32 = float32
+
+    def _chunks(self):
+        """(başlangıç zamanı, blok üreteci) döndürür; uçuşta log yoksa üreteç boştur"""
+        bounds = self.database_manager.get_flight_bounds(self.flight_id)
+        if bounds is None:
+            return 0.0, iter(())
+        origin = bounds['first_time'] or 0.0
+        chunks = self.database_manager.iter_columns(
+            self.flight_id, self.channels,
+            end=bounds['last_sequence'] + 1,
+            start_time=origin + self.start_time if self.start_time is not None else None,
+            end_time=origin + self.end_time if self.end_time is not None else None,
+            chunk_size=self.chunk_size
+        )
+        return origin, chunks
+
+    def export(self, path: str, fmt: str = FORMAT_CSV) -> Dict[str, Any]:
+        """
+        Uçuşu verilen biçimde yazar ve özet döndürür.
+        npy biçiminde path bir dizindir; diğerlerinde dosyadır.
+        """
+        writers = {
+            FORMAT_CSV: self._write_csv,
+            FORMAT_NPY: self._write_npy,
+            FORMAT_NPZ: self._write_npz,
+            FORMAT_BINARY: self._write_binary,
+        }
+        if fmt not in writers:
+            raise ValueError(f"Bilinmeyen dışa aktarma biçimi: {fmt}")
+
+        started = time.perf_counter()
+        rows = writers[fmt](path)
+        elapsed = time.perf_counter() - started
+        return {
+            'flight_id': self.flight_id,
+            'format': fmt,
+            'path': path,
+            'channels': self.channels,
+            'rows': rows,
+            'bytes': _size_of(path),
+            'seconds': elapsed,
+            'rows_per_sec': rows / elapsed if elapsed > 0 else 0.0
+        }
+
+    def _write_csv(self, path: str) -> int:
+        origin, chunks = self._chunks()
+        rows = 0
+        with open(path, 'w', newline='', encoding='utf-8') as handle:
+            writer = csv.writer(handle)
+            writer.writerow(['sequence', 'capture_time', 't', *self.channels])
+            for sequences, capture_times, columns in chunks:
+                offsets = [round(t - origin, 6) if t is not None else None for t in capture_times]
+                writer.writerows(zip(sequences, capture_times, offsets, *columns))
+                rows += len(sequences)
+        return rows
+
+    def _value_type(self) -> Tuple[str, str]:
+        """Kanal değerlerinin array tip kodu ve .npy tanımı"""
+        return ('f', '<f4') if self.float32 else ('d', '<f8')
+
+    def _write_npy(self, directory: str) -> int:
+        os.makedirs(directory, exist_ok=True)
+        typecode, descr = self._value_type()
+        files = [
+            _NpyColumn(os.path.join(directory, 'sequence.npy'), 'q', '<i8'),
+            _NpyColumn(os.path.join(directory, 'capture_time.npy'), 'd', '<f8'),
+        ] + [
+            _NpyColumn(os.path.join(directory, f'{channel}.npy'), typecode, descr)
+            for channel in self.channels
+        ]
+        try:
+            _, chunks = self._chunks()
+            for sequences, capture_times, columns in chunks:
+                files[0].append(sequences)
+                files[1].append(capture_times)
+                for column_file, values in zip(files[2:], columns):
+                    column_file.append(values)
+        finally:
+            for column_file in files:
+                column_file.close()
+        return files[0].length
+
+    def _write_npz(self, path: str) -> int:
+        # Kanallar önce geçici dizine .npy olarak akıtılır, sonra dosyadan dosyaya arşivlenir
+        directory = tempfile.mkdtemp(prefix='export_', dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            rows = self._write_npy(directory)
+            with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED, allowZip64=True) as archive:
+                for name in ['sequence', 'capture_time', *self.channels]:
+                    archive.write(os.path.join(directory, f'{name}.npy'), f'{name}.npy')
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        return rows
+
+    def _write_binary(self, path: str) -> int:
+        typecode, _ = self._value_type()
+        record = struct.Struct('<qd' + typecode * len(self.channels))
+        pack = record.pack
+        rows = 0
+        with open(path, 'wb') as handle:
+            handle.write(_BINARY_HEADER.pack(
+                BINARY_MAGIC, BINARY_VERSION, len(self.channels), typecode.encode()
+            ))
+            for channel in self.channels:
+                name = channel.encode('utf-8')
+                handle.write(struct.pack('<B', len(name)) + name)
+            _, chunks = self._chunks()
+            for sequences, capture_times, columns in chunks:
+                columns = [_numeric(column) for column in columns]
+                handle.write(b''.join(
+                    pack(sequence, capture_time if capture_time is not None else _NAN, *values)
+                    for sequence, capture_time, *values in zip(sequences, capture_times, *columns)
+                ))
+                rows += len(sequences)
+        return rows
+
+
+def read_binary_export(path: str):
+    """
+    İkili dışa aktarma dosyasını okur; (kanal adları, NumPy yapılandırılmış dizisi)
+    döndürür. Dizi alanları: sequence, capture_time ve kanal adları.
+    """
+    import numpy as np
+
+    with open(path, 'rb') as handle:
+        magic, version, count, typecode = _BINARY_HEADER.unpack(handle.read(_BINARY_HEADER.size))
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            raise ValueError(f"Geçersiz ikili dışa aktarma dosyası: {path}")
+        channels = []
+        for _ in range(count):
+            length = handle.read(1)[0]
+            channels.append(handle.read(length).decode('utf-8'))
+        value = '<f4' if typecode == b'f' else '<f8'
+        dtype = np.dtype([('sequence', '<i8'), ('capture_time', '<f8')]
+                         + [(channel, value) for channel in channels])
+        records = np.fromfile(handle, dtype=dtype)
+    return channels, records
+
+
+def _size_of(path: str) -> int:
+    """Dosyanın ya da dizindeki dosyaların toplam boyutu"""
+    if os.path.isdir(path):
+        return sum(
+            os.path.getsize(os.path.join(path, name)) for name in os.listdir(path)
+            if os.path.isfile(os.path.join(path, name))
+        )
+    return os.path.getsize(path) if os.path.exists(path) else 0
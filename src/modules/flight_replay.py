@@ -0,0 +1,206 @@
+"""
+Uçuş Tekrar Oynatma Modülü
+Kayıtlı bir uçuşu veritabanından sayfa sayfa okuyup orijinal zamanlamasıyla yeniden besler
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .database_manager import DatabaseManager, DEFAULT_PAGE_SIZE
+
+
+class FlightReplay:
+    """
+    Kayıtlı uçuş oynatıcısı.
+
+    Okuyucu thread'i uçuşu iter_logs ile sayfa sayfa okur ve sınırlı bir kuyruğa
+    bırakır; bellekte en fazla prefetch + 1 sayfa bulunur, böylece saatlerce
+    süren kayıtlar da oynatılabilir. Oynatıcı thread'i örnekleri capture_time
+    farklarını speed'e bölerek sink'e iletir; speed 0 beklemesiz (en yüksek hız)
+    oynatma demektir.
+    """
+
+    _END = object()
+
+    def __init__(self, database_manager: DatabaseManager, sink: Callable[[Dict[str, Any]], None],
+                 page_size: int = DEFAULT_PAGE_SIZE, prefetch: int = 4,
+                 on_finished: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.database_manager = database_manager
+        self.sink = sink
+        self.page_size = page_size
+        self.prefetch = prefetch
+        self.on_finished = on_finished
+
+        self.flight_id: Optional[int] = None
+        self.speed = 1.0
+        self._pages: "queue.Queue" = queue.Queue(maxsize=prefetch)
+        self._stop = threading.Event()
+        self._resume = threading.Event()
+        self._resume.set()
+        self._schedule_lock = threading.Lock()
+        self._reader: Optional[threading.Thread] = None
+        self._player: Optional[threading.Thread] = None
+        self._reset_counters()
+
+    def _reset_counters(self):
+        self.replayed_count = 0
+        self.position: Optional[int] = None
+        self.max_lag = 0.0
+        self.started_at = 0.0
+        self.finished_at = 0.0
+        self.completed = False
+        self._base_wall = 0.0
+        self._base_capture: Optional[float] = None
+        self._last_capture: Optional[float] = None
+
+    def start(self, flight_id: int, speed: float = 1.0, start: Optional[int] = None,
+              end: Optional[int] = None) -> bool:
+        """Oynatmayı başlatır; zaten çalışıyorsa False döner"""
+        if self.is_running():
+            return False
+
+        self.flight_id = flight_id
+        self.speed = max(speed, 0.0)
+        self._reset_counters()
+        self._pages = queue.Queue(maxsize=self.prefetch)
+        self._stop.clear()
+        self._resume.set()
+        self.started_at = time.monotonic()
+
+        self._reader = threading.Thread(
+            target=self._read_pages, args=(flight_id, start, end), daemon=True
+        )
+        self._player = threading.Thread(target=self._play, daemon=True)
+        self._reader.start()
+        self._player.start()
+        return True
+
+    def stop(self, timeout: float = 2.0):
+        """Oynatmayı durdurur"""
+        self._stop.set()
+        self._resume.set()
+        for thread in (self._player, self._reader):
+            if thread and thread is not threading.current_thread():
+                thread.join(timeout)
+
+    def pause(self):
+        """Oynatmayı duraklatır"""
+        self._resume.clear()
+
+    def resume(self):
+        """Duraklatılan oynatmayı sürdürür; zamanlama kaldığı yerden yeniden hizalanır"""
+        self._rebase()
+        self._resume.set()
+
+    def set_speed(self, speed: float):
+        """Oynatma hızını değiştirir (1: gerçek zaman, N: N kat, 0: en yüksek hız)"""
+        with self._schedule_lock:
+            self.speed = max(speed, 0.0)
+            self._base_capture = None
+
+    def is_running(self) -> bool:
+        return self._player is not None and self._player.is_alive()
+
+    def is_paused(self) -> bool:
+        return not self._resume.is_set()
+
+    def _rebase(self):
+        """Bir sonraki örnekten itibaren zamanlamayı şimdiki ana göre yeniden başlatır"""
+        with self._schedule_lock:
+            self._base_capture = None
+
+    def _read_pages(self, flight_id: int, start: Optional[int], end: Optional[int]):
+        """Okuyucu thread'i: sayfaları sınırlı kuyruğa bırakır"""
+        try:
+            for page in self.database_manager.iter_logs(flight_id, start, end, self.page_size):
+                if not self._put(page):
+                    return
+        except Exception as e:
+            print(f"Tekrar oynatma okuma hatası: {e}")
+        self._put(self._END)
+
+    def _put(self, item) -> bool:
+        """Kuyruk doluysa durdurulana kadar yer açılmasını bekler"""
+        while not self._stop.is_set():
+            try:
+                self._pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _play(self):
+        """Oynatıcı thread'i: örnekleri zamanlamaya uyarak sink'e iletir"""
+        try:
+            while not self._stop.is_set():
+                try:
+                    page = self._pages.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if page is self._END:
+                    self.completed = True
+                    break
+                self._play_page(page)
+        finally:
+            self.finished_at = time.monotonic()
+            if self.on_finished:
+                self.on_finished(self.stats())
+
+    def _play_page(self, page: List[Dict[str, Any]]):
+        sink = self.sink
+        stop = self._stop
+        for log in page:
+            capture_time = log['capture_time']
+            if self.speed and capture_time is not None:
+                delay = self._delay_for(capture_time)
+                if delay > 0 and stop.wait(delay):
+                    return
+
+            if not self._resume.is_set():
+                self._resume.wait()
+            if stop.is_set():
+                return
+
+            try:
+                sink(log['data'])
+            except Exception as e:
+                print(f"Tekrar oynatma işleme hatası: {e}")
+            self.replayed_count += 1
+            self.position = log['sequence']
+
+    def _delay_for(self, capture_time: float) -> float:
+        """Örneğin gönderim zamanına kalan süre; geride kalınıyorsa gecikmeyi kaydeder"""
+        now = time.monotonic()
+        with self._schedule_lock:
+            if not self.speed:
+                return 0.0
+            if self._base_capture is None or capture_time < (self._last_capture or 0.0):
+                # İlk örnek, hız değişimi ya da geri giden saat: buradan yeniden hizala
+                self._base_capture = capture_time
+                self._base_wall = now
+            self._last_capture = capture_time
+            target = self._base_wall + (capture_time - self._base_capture) / self.speed
+        delay = target - now
+        if -delay > self.max_lag:
+            self.max_lag = -delay
+        return delay
+
+    def stats(self) -> Dict[str, Any]:
+        """Oynatma sayaçlarını döndürür (rate: saniyedeki örnek)"""
+        end = self.finished_at if self.finished_at else time.monotonic()
+        elapsed = end - self.started_at if self.started_at else 0.0
+        return {
+            'flight_id': self.flight_id,
+            'running': self.is_running() and not self.finished_at,
+            'paused': self.is_paused(),
+            'completed': self.completed,
+            'speed': self.speed,
+            'replayed': self.replayed_count,
+            'position': self.position,
+            'elapsed': elapsed,
+            'rate': self.replayed_count / elapsed if elapsed > 0 else 0.0,
+            'max_lag': self.max_lag,
+            'buffered_pages': self._pages.qsize()
+        }
@@ -0,0 +1,234 @@
+"""
+Uçuş İstatistikleri Modülü
+Telemetri alanları için örnek başına O(1) güncellenen akan istatistikler
+"""
+
+import math
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .telemetry_schema import FIELD_NAMES, numeric_value
+
+
+class P2Quantile:
+    """
+    P² algoritması ile yaklaşık kantil tahmini (Jain & Chlamtac, 1985).
+    Örnekleri saklamaz; yalnızca beş işaretçi tutar.
+    """
+
+    __slots__ = ('p', '_heights', '_positions', '_desired', '_increments')
+
+    def __init__(self, p: float):
+        self.p = p
+        self._heights: List[float] = []
+        self._positions = [0.0, 1.0, 2.0, 3.0, 4.0]
+        self._desired = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        self._increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def add(self, x: float):
+        """Yeni bir gözlem ekler"""
+        q = self._heights
+        if len(q) < 5:
+            q.append(x)
+            if len(q) == 5:
+                q.sort()
+            return
+
+        n = self._positions
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in (1, 2, 3):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                if q[i - 1] < candidate < q[i + 1]:
+                    q[i] = candidate
+                else:
+                    q[i] = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                n[i] += step
+
+    def _parabolic(self, i: int, d: int) -> float:
+        """P² parabolik ara değer tahmini"""
+        q = self._heights
+        n = self._positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def value(self) -> Optional[float]:
+        """Güncel kantil tahmini"""
+        q = self._heights
+        if not q:
+            return None
+        if len(q) < 5:
+            ordered = sorted(q)
+            return ordered[int(round(self.p * (len(ordered) - 1)))]
+        return q[2]
+
+
+class RunningStatistics:
+    """Welford yöntemiyle tek bir alan için sayı/min/max/ortalama/varyans"""
+
+    __slots__ = ('count', 'min', 'max', 'mean', '_m2', 'quantiles')
+
+    def __init__(self, quantiles: Sequence[float] = ()):
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.quantiles = [P2Quantile(p) for p in quantiles]
+
+    def add(self, value: float):
+        """Yeni bir değer ekler"""
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        for quantile in self.quantiles:
+            quantile.add(value)
+
+    @property
+    def variance(self) -> float:
+        """Örneklem varyansı"""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Özet sözlüğü döndürür"""
+        if not self.count:
+            return {'count': 0}
+        result = {
+            'count': self.count,
+            'min': self.min,
+            'max': self.max,
+            'avg': self.mean,
+            'variance': self.variance,
+            'std': math.sqrt(self.variance),
+        }
+        for quantile in self.quantiles:
+            result[f"p{quantile.p * 100:g}"] = quantile.value()
+        return result
+
+
+class GeoBounds:
+    """
+    Geçerli konumların enlem/boylam sınırlayıcı kutusu.
+    Alıcılar konum yokken 0, 0 gönderdiği için bu nokta kutuya katılmaz.
+    """
+
+    __slots__ = ('min_latitude', 'max_latitude', 'min_longitude', 'max_longitude')
+
+    def __init__(self):
+        self.min_latitude = math.inf
+        self.max_latitude = -math.inf
+        self.min_longitude = math.inf
+        self.max_longitude = -math.inf
+
+    def add(self, latitude: Any, longitude: Any):
+        """Konumu kutuya ekler; eksik ya da 0, 0 konumlar yok sayılır"""
+        if (not isinstance(latitude, (int, float)) or not isinstance(longitude, (int, float))
+                or isinstance(latitude, bool) or isinstance(longitude, bool)
+                or (latitude == 0 and longitude == 0)):
+            return
+        if latitude < self.min_latitude:
+            self.min_latitude = latitude
+        if latitude > self.max_latitude:
+            self.max_latitude = latitude
+        if longitude < self.min_longitude:
+            self.min_longitude = longitude
+        if longitude > self.max_longitude:
+            self.max_longitude = longitude
+
+    def to_dict(self) -> Optional[Dict[str, float]]:
+        """Kutuyu sözlük olarak döndürür; geçerli konum yoksa None"""
+        if self.min_latitude > self.max_latitude:
+            return None
+        return {
+            'min_latitude': self.min_latitude,
+            'max_latitude': self.max_latitude,
+            'min_longitude': self.min_longitude,
+            'max_longitude': self.max_longitude
+        }
+
+
+class FlightStatistics:
+    """
+    Bir uçuşun tüm sayısal alanları için akan istatistik biriktiricisi.
+    add() okuma thread'inden, summary() arayüz thread'inden çağrılabilir.
+    """
+
+    def __init__(self, fields: Iterable[str] = FIELD_NAMES, quantiles: Sequence[float] = ()):
+        self.fields = tuple(fields)
+        self._stats = {field: RunningStatistics(quantiles) for field in self.fields}
+        self._lock = threading.Lock()
+        self.sample_count = 0
+        self.first_capture_time: Optional[float] = None
+        self.last_capture_time: Optional[float] = None
+        self.bounds = GeoBounds()
+
+    def add(self, data: Dict[str, Any], capture_time: float):
+        """Bir telemetri örneğini ekler"""
+        with self._lock:
+            self.sample_count += 1
+            if self.first_capture_time is None:
+                self.first_capture_time = capture_time
+            self.last_capture_time = capture_time
+            self.bounds.add(data.get('enlem'), data.get('boylam'))
+            for field, stats in self._stats.items():
+                # Kayıttan yeniden hesaplanan özetle aynı sayısal çevirme kuralı
+                value = numeric_value(data.get(field))
+                if value is not None:
+                    stats.add(value)
+
+    @property
+    def duration(self) -> float:
+        """İlk ve son örnek arasındaki gerçek süre (saniye)"""
+        if self.first_capture_time is None:
+            return 0.0
+        return self.last_capture_time - self.first_capture_time
+
+    def summary(self) -> Dict[str, Any]:
+        """get_flight_statistics ile aynı biçimde özet döndürür"""
+        with self._lock:
+            if not self.sample_count:
+                return {}
+            fields = {field: stats.to_dict() for field, stats in self._stats.items() if stats.count}
+            return build_summary(self.sample_count, self.duration, fields, self.bounds.to_dict())
+
+
+def build_summary(sample_count: int, duration: float, fields: Dict[str, Dict[str, Any]],
+                  bounds: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """Alan özetlerinden uçuş istatistik sözlüğünü oluşturur"""
+    altitude = fields.get('irtifa', {})
+    speed = fields.get('hiz', {})
+    return {
+        'total_logs': sample_count,
+        'max_altitude': altitude.get('max', 0),
+        'min_altitude': altitude.get('min', 0),
+        'avg_altitude': altitude.get('avg', 0),
+        'max_speed': speed.get('max', 0),
+        'avg_speed': speed.get('avg', 0),
+        'duration': duration,
+        'bounds': bounds,
+        'fields': fields
+    }
@@ -0,0 +1,277 @@
+"""
+Uçuş Rotası Modülü
+Harita için Douglas-Peucker rota sadeleştirmesi, yakınlaştırmaya bağlı düzeyler ve canlı rota
+"""
+
+import math
+import sqlite3
+import threading
+from typing import List, Optional, Sequence, Tuple
+
+
+# Rota köşesi: (sequence, enlem, boylam)
+Vertex = Tuple[int, float, float]
+
+# Görünüm kutusu: (min_enlem, max_enlem, min_boylam, max_boylam)
+Bounds = Tuple[float, float, float, float]
+
+# Düzey k, ham rotadan en fazla TRACK_BASE_TOLERANCE * TRACK_FACTOR ** k metre sapar;
+# anlamlılığı taban toleransın altında kalan köşeler (GPS gürültüsü) saklanmaz
+TRACK_BASE_TOLERANCE = 1.0
+TRACK_FACTOR = 4
+TRACK_LEVELS = 8
+
+# Canlı rotada bir düzeyde karara bağlanmayı bekleyen en fazla köşe sayısı
+LIVE_WINDOW = 64
+
+# Derece başına yaklaşık metre (eşdikdörtgen izdüşüm; rota ölçeğinde yeterli)
+METERS_PER_DEGREE = 111320.0
+
+
+def create_track_table(cursor: sqlite3.Cursor):
+    """Tamamlanmış uçuşların sadeleştirilmiş rota köşeleri tablosunu oluşturur"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS flight_tracks (
+            flight_id INTEGER,
+            level INTEGER,
+            sequence INTEGER,
+            latitude REAL,
+            longitude REAL,
+            PRIMARY KEY (flight_id, level, sequence)
+        ) WITHOUT ROWID
+    ''')
+
+
+def level_tolerance(level: int) -> float:
+    """Verilen düzeyin metre cinsinden sapma toleransı"""
+    return TRACK_BASE_TOLERANCE * TRACK_FACTOR ** level
+
+
+def tolerance_level(tolerance: float) -> int:
+    """Sapması tolerance metreyi geçmeyen en kaba düzey"""
+    level = 0
+    while level + 1 < TRACK_LEVELS and level_tolerance(level + 1) <= tolerance:
+        level += 1
+    return level
+
+
+def view_tolerance(bounds: Bounds, width: int, height: int) -> float:
+    """Görünümde bir pikselin metre karşılığı; daha ince ayrıntı ekranda görünmez"""
+    if width <= 0 or height <= 0:
+        return 0.0
+    min_lat, max_lat, min_lon, max_lon = bounds
+    scale = math.cos(math.radians((min_lat + max_lat) / 2))
+    return max((max_lat - min_lat) * METERS_PER_DEGREE / height,
+               (max_lon - min_lon) * METERS_PER_DEGREE * scale / width)
+
+
+def valid_position(latitude, longitude) -> bool:
+    """Konum sayısal mı; alıcıların konum yokken gönderdiği 0, 0 geçersiz sayılır"""
+    return (isinstance(latitude, (int, float)) and isinstance(longitude, (int, float))
+            and not isinstance(latitude, bool) and not isinstance(longitude, bool)
+            and not (latitude == 0 and longitude == 0))
+
+
+def bounds_intersect(a: Bounds, b: Bounds) -> bool:
+    """İki enlem/boylam kutusu kesişiyor mu"""
+    return a[0] <= b[1] and a[1] >= b[0] and a[2] <= b[3] and a[3] >= b[2]
+
+
+def _segment_distance(px: float, py: float, ax: float, ay: float, bx: float, by: float) -> float:
+    """P noktasının AB doğru parçasına uzaklığı"""
+    dx = bx - ax
+    dy = by - ay
+    length = dx * dx + dy * dy
+    if length == 0:
+        return math.hypot(px - ax, py - ay)
+    t = ((px - ax) * dx + (py - ay) * dy) / length
+    if t < 0:
+        t = 0.0
+    elif t > 1:
+        t = 1.0
+    return math.hypot(px - ax - t * dx, py - ay - t * dy)
+
+
+def douglas_peucker_significance(xs: Sequence[float], ys: Sequence[float]) -> List[float]:
+    """
+    Her noktanın Douglas-Peucker bölmesinde korunduğu en büyük toleransı döndürür
+    (uç noktalar sonsuz). Tolerans t ile sadeleştirme anlamlılığı t'den büyük
+    noktalardır; tek geçişle tüm yakınlaştırma düzeyleri elde edilir. Anlamlılık üst
+    bölmeninkini geçmez, böylece kaba düzeyler ince düzeylerin alt kümesidir.
+    """
+    n = len(xs)
+    significance = [0.0] * n
+    if n == 0:
+        return significance
+    significance[0] = significance[-1] = math.inf
+
+    stack = [(0, n - 1, math.inf)]
+    while stack:
+        first, last, limit = stack.pop()
+        if last - first < 2:
+            continue
+        ax, ay, bx, by = xs[first], ys[first], xs[last], ys[last]
+        farthest = first + 1
+        distance = -1.0
+        for i in range(first + 1, last):
+            d = _segment_distance(xs[i], ys[i], ax, ay, bx, by)
+            if d > distance:
+                distance = d
+                farthest = i
+        distance = min(distance, limit)
+        significance[farthest] = distance
+        stack.append((first, farthest, distance))
+        stack.append((farthest, last, distance))
+    return significance
+
+
+def douglas_peucker(xs: Sequence[float], ys: Sequence[float], tolerance: float) -> List[int]:
+    """Douglas-Peucker sadeleştirmesi; korunan noktaların indekslerini sıralı döndürür"""
+    return [i for i, s in enumerate(douglas_peucker_significance(xs, ys)) if s > tolerance]
+
+
+def project(vertices: Sequence[Vertex]) -> Tuple[List[float], List[float]]:
+    """Köşeleri ilk köşenin enlemine göre metre cinsinden düzlem koordinatlarına çevirir"""
+    if not vertices:
+        return [], []
+    scale = METERS_PER_DEGREE * math.cos(math.radians(vertices[0][1]))
+    xs = [vertex[2] * scale for vertex in vertices]
+    ys = [vertex[1] * METERS_PER_DEGREE for vertex in vertices]
+    return xs, ys
+
+
+def simplify_track(vertices: Sequence[Vertex]) -> List[Tuple[int, Vertex]]:
+    """
+    Rotayı düzeylere ayırır: her köşe, korunduğu en kaba düzeyle (düzey, köşe)
+    olarak döner. Düzey k sorgusu düzeyi k ve üstü olan köşelerdir.
+    """
+    xs, ys = project(vertices)
+    thresholds = [level_tolerance(level) for level in range(TRACK_LEVELS)]
+    levels = []
+    for vertex, significance in zip(vertices, douglas_peucker_significance(xs, ys)):
+        if significance <= thresholds[0]:
+            continue
+        level = 0
+        while level + 1 < TRACK_LEVELS and significance > thresholds[level + 1]:
+            level += 1
+        levels.append((level, vertex))
+    return levels
+
+
+def clip_track(vertices: Sequence[Vertex], bounds: Optional[Bounds]) -> List[List[Vertex]]:
+    """
+    Rotanın görünüm kutusuna giren parçalarını ayırır. Kutunun dışındaki komşu
+    köşeler de eklenir; kenarı kesen ya da kutunun üzerinden geçen çizgiler kopmaz.
+    """
+    if bounds is None:
+        return [list(vertices)] if vertices else []
+    min_lat, max_lat, min_lon, max_lon = bounds
+
+    segments: List[List[Vertex]] = []
+    current: Optional[List[Vertex]] = None
+    previous: Optional[Vertex] = None
+    for vertex in vertices:
+        latitude, longitude = vertex[1], vertex[2]
+        if previous is None:
+            hit = min_lat <= latitude <= max_lat and min_lon <= longitude <= max_lon
+        else:
+            # Köşe ya da önceki köşeyle arasındaki çizginin kutusu görünüme değiyor mu
+            hit = (min(latitude, previous[1]) <= max_lat and max(latitude, previous[1]) >= min_lat
+                   and min(longitude, previous[2]) <= max_lon
+                   and max(longitude, previous[2]) >= min_lon)
+        if hit:
+            if current is None:
+                current = [] if previous is None else [previous]
+                segments.append(current)
+            current.append(vertex)
+        else:
+            current = None
+        previous = vertex
+    return segments
+
+
+class LiveTrack:
+    """
+    Aktif uçuşun rotası; her örnekte artımlı olarak sadeleştirilir.
+
+    Her düzey açılan pencere yöntemiyle çalışır: çapadan sonraki köşeler, çapa ile
+    yeni nokta arasındaki doğrunun toleransı aşılana (ya da pencere dolana) kadar
+    bekletilir, ardından son uygun köşe kesinleşip yeni çapa olur. Düzeyler
+    zincirlidir; her düzey bir alttakinin kesinleşen köşeleriyle beslenir, böylece
+    örnek başına maliyet pencere boyuyla sınırlıdır ve kaba düzeyler nadiren çalışır.
+    Zincirleme nedeniyle düzey k'nın ham rotadan sapması toleransının en fazla 4/3 katıdır.
+    """
+
+    def __init__(self, levels: int = TRACK_LEVELS, window: int = LIVE_WINDOW):
+        self.window = max(1, window)
+        self.tolerances = [level_tolerance(level) for level in range(levels)]
+        # Düzey başına kesinleşen köşeler, çapa ve bekleyen (x, y, köşe) noktaları
+        self._committed: List[List[Vertex]] = [[] for _ in range(levels)]
+        self._anchors: List[Optional[tuple]] = [None] * levels
+        self._pending: List[List[tuple]] = [[] for _ in range(levels)]
+        self._scale: Optional[float] = None
+        self._lock = threading.Lock()
+        self.sample_count = 0
+
+    def add(self, sequence: int, latitude, longitude) -> bool:
+        """Yeni konumu ekler; eksik ya da 0, 0 konumlar yok sayılır"""
+        if not valid_position(latitude, longitude):
+            return False
+        if self._scale is None:
+            self._scale = METERS_PER_DEGREE * math.cos(math.radians(latitude))
+        point = (longitude * self._scale, latitude * METERS_PER_DEGREE,
+                 (sequence, latitude, longitude))
+        with self._lock:
+            self.sample_count += 1
+            level = 0
+            while point is not None and level < len(self.tolerances):
+                point = self._push(level, point)
+                level += 1
+        return True
+
+    def _push(self, level: int, point: tuple) -> Optional[tuple]:
+        """Noktayı düzeye ekler; kesinleşen köşe varsa (üst düzeye gider) döndürür"""
+        anchor = self._anchors[level]
+        if anchor is None:
+            self._anchors[level] = point
+            self._committed[level].append(point[2])
+            return point
+
+        pending = self._pending[level]
+        if len(pending) < self.window:
+            ax, ay = anchor[0], anchor[1]
+            bx, by = point[0], point[1]
+            tolerance = self.tolerances[level]
+            for px, py, _ in pending:
+                if _segment_distance(px, py, ax, ay, bx, by) > tolerance:
+                    break
+            else:
+                pending.append(point)
+                return None
+
+        vertex = pending[-1]
+        self._anchors[level] = vertex
+        self._committed[level].append(vertex[2])
+        self._pending[level] = [point]
+        return vertex
+
+    def vertices(self, level: int) -> List[Vertex]:
+        """
+        Düzeyin köşeleri: kesinleşenler, ardından bu ve alt düzeylerde bekleyenler;
+        çizgi her zaman son konuma kadar uzanır.
+        """
+        level = min(level, len(self.tolerances) - 1)
+        with self._lock:
+            vertices = list(self._committed[level])
+            for below in range(level, -1, -1):
+                vertices.extend(point[2] for point in self._pending[below])
+        return vertices
+
+    def stats(self) -> dict:
+        """Örnek sayısı ve düzey başına köşe sayıları"""
+        with self._lock:
+            return {
+                'samples': self.sample_count,
+                'vertices': [len(committed) + len(pending)
+                             for committed, pending in zip(self._committed, self._pending)]
+            }
@@ -0,0 +1,288 @@
+"""
+Yer İstasyonu Çekirdek Modülü
+Seri alım → ayrıştırma → SQLite → hakem gönderimi hattının Qt gerektirmeyen çekirdeği
+"""
+
+import json
+import time
+from typing import Any, Dict, Optional
+
+from .signals import Signal
+from .serial_manager import SerialManager, ROLE_ROCKET, INGEST_JSON
+from .database_manager import DatabaseManager
+from .ingest_queue import IngestQueue, POLICY_DROP_OLDEST
+from .judge_transmitter import JudgeTransmitter, POLICY_LATEST
+from .raw_journal import (
+    RawJournal, DEFAULT_SEGMENT_SIZE, MARK_CONNECT, MARK_FLIGHT_START, MARK_FLIGHT_END, MARK_LINK
+)
+from .pipeline_metrics import (
+    PipelineMetrics, STAGE_PARSE, STAGE_LOG, STAGE_STATISTICS, STAGE_PUBLISH,
+    STAGE_JUDGE_SUBMIT, STAGE_PROCESS, STAGE_INGEST
+)
+from .source_merger import SourceMerger
+
+
+class GroundStation:
+    """
+    Telemetri hattının arayüzden bağımsız çekirdeği.
+
+    SerialManager'dan gelen satır ve örnekleri ayrıştırır, kaynakları birleştirir,
+    veritabanına yazar, canlı istatistik/tamponu günceller ve hakem göndericisine
+    iletir. İşlenen her örnek telemetry_received sinyali ile yayınlanır; QML köprüsü
+    ya da başsız (headless) çalıştırıcı bu sinyale bağlanır.
+    """
+
+    # Sinyaller
+    telemetry_received = Signal(dict)
+    packet_sent = Signal(int)
+    connection_status_changed = Signal(bool, str)
+    link_status_changed = Signal(str, bool, str)
+
+    def __init__(self, db_path: str = "flight_logs.db", live_buffer_capacity: int = 60000,
+                 judge_rate: float = 0.0, background_init: bool = False,
+                 judge_policy: str = POLICY_LATEST, judge_queue_size: int = 16,
+                 metrics_enabled: bool = True, ingest_queue_size: int = 1024,
+                 ingest_policy: str = POLICY_DROP_OLDEST, journal_dir: Optional[str] = None,
+                 journal_segment_size: int = DEFAULT_SEGMENT_SIZE):
+        self.serial_manager = SerialManager()
+        self.database_manager = DatabaseManager(db_path, live_buffer_capacity=live_buffer_capacity,
+                                                background_init=background_init)
+        self.source_merger = SourceMerger(primary=ROLE_ROCKET)
+        self.parse_errors = 0
+
+        # Hakem paketleri kendi thread'inde, okuma hattını bekletmeden gönderilir
+        self.judge_transmitter = JudgeTransmitter(
+            self.serial_manager.send_data, rate_hz=judge_rate, max_queue_size=judge_queue_size,
+            policy=judge_policy, on_sent=self.packet_sent.emit
+        )
+        self.judge_transmitter.start()
+
+        # Aşama gecikme ölçümleri: hattaki tüm bileşenler aynı nesneye bildirir
+        self.metrics = PipelineMetrics(enabled=metrics_enabled)
+        self.serial_manager.metrics = self.metrics
+        self.judge_transmitter.metrics = self.metrics
+        if self.database_manager.writer:
+            self.database_manager.writer.metrics = self.metrics
+
+        # Sinyal bağlantıları
+        self.serial_manager.connection_status_changed.connect(self.connection_status_changed.emit)
+        self.serial_manager.link_status_changed.connect(self.link_status_changed.emit)
+
+        # Okuyucu ile işleme arasındaki sınırlı kuyruk; boyut 0 ise örnekler G/Ç
+        # thread'inde doğrudan işlenir
+        self.ingest_queue: Optional[IngestQueue] = None
+        if ingest_queue_size > 0:
+            self.ingest_queue = IngestQueue(self._process_item, self._persist_item,
+                                            ingest_queue_size, ingest_policy)
+            self.ingest_queue.metrics = self.metrics
+            self.ingest_queue.start()
+
+        # Ham bayt günlüğü ilk bağlantıda açılır; verilmezse kayıt yapılmaz
+        self.journal_dir = journal_dir
+        self.journal_segment_size = journal_segment_size
+        self.journal: Optional[RawJournal] = None
+
+        # Veri alım callback'leri (G/Ç thread'inde çalışır, her satır bir kez alınır)
+        self.serial_manager.set_data_callback(self._receive_line)
+        self.serial_manager.set_sample_callback(self._receive_sample)
+
+    def connect(self, port_name: str, team_id: int = 1, baudrate: int = 9600,
+                ingest_mode: str = INGEST_JSON, flight_name: Optional[str] = None) -> bool:
+        """Roket alıcısına bağlanır ve yeni bir uçuş başlatır"""
+        journal = self._open_journal()
+        if journal is not None:
+            # Bağlantı ile uçuş ID'si belli olana kadar okunan baytlar kurtarmada
+            # bu işaret sayesinde uçuşa dahil edilir
+            journal.mark(MARK_CONNECT, port=port_name, ingest_mode=ingest_mode)
+        if not self.serial_manager.connect_to_port(port_name, baudrate, team_id, ingest_mode):
+            return False
+        self.judge_transmitter.team_id = team_id
+        self.judge_transmitter.clear()
+        self.source_merger.clear()
+        flight_name = flight_name or f"Uçuş_{int(time.time())}"
+        flight_id = self.database_manager.start_flight(flight_name)
+        if journal is not None:
+            journal.mark(MARK_FLIGHT_START, flight_id=flight_id, name=flight_name)
+        return True
+
+    def add_link(self, role: str, port_name: str, baudrate: int = 9600,
+                 ingest_mode: str = INGEST_JSON) -> bool:
+        """Ek alıcı ('payload', 'stage') ya da hakem çıkışı ('judge') bağlantısı açar"""
+        journal = self._open_journal()
+        if not self.serial_manager.add_link(role, port_name, baudrate, ingest_mode):
+            return False
+        if journal is not None:
+            journal.mark(MARK_LINK, role=role, port=port_name, ingest_mode=ingest_mode)
+        return True
+
+    def remove_link(self, role: str):
+        """Verilen roldeki bağlantıyı kapatır"""
+        self.serial_manager.remove_link(role)
+
+    def disconnect(self):
+        """Bağlantıları keser ve mevcut uçuşu sonlandırır"""
+        self.serial_manager.disconnect_from_port()
+        # Kuyrukta kalan örnekler uçuş kapanmadan işlenmeli
+        if self.ingest_queue is not None:
+            self.ingest_queue.wait_idle(5.0)
+        flight_id = self.database_manager.current_flight_id
+        if flight_id:
+            self.database_manager.end_flight(flight_id)
+        self._close_journal(flight_id)
+
+    def _open_journal(self) -> Optional[RawJournal]:
+        """Günlük etkinse ve açık değilse yeni oturum segmentini açar"""
+        if self.journal is None and self.journal_dir:
+            try:
+                self.journal = RawJournal(self.journal_dir, self.journal_segment_size)
+            except (OSError, ValueError) as e:
+                print(f"Ham günlük açma hatası: {e}")
+                return None
+            self.serial_manager.journal = self.journal
+        return self.journal
+
+    def _close_journal(self, flight_id: Optional[int] = None):
+        """Uçuş bitiş işaretini yazar ve günlüğü kapatır"""
+        journal = self.journal
+        if journal is None:
+            return
+        self.serial_manager.journal = None
+        self.journal = None
+        if flight_id:
+            journal.mark(MARK_FLIGHT_END, flight_id=flight_id)
+        journal.close()
+
+    def shutdown(self):
+        """Gönderimi durdurur, bağlantıları keser ve bekleyen kayıtları yazar"""
+        self.judge_transmitter.stop()
+        # Roket bağlantısı önceden kopmuş ya da örnekler seri port dışından (tekrar
+        # oynatma, simülatör) gelmiş olsa da aktif uçuş kapatılıp özetlenir
+        self.disconnect()
+        if self.ingest_queue is not None:
+            self.ingest_queue.stop()
+        self.database_manager.close()
+
+    def _receive_line(self, line: str, source: str = ROLE_ROCKET):
+        self._receive(True, line, source)
+
+    def _receive_sample(self, data: Dict[str, Any], source: str = ROLE_ROCKET):
+        self._receive(False, data, source)
+
+    def _receive(self, is_line: bool, payload: Any, source: str):
+        """Okunan satırı/örneği alım zamanıyla kuyruğa bırakır ya da doğrudan işler"""
+        metrics = self.metrics
+        item = (is_line, payload, source, time.time(),
+                metrics.read_started_ns if metrics.enabled else 0)
+        if self.ingest_queue is None or not self.ingest_queue.put(item):
+            self._process_item(item)
+
+    def _process_item(self, item):
+        """Kuyruktan gelen öğeyi tam hattan geçirir"""
+        is_line, payload, source, capture_time, read_ns = item
+        if is_line:
+            self.handle_line(payload, source, capture_time)
+        else:
+            self.handle_sample(payload, source, capture_time)
+        metrics = self.metrics
+        if read_ns and source == ROLE_ROCKET and metrics.enabled:
+            metrics.lap(STAGE_INGEST, read_ns)
+
+    def _persist_item(self, item):
+        """
+        Kuyruk politikası gereği atlanan öğeyi yalnızca kaydeder: arayüz, istatistik
+        ve hakem gönderimi bu örnek için yapılmaz.
+        """
+        is_line, payload, source, capture_time, _ = item
+        data = payload
+        if is_line:
+            try:
+                data = json.loads(payload)
+            except json.JSONDecodeError:
+                self.parse_errors += 1
+                return
+        if source != ROLE_ROCKET:
+            self.source_merger.update(source, data)
+            return
+        self.database_manager.log_telemetry(self.source_merger.merge(data), capture_time)
+
+    def handle_line(self, line: str, source: str = ROLE_ROCKET,
+                    capture_time: Optional[float] = None):
+        """Seri porttan gelen JSON satırını ayrıştırır"""
+        metrics = self.metrics
+        if metrics.enabled:
+            started = metrics.clock()
+        try:
+            # JSON verisini parse et
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            self.parse_errors += 1
+            print(f"JSON parse hatası: {line}")
+            return
+        if metrics.enabled:
+            metrics.lap(STAGE_PARSE, started)
+        self.handle_sample(data, source, capture_time)
+
+    def handle_sample(self, data: Dict[str, Any], source: str = ROLE_ROCKET,
+                      capture_time: Optional[float] = None):
+        """Yardımcı kaynakların örneklerini saklar, roket örneklerini birleştirip işler"""
+        if source != ROLE_ROCKET:
+            self.source_merger.update(source, data)
+            return
+        self.process_telemetry(self.source_merger.merge(data), capture_time)
+
+    def process_telemetry(self, data: Dict[str, Any], capture_time: Optional[float] = None):
+        """Telemetri verisini işler (capture_time verilmezse şimdiki zaman kullanılır)"""
+        metrics = self.metrics
+        timed = metrics.enabled
+        if timed:
+            started = lap = metrics.clock()
+        if capture_time is None:
+            capture_time = time.time()
+        database_manager = self.database_manager
+
+        # Veritabanına logla
+        database_manager.log_telemetry(data, capture_time)
+        if timed:
+            lap = metrics.lap(STAGE_LOG, lap)
+
+        # Akan uçuş istatistiklerini, canlı rotayı ve canlı halka tamponu güncelle
+        live_statistics = database_manager.live_statistics
+        if live_statistics:
+            live_statistics.add(data, capture_time)
+        live_track = database_manager.live_track
+        if live_track is not None:
+            live_track.add(database_manager.logged_count - 1, data.get('enlem'), data.get('boylam'))
+        live_buffer = database_manager.live_buffer
+        if live_buffer is not None and database_manager.current_flight_id:
+            live_buffer.append(data, capture_time)
+        if timed:
+            lap = metrics.lap(STAGE_STATISTICS, lap)
+
+        # Dinleyicilere (QML köprüsü, başsız çalıştırıcı) bildir
+        self.telemetry_received.emit(data)
+        if timed:
+            lap = metrics.lap(STAGE_PUBLISH, lap)
+
+        # Hakem yer istasyonuna gönder (roket bağlantısı olmadan, örneğin tekrar
+        # oynatmada, yalnızca hakem çıkışı açık olabilir)
+        if self.judge_transmitter.is_running() and self.serial_manager.has_output():
+            self.judge_transmitter.submit(data)
+            if timed:
+                metrics.lap(STAGE_JUDGE_SUBMIT, lap)
+        if timed:
+            metrics.lap(STAGE_PROCESS, started)
+
+    def stats(self) -> Dict[str, Any]:
+        """Bağlantı, hakem gönderimi ve kayıt sayaçlarını döndürür"""
+        writer = self.database_manager.writer
+        return {
+            'connection': self.serial_manager.get_connection_info(),
+            'sources': self.source_merger.stats(),
+            'judge': self.judge_transmitter.stats(),
+            'ingest': self.ingest_queue.stats() if self.ingest_queue is not None else None,
+            'parse_errors': self.parse_errors,
+            'pending_writes': writer.pending() if writer else 0,
+            'writer': writer.stats() if writer else None,
+            'journal': self.journal.stats() if self.journal is not None else None,
+            'flight_id': self.database_manager.current_flight_id
+        }
@@ -0,0 +1,201 @@
+"""
+Alım Kuyruğu Modülü
+Seri okuma thread'i ile işleme thread'i arasında sınırlı, taşma politikalı aktarım kuyruğu
+"""
+
+import collections
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .pipeline_metrics import PipelineMetrics, STAGE_QUEUE_WAIT
+
+
+# Taşma politikaları
+POLICY_BLOCK = 'block'              # kuyruk doluysa okuyucu yer açılana kadar bekler
+POLICY_DROP_OLDEST = 'drop_oldest'  # kuyruk doluysa en eski öğe yalnızca kaydedilir
+POLICY_KEEP_LATEST = 'keep_latest'  # yalnızca en yeni öğe tam işlenir, öncekiler yalnızca kaydedilir
+
+POLICIES = (POLICY_BLOCK, POLICY_DROP_OLDEST, POLICY_KEEP_LATEST)
+
+
+class IngestQueue:
+    """
+    Okuyucu ile işleyici arasındaki sınırlı aktarım kuyruğu.
+
+    put() okuyucu thread'inden çağrılır ve (block politikası dışında) hiç
+    beklemez. İşçi thread'i öğeleri sırayla handler'a verir. Politika gereği
+    kuyruktan çıkarılan öğeler atılmaz: işçi bunları bir sonraki öğeden önce,
+    yalnızca kalıcı kayıt yapan ucuz persist yoluna verir. Böylece yük altında
+    arayüz, istatistik ve hakem gönderimi örnek atlasa da ham veri kaydı eksiksiz
+    kalır.
+    """
+
+    def __init__(self, handler: Callable[[Any], None],
+                 persist: Optional[Callable[[Any], None]] = None,
+                 max_size: int = 1024, policy: str = POLICY_DROP_OLDEST):
+        if policy not in POLICIES:
+            raise ValueError(f"Bilinmeyen kuyruk politikası: {policy}")
+        self.handler = handler
+        self.persist = persist
+        self.max_size = max(1, max_size)
+        self.policy = policy
+        self.metrics: Optional[PipelineMetrics] = None
+
+        self._queue: collections.deque = collections.deque()
+        self._displaced: List[Any] = []
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._busy = False
+
+        # Sayaçlar
+        self.enqueued_count = 0
+        self.processed_count = 0
+        self.displaced_count = 0
+        self.persisted_count = 0
+        self.blocked_count = 0
+        self.blocked_time = 0.0
+        self.high_water = 0
+
+    def set_policy(self, policy: str):
+        """Taşma politikasını değiştirir"""
+        if policy not in POLICIES:
+            raise ValueError(f"Bilinmeyen kuyruk politikası: {policy}")
+        with self._condition:
+            self.policy = policy
+            self._condition.notify_all()
+
+    def start(self):
+        """İşçi thread'ini başlatır"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Kalan öğeleri işledikten sonra işçi thread'ini durdurur"""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+
+    def put(self, item: Any) -> bool:
+        """Öğeyi kuyruğa bırakır; işçi çalışmıyorsa False döner"""
+        enqueued = time.perf_counter_ns()
+        with self._condition:
+            if not self._running:
+                return False
+            queue = self._queue
+            if self.policy == POLICY_KEEP_LATEST:
+                if queue:
+                    self._displace(queue)
+                    queue.clear()
+            elif len(queue) >= self.max_size:
+                if self.policy == POLICY_BLOCK:
+                    self.blocked_count += 1
+                    blocked = time.monotonic()
+                    while len(queue) >= self.max_size and self._running:
+                        self._condition.wait()
+                    self.blocked_time += time.monotonic() - blocked
+                else:
+                    self._displace((queue.popleft(),))
+            queue.append((enqueued, item))
+            self.enqueued_count += 1
+            if len(queue) > self.high_water:
+                self.high_water = len(queue)
+            self._condition.notify_all()
+        return True
+
+    def _displace(self, entries):
+        """Kuyruktan çıkarılan öğeleri yalnızca kaydedilmek üzere ayırır (kilit altında)"""
+        displaced = self._displaced
+        for _, item in entries:
+            displaced.append(item)
+        self.displaced_count += len(entries)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Kuyruktaki ve ayrılmış tüm öğeler işlenene kadar bekler"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._queue or self._displaced or self._busy:
+                if not self._thread or not self._thread.is_alive():
+                    return False
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def clear(self):
+        """Bekleyen öğeleri kaydederek kuyruğu boşaltır"""
+        with self._condition:
+            self._displace(self._queue)
+            self._queue.clear()
+            self._condition.notify_all()
+
+    def depth(self) -> int:
+        """Kuyrukta bekleyen öğe sayısı"""
+        return len(self._queue)
+
+    def _run(self):
+        """İşçi thread'i: önce ayrılmış öğeleri kaydeder, sonra sıradaki öğeyi işler"""
+        condition = self._condition
+        while True:
+            with condition:
+                while self._running and not self._queue and not self._displaced:
+                    condition.wait()
+                if not self._queue and not self._displaced:
+                    break
+                displaced = self._displaced
+                self._displaced = []
+                entry = self._queue.popleft() if self._queue else None
+                self._busy = True
+                # Bekleyen (block politikasındaki) okuyucuya yer açıldı
+                condition.notify_all()
+
+            if displaced and self.persist:
+                for item in displaced:
+                    try:
+                        self.persist(item)
+                    except Exception as e:
+                        print(f"Alım kuyruğu kayıt hatası: {e}")
+                self.persisted_count += len(displaced)
+
+            if entry is not None:
+                enqueued, item = entry
+                metrics = self.metrics
+                if metrics is not None and metrics.enabled:
+                    metrics.lap(STAGE_QUEUE_WAIT, enqueued)
+                try:
+                    self.handler(item)
+                except Exception as e:
+                    print(f"Alım kuyruğu işleme hatası: {e}")
+                self.processed_count += 1
+
+            with condition:
+                self._busy = False
+                condition.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """Kuyruk sayaçlarını döndürür (blocked_time saniye cinsinden)"""
+        with self._condition:
+            depth = len(self._queue)
+            pending_persist = len(self._displaced)
+        return {
+            'policy': self.policy,
+            'max_size': self.max_size,
+            'depth': depth,
+            'high_water': self.high_water,
+            'enqueued': self.enqueued_count,
+            'processed': self.processed_count,
+            'displaced': self.displaced_count,
+            'persisted_only': self.persisted_count,
+            'pending_persist': pending_persist,
+            'blocked': self.blocked_count,
+            'blocked_time': self.blocked_time
+        }
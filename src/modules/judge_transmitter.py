@@ -0,0 +1,179 @@
+"""
+Hakem Gönderici Modülü
+HYİ paketlerini kendi yazıcı thread'inde, sınırlı kuyruk ve hız ayarıyla gönderir
+"""
+
+import collections
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .pipeline_metrics import PipelineMetrics, STAGE_JUDGE_WAIT, STAGE_JUDGE_WRITE
+from .protocol import HYIPacketEncoder
+
+
+# Kuyruk taşma / gecikme politikaları
+POLICY_LATEST = 'latest'  # her gönderimde en yeni örnek gider, eskiler atılır
+POLICY_FIFO = 'fifo'      # sırayla gönderilir, kuyruk dolunca en eski atılır
+
+
+class JudgeTransmitter:
+    """
+    Hakem yer istasyonu gönderim hattı.
+
+    submit() okuma thread'ini bekletmeden örneği kuyruğa bırakır. Yazıcı
+    thread'i paketleri kodlar, istenen hızda gönderir ve bağlantı geride
+    kaldığında seçilen politikaya göre eski örnekleri atar.
+    """
+
+    def __init__(self, send: Callable[[bytes], bool], team_id: int = 1,
+                 rate_hz: float = 0.0, max_queue_size: int = 16,
+                 policy: str = POLICY_LATEST,
+                 on_sent: Optional[Callable[[int], None]] = None):
+        self._send = send
+        self.team_id = team_id
+        self.policy = policy
+        self.on_sent = on_sent
+        self.encoder = HYIPacketEncoder()
+        self.metrics: Optional[PipelineMetrics] = None
+        self.packet_counter = 0
+
+        self._queue: collections.deque = collections.deque(maxlen=max_queue_size)
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._next_send_time = 0.0
+        self.set_rate(rate_hz)
+
+        # Sayaçlar
+        self.queued_count = 0
+        self.sent_count = 0
+        self.dropped_count = 0
+        self.failed_count = 0
+        self.last_wait = 0.0
+        self.max_wait = 0.0
+        self._total_wait = 0.0
+
+    def set_rate(self, rate_hz: float):
+        """Gönderim hızını ayarlar (0: bekleme olmadan gönder)"""
+        self.rate_hz = max(rate_hz, 0.0)
+        self._interval = 1.0 / self.rate_hz if self.rate_hz else 0.0
+
+    def start(self):
+        """Yazıcı thread'ini başlatır"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """Yazıcı thread'ini durdurur; kuyrukta kalanlar gönderilmez"""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def is_running(self) -> bool:
+        """Yazıcı thread'i çalışıyor mu"""
+        return self._running
+
+    def clear(self):
+        """Bekleyen örnekleri atar"""
+        with self._condition:
+            self.dropped_count += len(self._queue)
+            self._queue.clear()
+
+    def submit(self, data: Dict[str, Any]):
+        """Örneği gönderim kuyruğuna bırakır; kuyruk doluysa en eski örnek atılır"""
+        with self._condition:
+            if len(self._queue) == self._queue.maxlen:
+                self.dropped_count += 1
+            self._queue.append((time.monotonic(), data))
+            self.queued_count += 1
+            self._condition.notify()
+
+    def _take(self):
+        """Gönderim zamanı geldiğinde sıradaki örneği alır (kilit altında çağrılır)"""
+        while self._running:
+            if not self._queue:
+                self._condition.wait()
+                continue
+            delay = self._next_send_time - time.monotonic()
+            if delay > 0:
+                self._condition.wait(delay)
+                continue
+            if self.policy == POLICY_LATEST:
+                item = self._queue.pop()
+                self.dropped_count += len(self._queue)
+                self._queue.clear()
+            else:
+                item = self._queue.popleft()
+            return item
+        return None
+
+    def _run(self):
+        """Yazıcı thread'i: kodlar, hız sınırına uyarak gönderir"""
+        while True:
+            with self._condition:
+                item = self._take()
+            if item is None:
+                break
+
+            enqueued_at, data = item
+            taken_at = time.monotonic()
+            metrics = self.metrics
+            if metrics is not None and not metrics.enabled:
+                metrics = None
+            if metrics is not None:
+                write_started = metrics.clock()
+            if self._interval:
+                # Sabit tempo: programa yetişiliyorsa bir sonraki zaman önceki hedeften
+                # hesaplanır, böylece uyanma gecikmeleri birikmez
+                on_schedule = taken_at - self._next_send_time < self._interval
+                base = self._next_send_time if on_schedule else taken_at
+                self._next_send_time = base + self._interval
+
+            try:
+                packet = self.encoder.encode_telemetry(self.team_id, self.packet_counter, data)
+            except Exception as e:
+                print(f"Hakem paket oluşturma hatası: {e}")
+                self.failed_count += 1
+                continue
+
+            wait = taken_at - enqueued_at
+            if not self._send(packet):
+                self.failed_count += 1
+                continue
+            if metrics is not None:
+                metrics.record(STAGE_JUDGE_WRITE, metrics.clock() - write_started)
+                metrics.record(STAGE_JUDGE_WAIT, int(wait * 1e9))
+
+            self.packet_counter += 1
+            self.sent_count += 1
+            self.last_wait = wait
+            self._total_wait += wait
+            if wait > self.max_wait:
+                self.max_wait = wait
+            if self.on_sent:
+                self.on_sent(self.packet_counter)
+
+    def stats(self) -> Dict[str, Any]:
+        """Gönderim sayaçlarını döndürür (bekleme süreleri saniye cinsinden)"""
+        with self._condition:
+            pending = len(self._queue)
+        return {
+            'rate_hz': self.rate_hz,
+            'policy': self.policy,
+            'pending': pending,
+            'queued': self.queued_count,
+            'sent': self.sent_count,
+            'dropped': self.dropped_count,
+            'failed': self.failed_count,
+            'last_wait': self.last_wait,
+            'avg_wait': self._total_wait / self.sent_count if self.sent_count else 0.0,
+            'max_wait': self.max_wait
+        }
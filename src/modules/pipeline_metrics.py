@@ -0,0 +1,285 @@
+"""
+Hat Ölçüm Modülü
+Telemetri hattının her aşaması için düşük maliyetli kayan gecikme histogramları ve hız sayaçları
+"""
+
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+# Aşama adları
+STAGE_READ = 'read'                   # seri porttan okuma (öğe: bayt)
+STAGE_DECODE = 'decode'               # satırlara bölme / ikili çerçeve çözme (öğe: örnek)
+STAGE_QUEUE_WAIT = 'queue_wait'       # alım kuyruğunda bekleme
+STAGE_PARSE = 'parse'                 # JSON satırı ayrıştırma
+STAGE_LOG = 'log'                     # log_telemetry (write-behind kuyruğuna bırakma)
+STAGE_STATISTICS = 'statistics'       # akan istatistik ve canlı tampon güncellemesi
+STAGE_PUBLISH = 'publish'             # telemetry_received dinleyicileri (QML köprüsü dahil)
+STAGE_JUDGE_SUBMIT = 'judge_submit'   # hakem kuyruğuna bırakma
+STAGE_PROCESS = 'process'             # process_telemetry'nin tamamı
+STAGE_INGEST = 'ingest'               # okumadan işlemenin bitişine kadar uçtan uca
+STAGE_JUDGE_WAIT = 'judge_wait'       # hakem kuyruğunda bekleme
+STAGE_JUDGE_WRITE = 'judge_write'     # HYİ paketini kodlama ve hakem portuna yazma
+STAGE_DB_COMMIT = 'db_commit'         # toplu yazma transaction'ı (öğe: kayıt)
+STAGE_DB_LAG = 'db_lag'               # yakalamadan commit'e kadar geçen süre
+STAGE_UI_PUBLISH = 'ui_publish'       # QML'e yayın (telemetry_updated)
+
+# Histogram kova düzeni: mikrosaniye cinsinden oktav başına 4 alt kova (en fazla %12.5
+# göreli hata); 124 kova 2^32 µs'ye (~71 dakika) kadar karşılar, daha büyük değerler
+# son kovaya düşer. Kova indeksi StageMetrics.record içinde hesaplanır.
+_SUB_BUCKET_BITS = 2
+BUCKET_COUNT = 124
+
+
+def bucket_bounds(index: int):
+    """Kovanın [alt, üst) sınırları (mikrosaniye)"""
+    if index < 4:
+        return index, index + 1
+    shift = (index >> _SUB_BUCKET_BITS) - 1
+    mantissa = (index & 3) + 4
+    return mantissa << shift, (mantissa + 1) << shift
+
+
+class StageMetrics:
+    """
+    Tek bir aşamanın kayan pencereli gecikme histogramı ve sayaçları.
+
+    Kayıtlar geçerli pencereye eklenir; anlık görüntü alınırken pencere süresi
+    dolmuşsa geçerli pencere bir önceki olarak saklanır, böylece görüntü son
+    bir ila iki pencereyi kapsar. Aynı aşama birden fazla thread'den beslenebilir
+    (log ve process aşamaları seri okuyucu, alım kuyruğu, simülatör ve tekrar
+    oynatma thread'lerinden gelir); sayaçlar aşamaya ait bir kilitle korunur.
+    """
+
+    __slots__ = ('name', '_lock', '_counts', '_count', '_items', '_total_ns', '_min_ns',
+                 '_max_ns', '_window_started', '_previous', '_previous_started',
+                 'total_count', 'total_items')
+
+    def __init__(self, name: str, now: float):
+        self.name = name
+        self._lock = threading.Lock()
+        self.total_count = 0
+        self.total_items = 0
+        self._previous = None
+        self._previous_started = now
+        self._start_window(now)
+
+    def _start_window(self, now: float):
+        self._counts = [0] * BUCKET_COUNT
+        self._count = 0
+        self._items = 0
+        self._total_ns = 0
+        self._min_ns = 0
+        self._max_ns = 0
+        self._window_started = now
+
+    def record(self, elapsed_ns: int, items: int = 1):
+        """Bir ölçüm ekler (elapsed_ns: nanosaniye, items: işlenen öğe sayısı)"""
+        microseconds = elapsed_ns // 1000
+        if microseconds < 4:
+            index = microseconds if microseconds > 0 else 0
+        else:
+            shift = microseconds.bit_length() - 3
+            index = (shift << _SUB_BUCKET_BITS) + (microseconds >> shift)
+            if index >= BUCKET_COUNT:
+                index = BUCKET_COUNT - 1
+        with self._lock:
+            self._counts[index] += 1
+            if not self._count or elapsed_ns < self._min_ns:
+                self._min_ns = elapsed_ns
+            self._count += 1
+            self._items += items
+            self._total_ns += elapsed_ns
+            if elapsed_ns > self._max_ns:
+                self._max_ns = elapsed_ns
+
+    def rotate(self, now: float, window: float):
+        """Pencere süresi dolduysa geçerli pencereyi öncekine taşır"""
+        with self._lock:
+            if now - self._window_started < window:
+                return
+            # Pencereler okunurken döndürülür; uzun süre okunmayan bir pencere de kendi
+            # gerçek süresiyle saklanır, böylece hız hesabı doğru kalır
+            self._previous = (self._counts, self._count, self._items, self._total_ns,
+                              self._min_ns, self._max_ns)
+            self._previous_started = self._window_started
+            self.total_count += self._count
+            self.total_items += self._items
+            self._start_window(now)
+
+    def snapshot(self, now: float) -> Dict[str, Any]:
+        """Son pencerelerin yüzdelikleri, ortalaması ve hızı"""
+        with self._lock:
+            counts = list(self._counts)
+            count = self._count
+            items = self._items
+            total_ns = self._total_ns
+            min_ns = self._min_ns
+            max_ns = self._max_ns
+            started = self._window_started
+            previous = self._previous
+            if previous is not None:
+                started = self._previous_started
+            total_count = self.total_count + self._count
+            total_items = self.total_items + self._items
+        if previous is not None and previous[1]:
+            counts = [a + b for a, b in zip(counts, previous[0])]
+            min_ns = min(min_ns, previous[4]) if count else previous[4]
+            max_ns = max(max_ns, previous[5])
+            count += previous[1]
+            items += previous[2]
+            total_ns += previous[3]
+
+        span = now - started
+        # Kova orta noktası, gözlenen en küçük ve en büyük değerin dışına taşmaz
+        low, high = min_ns / 1000, max_ns / 1000
+        return {
+            'count': count,
+            'items': items,
+            'rate': items / span if span > 0 else 0.0,
+            'mean_us': total_ns / count / 1000 if count else 0.0,
+            'p50_us': self._percentile(counts, count, 0.50, low, high),
+            'p90_us': self._percentile(counts, count, 0.90, low, high),
+            'p99_us': self._percentile(counts, count, 0.99, low, high),
+            'min_us': low,
+            'max_us': high,
+            'total_count': total_count,
+            'total_items': total_items
+        }
+
+    @staticmethod
+    def _percentile(counts: List[int], count: int, fraction: float,
+                    low: float, high: float) -> float:
+        """Histogramdan yüzdelik tahmini (kova orta noktası, [low, high] aralığına kırpılır)"""
+        if not count:
+            return 0.0
+        target = fraction * count
+        seen = 0
+        for index, bucket_count in enumerate(counts):
+            seen += bucket_count
+            if bucket_count and seen >= target:
+                bucket_low, bucket_high = bucket_bounds(index)
+                return min(max((bucket_low + bucket_high) / 2, low), high)
+        return 0.0
+
+
+class PipelineMetrics:
+    """
+    Telemetri hattının aşama ölçümleri.
+
+    Hattaki bileşenler (SerialManager, GroundStation, JudgeTransmitter,
+    TelemetryWriter, TelemetryPublisher) enabled açıkken her aşamanın süresini
+    time.perf_counter_ns ile ölçüp record() ile bildirir; kapalıyken saat bile
+    okunmaz. Anlık görüntüler snapshot() ile alınır, start_dump() ile belirli
+    aralıklarla bir dosyaya JSON satırı olarak eklenir.
+    """
+
+    clock = staticmethod(time.perf_counter_ns)
+
+    def __init__(self, enabled: bool = True, window: float = 10.0):
+        self.enabled = enabled
+        self.window = window
+        self.started_at = time.monotonic()
+        self.stages: Dict[str, StageMetrics] = {}
+        self._lock = threading.Lock()
+
+        # Son okumanın zamanı; uçtan uca (ingest) gecikmesi buradan ölçülür
+        self.read_started_ns = 0
+
+        self._dump_stop = threading.Event()
+        self._dump_thread: Optional[threading.Thread] = None
+        self.dump_path: Optional[str] = None
+
+    def stage(self, name: str) -> StageMetrics:
+        """Aşamanın ölçüm nesnesi (ilk kullanımda oluşturulur)"""
+        stage = self.stages.get(name)
+        if stage is None:
+            with self._lock:
+                stage = self.stages.get(name)
+                if stage is None:
+                    stage = StageMetrics(name, time.monotonic())
+                    self.stages[name] = stage
+        return stage
+
+    def record(self, name: str, elapsed_ns: int, items: int = 1):
+        """Aşamaya bir ölçüm ekler"""
+        self.stage(name).record(elapsed_ns, items)
+
+    def lap(self, name: str, since_ns: int) -> int:
+        """since_ns'den bu yana geçen süreyi aşamaya ekler ve şimdiki zamanı döndürür"""
+        now = self.clock()
+        self.stage(name).record(now - since_ns)
+        return now
+
+    def reset(self):
+        """Tüm ölçümleri siler"""
+        with self._lock:
+            self.stages = {}
+        self.started_at = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Tüm aşamaların anlık görüntüsü"""
+        now = time.monotonic()
+        with self._lock:
+            stages = list(self.stages.values())
+        result = {}
+        for stage in stages:
+            stage.rotate(now, self.window)
+            result[stage.name] = stage.snapshot(now)
+        return {
+            'enabled': self.enabled,
+            'window': self.window,
+            'uptime': now - self.started_at,
+            'stages': result
+        }
+
+    def report(self) -> str:
+        """Anlık görüntüyü tablo olarak döndürür"""
+        lines = [f"{'aşama':<14} {'hız/s':>10} {'p50 µs':>9} {'p99 µs':>9} {'max µs':>10}"]
+        for name, stage in sorted(self.snapshot()['stages'].items()):
+            lines.append(
+                f"{name:<14} {stage['rate']:>10.1f} {stage['p50_us']:>9.1f} "
+                f"{stage['p99_us']:>9.1f} {stage['max_us']:>10.1f}"
+            )
+        return "\n".join(lines)
+
+    def start_dump(self, path: str, interval: float = 10.0) -> bool:
+        """Anlık görüntüleri interval saniyede bir dosyaya JSON satırı olarak ekler"""
+        self.stop_dump()
+        try:
+            open(path, "a", encoding="utf-8").close()
+        except OSError as e:
+            print(f"Ölçüm dosyası açma hatası: {e}")
+            return False
+        self.dump_path = path
+        self._dump_stop = threading.Event()
+        self._dump_thread = threading.Thread(
+            target=self._dump_loop, args=(path, max(interval, 0.1), self._dump_stop), daemon=True
+        )
+        self._dump_thread.start()
+        return True
+
+    def stop_dump(self, timeout: float = 1.0):
+        """Dosyaya dökümü durdurur (son bir görüntü yazılır)"""
+        thread = self._dump_thread
+        if thread is None:
+            return
+        self._dump_stop.set()
+        thread.join(timeout)
+        self._dump_thread = None
+        self.dump_path = None
+
+    def _dump_loop(self, path: str, interval: float, stop: threading.Event):
+        while True:
+            stopped = stop.wait(interval)
+            record = self.snapshot()
+            record['time'] = time.time()
+            try:
+                with open(path, "a", encoding="utf-8") as handle:
+                    handle.write(json.dumps(record) + "\n")
+            except OSError as e:
+                print(f"Ölçüm dökümü yazma hatası: {e}")
+            if stopped:
+                return
@@ -4,7 +4,121 @@ Hakem Yer İstasyonu ile haberleşme protokolü
 """
 
 import struct
-from typing import List, Dict, Any
+from typing import List, Dict, Any, NamedTuple, Optional
+
+
+# create_hyi_packet'in ürettiği çerçevenin bayt düzeni:
+#   başlık (4) | takım ID | sayaç | 16 float (irtifa ... ivme_z) | durum | CRC | 0D 0A | 196 bayt sıfır
+# 64 float'lık blok 78 baytlık tampona dilim ataması ile yazıldığından çerçeve 270 bayta
+# uzar ve açı değeri durum/CRC/sonlandırıcı baytlarının altında kalır. Hızlı kodlayıcı
+# bu düzeni bayt bayt korur.
+_FRAME = struct.Struct('<4sBB16fBBBB196x')
+_HEADER = bytes([0xFF, 0xFF, 0x54, 0x52])
+_CRC_OFFSET = 71
+_TRAILER = b'\r\n'
+_TRAILER_OFFSET = 72
+
+# Telemetri sözlüğü anahtarları, çerçevedeki float sırasıyla
+_TELEMETRY_KEYS = (
+    'irtifa', 'gps_irtifa', 'enlem', 'boylam',
+    'gps_irtifa', 'enlem', 'boylam',
+    'gps_irtifa', 'enlem', 'boylam',
+    'jiroskop_x', 'jiroskop_y', 'jiroskop_z',
+    'ivme_x', 'ivme_y', 'ivme_z',
+)
+
+# Görev yükü ve kademe alıcılarından gelen konum anahtarları ve çerçevedeki float
+# indeksleri; bu anahtarlar yoksa yukarıdaki roket konumu kullanılır
+_SOURCE_KEYS = {
+    'payload_gps_irtifa': 4, 'payload_enlem': 5, 'payload_boylam': 6,
+    'stage_gps_irtifa': 7, 'stage_enlem': 8, 'stage_boylam': 9,
+}
+
+
+class HYIFrame(NamedTuple):
+    """Çözülmüş bir HYİ çerçevesi"""
+    team_id: int
+    packet_counter: int
+    altitude: float
+    rocket_gps_altitude: float
+    rocket_latitude: float
+    rocket_longitude: float
+    payload_gps_altitude: float
+    payload_latitude: float
+    payload_longitude: float
+    stage_gps_altitude: float
+    stage_latitude: float
+    stage_longitude: float
+    gyroscope_x: float
+    gyroscope_y: float
+    gyroscope_z: float
+    acceleration_x: float
+    acceleration_y: float
+    acceleration_z: float
+    status: int
+
+
+# CRC kapsamındaki ilk 71 bayt, sekizer baytlık kelimeler halinde tek seferde okunur
+_CRC_WORDS = struct.Struct('<8QIHB')
+
+
+def _frame_crc(buffer) -> int:
+    """Çerçevenin ilk 71 baytının XOR'unu kelime düzeyinde hesaplar"""
+    a, b, c, d, e, f, g, h, i, j, k = _CRC_WORDS.unpack_from(buffer)
+    value = a ^ b ^ c ^ d ^ e ^ f ^ g ^ h ^ i ^ j ^ k
+    value ^= value >> 32
+    value ^= value >> 16
+    value ^= value >> 8
+    return value & 0xFF
+
+
+class HYIPacketEncoder:
+    """
+    Önceden derlenmiş tek bir struct düzeni ve yeniden kullanılan tampon ile
+    HYİ paket kodlayıcı. Çıktısı create_hyi_packet ile bayt bayt aynıdır.
+    Bir örnek tek bir thread'den kullanılmalıdır.
+    """
+    
+    def __init__(self):
+        self._buffer = bytearray(_FRAME.size)
+    
+    @staticmethod
+    def encode_into(buffer, team_id: int, packet_counter: int, values, status: int):
+        """16 float değerini (irtifa ... ivme_z) verilen tampona kodlar"""
+        _FRAME.pack_into(buffer, 0, _HEADER, team_id & 0xFF, packet_counter & 0xFF,
+                         *values, status & 0xFF, 0, 0x0D, 0x0A)
+        buffer[_CRC_OFFSET] = _frame_crc(buffer)
+    
+    def encode(self, team_id: int, packet_counter: int,
+               altitude: float, rocket_gps_altitude: float,
+               rocket_latitude: float, rocket_longitude: float,
+               payload_gps_altitude: float, payload_latitude: float,
+               payload_longitude: float, stage_gps_altitude: float,
+               stage_latitude: float, stage_longitude: float,
+               gyroscope_x: float, gyroscope_y: float, gyroscope_z: float,
+               acceleration_x: float, acceleration_y: float, acceleration_z: float,
+               angle: float, status: int) -> bytes:
+        """create_hyi_packet ile aynı parametrelerle paket oluşturur"""
+        # angle mevcut çerçeve düzeninde yer almaz (bkz. _FRAME açıklaması)
+        self.encode_into(self._buffer, team_id, packet_counter, (
+            altitude, rocket_gps_altitude, rocket_latitude, rocket_longitude,
+            payload_gps_altitude, payload_latitude, payload_longitude,
+            stage_gps_altitude, stage_latitude, stage_longitude,
+            gyroscope_x, gyroscope_y, gyroscope_z,
+            acceleration_x, acceleration_y, acceleration_z
+        ), status)
+        return bytes(self._buffer)
+    
+    def encode_telemetry(self, team_id: int, packet_counter: int, data: Dict[str, Any]) -> bytes:
+        """Telemetri sözlüğünden parse_telemetry_data ara adımı olmadan paket oluşturur"""
+        get = data.get
+        values = [get(key, 0.0) for key in _TELEMETRY_KEYS]
+        if not _SOURCE_KEYS.keys().isdisjoint(data):
+            for key, index in _SOURCE_KEYS.items():
+                if key in data:
+                    values[index] = data[key]
+        self.encode_into(self._buffer, team_id, packet_counter, values, get('durum', 1))
+        return bytes(self._buffer)
 
 
 class HYIProtocol:
@@ -13,6 +127,7 @@ class HYIProtocol:
     HEADER = [0xFF, 0xFF, 0x54, 0x52]
     PACKET_SIZE = 78
     FLOAT_COUNT = 64  # 16 grup x 4 float
+    FRAME_SIZE = _FRAME.size  # create_hyi_packet çıktısının gerçek uzunluğu
     
     @staticmethod
     def pack_floats(float_list: List[float]) -> bytes:
@@ -83,6 +198,17 @@ class HYIProtocol:
         
         return bytes(packet)
     
+    @staticmethod
+    def decode_packet(packet: bytes) -> Optional[HYIFrame]:
+        """Tek bir HYİ paketini doğrular ve çözer; geçersizse None döner"""
+        if len(packet) < _FRAME.size or packet[:4] != _HEADER:
+            return None
+        if packet[_TRAILER_OFFSET:_TRAILER_OFFSET + 2] != _TRAILER:
+            return None
+        if _frame_crc(packet) != packet[_CRC_OFFSET]:
+            return None
+        return HYIFrame(*_FRAME.unpack_from(packet)[1:20])
+    
     @staticmethod
     def parse_telemetry_data(data: Dict[str, Any]) -> Dict[str, float]:
         """Telemetri verisini HYI protokolü için uygun formata çevirir."""
@@ -91,12 +217,12 @@ class HYIProtocol:
             'rocket_gps_altitude': data.get('gps_irtifa', 0.0),
             'rocket_latitude': data.get('enlem', 0.0),
             'rocket_longitude': data.get('boylam', 0.0),
-            'payload_gps_altitude': data.get('gps_irtifa', 0.0),
-            'payload_latitude': data.get('enlem', 0.0),
-            'payload_longitude': data.get('boylam', 0.0),
-            'stage_gps_altitude': data.get('gps_irtifa', 0.0),
-            'stage_latitude': data.get('enlem', 0.0),
-            'stage_longitude': data.get('boylam', 0.0),
+            'payload_gps_altitude': data.get('payload_gps_irtifa', data.get('gps_irtifa', 0.0)),
+            'payload_latitude': data.get('payload_enlem', data.get('enlem', 0.0)),
+            'payload_longitude': data.get('payload_boylam', data.get('boylam', 0.0)),
+            'stage_gps_altitude': data.get('stage_gps_irtifa', data.get('gps_irtifa', 0.0)),
+            'stage_latitude': data.get('stage_enlem', data.get('enlem', 0.0)),
+            'stage_longitude': data.get('stage_boylam', data.get('boylam', 0.0)),
             'gyroscope_x': data.get('jiroskop_x', 0.0),
             'gyroscope_y': data.get('jiroskop_y', 0.0),
             'gyroscope_z': data.get('jiroskop_z', 0.0),
@@ -106,3 +232,117 @@ class HYIProtocol:
             'angle': data.get('aci', 0.0),
             'status': data.get('durum', 1)
         }
+
+
+class HYIFrameDecoder:
+    """
+    Bayt akışından HYİ çerçevelerini ayıklayan eşitleyici.
+
+    FF FF 54 52 başlığını arar; uzunluk, CRC ve 0D 0A sonlandırıcısını doğrular.
+    Okumalar arasında bölünen çerçeveler tamponda bekletilir; bozuk bir
+    başlık adayında bir bayt ilerleyerek yeniden eşitlenir.
+    """
+    
+    FRAME_SIZE = _FRAME.size
+    
+    def __init__(self):
+        self._buffer = bytearray()
+        self._consumed = 0
+        self.frame_count = 0
+        self.crc_errors = 0
+        self.trailer_errors = 0
+        self.skipped_bytes = 0
+    
+    def reset(self):
+        """Tamponu temizler (sayaçlar korunur)"""
+        self._buffer.clear()
+    
+    def _scan(self, data: bytes) -> List[int]:
+        """Yeni baytları ekler ve geçerli çerçevelerin tampon içindeki başlangıçlarını bulur"""
+        buffer = self._buffer
+        buffer += data
+        end = len(buffer)
+        size = self.FRAME_SIZE
+        starts = []
+        pos = 0
+        
+        while True:
+            index = buffer.find(_HEADER, pos)
+            if index < 0:
+                # Tamponun sonu yarım bir başlık olabilir
+                keep = max(pos, end - (len(_HEADER) - 1))
+                self.skipped_bytes += keep - pos
+                pos = keep
+                break
+            
+            self.skipped_bytes += index - pos
+            if index + size > end:
+                pos = index
+                break
+            
+            if buffer[index + _TRAILER_OFFSET:index + _TRAILER_OFFSET + 2] != _TRAILER:
+                self.trailer_errors += 1
+            elif _frame_crc(memoryview(buffer)[index:index + _CRC_OFFSET]) != buffer[index + _CRC_OFFSET]:
+                self.crc_errors += 1
+            else:
+                starts.append(index)
+                self.frame_count += 1
+                pos = index + size
+                continue
+            
+            self.skipped_bytes += 1
+            pos = index + 1
+        
+        self._consumed = pos
+        return starts
+    
+    def feed(self, data: bytes) -> List[HYIFrame]:
+        """Yeni baytları işler ve tamamlanan geçerli çerçeveleri döndürür"""
+        starts = self._scan(data)
+        unpack_from = _FRAME.unpack_from
+        frames = [HYIFrame(*unpack_from(self._buffer, start)[1:20]) for start in starts]
+        del self._buffer[:self._consumed]
+        return frames
+    
+    def feed_array(self, data: bytes):
+        """
+        Yeni baytları işler ve geçerli çerçeveleri toplu olarak NumPy yapılandırılmış
+        dizisine (HYI_DTYPE) çözer. Yüksek hacimli kayıt tekrarları için uygundur.
+        """
+        # numpy yalnızca toplu çözümde gerekir; protokol modülü hafif kalır
+        import numpy as np
+        
+        starts = self._scan(data)
+        raw = np.frombuffer(self._buffer, dtype=np.uint8, count=self._consumed)
+        if starts:
+            offsets = np.asarray(starts)[:, None] + np.arange(self.FRAME_SIZE)
+            frames = raw[offsets].view(hyi_dtype()).reshape(-1)
+        else:
+            frames = np.empty(0, dtype=hyi_dtype())
+        del raw
+        del self._buffer[:self._consumed]
+        return frames
+    
+    def stats(self) -> Dict[str, int]:
+        """Çözücü sayaçlarını döndürür"""
+        return {
+            'frames': self.frame_count,
+            'crc_errors': self.crc_errors,
+            'trailer_errors': self.trailer_errors,
+            'skipped_bytes': self.skipped_bytes
+        }
+
+
+_HYI_DTYPE = None
+
+
+def hyi_dtype():
+    """HYİ çerçevesinin NumPy yapılandırılmış dizi tipi"""
+    global _HYI_DTYPE
+    if _HYI_DTYPE is None:
+        import numpy as np
+        fields = [('header', 'S4'), ('team_id', 'u1'), ('packet_counter', 'u1')]
+        fields += [(name, '<f4') for name in HYIFrame._fields[2:-1]]
+        fields += [('status', 'u1'), ('crc', 'u1'), ('trailer', 'S2'), ('padding', 'V196')]
+        _HYI_DTYPE = np.dtype(fields)
+    return _HYI_DTYPE
@@ -0,0 +1,226 @@
+"""
+Sorgu Servisi Modülü
+Okuma bağlantı havuzu ve geçmiş sorgularının arayüz thread'i dışında çalıştırılması
+"""
+
+import contextlib
+import itertools
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, TYPE_CHECKING
+
+from .signals import Signal
+
+if TYPE_CHECKING:
+    from .database_manager import DatabaseManager
+
+
+# QueryService ile çalıştırılabilen salt okuma DatabaseManager metodları
+READ_QUERIES = frozenset({
+    'get_flight_list',
+    'get_flight_count',
+    'get_logs_for_flight',
+    'get_logs_page',
+    'get_flight_bounds',
+    'get_flight_statistics',
+    'get_flight_data_for_graph',
+    'get_storage_stats',
+    'get_flight_track',
+    'get_flights_in_bounds',
+    'get_tracks_in_bounds',
+})
+
+
+class ReadConnectionPool:
+    """
+    Salt okunur SQLite bağlantı havuzu.
+
+    Okuma metodları her sorguda bağlantı açıp şemayı yeniden ayrıştırmak yerine
+    havuzdan bağlantı alır ve işi bitince geri verir. Havuz boşsa yeni bağlantı
+    açılır (iç içe okumalar hiç beklemez); en fazla max_idle bağlantı saklanır,
+    fazlası kapatılır. Bağlantı aynı anda tek bir thread tarafından kullanılır.
+    """
+
+    def __init__(self, db_path: str, max_idle: int = 4):
+        self.db_path = db_path
+        self.max_idle = max_idle
+        self._idle: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self.opened = 0
+        self.reused = 0
+
+    def acquire(self) -> sqlite3.Connection:
+        """Boştaki bir bağlantıyı ya da yeni açılan bağlantıyı döndürür"""
+        with self._lock:
+            if self._idle:
+                self.reused += 1
+                return self._idle.pop()
+            self.opened += 1
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    def release(self, conn: sqlite3.Connection):
+        """Bağlantıyı havuza geri verir; havuz doluysa ya da kapatıldıysa kapatır"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            conn.close()
+            return
+        with self._lock:
+            if not self._closed and len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    @contextlib.contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Bağlantıyı with bloğu boyunca verir; sorgu hata verse de havuza geri döner"""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self):
+        """Boştaki bağlantıları kapatır; kullanımdakiler geri verildiğinde kapanır"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        """Açılan, yeniden kullanılan ve boştaki bağlantı sayıları"""
+        with self._lock:
+            return {'opened': self.opened, 'reused': self.reused, 'idle': len(self._idle)}
+
+
+class QueryService:
+    """
+    Geçmiş sorgularını işçi thread'lerinde çalıştırır.
+
+    submit() hemen bir istek ID'si döndürür; sonuç işçi thread'inde
+    query_finished(istek_id, sorgu, sonuç) ile, hata query_failed(istek_id,
+    sorgu, mesaj) ile yayınlanır. QML köprüsü bu sinyalleri Qt sinyallerine
+    aktararak sonucu GUI thread'ine taşır. İşçiler bağlantılarını
+    DatabaseManager'ın okuma havuzundan alır; yazıcı thread'i ve canlı alım
+    hiçbir zaman bu sorguları beklemez.
+    """
+
+    # Sinyaller
+    query_finished = Signal(int, str, object)
+    query_failed = Signal(int, str, str)
+
+    _STOP = object()
+
+    def __init__(self, database_manager: "DatabaseManager", workers: int = 2,
+                 max_pending: int = 256):
+        self.database_manager = database_manager
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._ids = itertools.count(1)
+        self._queued: Set[int] = set()
+        self._cancelled: Set[int] = set()
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.failed = 0
+        self.busy_time = 0.0
+
+        self._workers = [
+            threading.Thread(target=self._run, daemon=True) for _ in range(max(1, workers))
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, query: str, *args, callback: Optional[Callable[[int, Any], None]] = None) -> int:
+        """
+        Salt okuma sorgusunu kuyruğa ekler ve istek ID'sini döndürür.
+        Bilinmeyen sorgu ya da dolu kuyrukta -1 döner.
+        """
+        if query not in READ_QUERIES:
+            print(f"Bilinmeyen sorgu: {query}")
+            return -1
+        request_id = next(self._ids)
+        with self._lock:
+            self._queued.add(request_id)
+        try:
+            self._queue.put_nowait((request_id, query, args, callback))
+        except queue.Full:
+            with self._lock:
+                self._queued.discard(request_id)
+            print(f"Sorgu kuyruğu dolu, istek reddedildi: {query}")
+            return -1
+        return request_id
+
+    def cancel(self, request_id: int):
+        """Henüz başlamamış isteği iptal eder (örneğin kullanıcı başka uçuşa geçtiğinde)"""
+        with self._lock:
+            if request_id in self._queued:
+                self._cancelled.add(request_id)
+
+    def pending(self) -> int:
+        """Kuyrukta bekleyen istek sayısı"""
+        return self._queue.qsize()
+
+    def stop(self, timeout: Optional[float] = 2.0):
+        """Bekleyen istekleri bırakır ve işçileri durdurur"""
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        for _ in self._workers:
+            self._queue.put(self._STOP)
+        for worker in self._workers:
+            worker.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """Tamamlanan/başarısız istek sayaçları, kuyruk ve bağlantı havuzu durumu"""
+        return {
+            'completed': self.completed,
+            'failed': self.failed,
+            'pending': self._queue.qsize(),
+            'busy_time': self.busy_time,
+            'connections': self.database_manager.readers.stats()
+        }
+
+    def _run(self):
+        """İşçi thread'i: istekleri sırayla çalıştırır ve sonucu yayınlar"""
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            request_id, query, args, callback = item
+            with self._lock:
+                self._queued.discard(request_id)
+                if request_id in self._cancelled:
+                    self._cancelled.discard(request_id)
+                    continue
+
+            started = time.perf_counter()
+            try:
+                result = getattr(self.database_manager, query)(*args)
+                error = None
+            except Exception as e:
+                print(f"Sorgu hatası ({query}): {e}")
+                error = str(e)
+            with self._lock:
+                self.busy_time += time.perf_counter() - started
+                if error is None:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+            if error is not None:
+                self.query_failed.emit(request_id, query, error)
+                continue
+
+            if callback is not None:
+                try:
+                    callback(request_id, result)
+                except Exception as e:
+                    print(f"Sorgu callback hatası: {e}")
+            self.query_finished.emit(request_id, query, result)
@@ -0,0 +1,429 @@
+"""
+Ham Bayt Günlüğü Modülü
+Alınan her baytı ayrıştırılmadan önce önceden ayrılmış, belleğe eşlenmiş segmentlere
+yazar; çökme ya da ayrıştırıcı düzeltmesi sonrası uçuşu bu günlükten yeniden kurar.
+
+Segment düzeni (küçük uçlu):
+    başlık (64 bayt): sihirli dize, sürüm, başlık boyu, segment no,
+                      monotonik taban (ns), duvar saati tabanı (s)
+    kayıt:            işaret u16, tür u8, kanal u8, uzunluk u32,
+                      monotonik zaman (ns) i64, crc32 u32, veri
+
+Kayıt verisi başlıktan önce yazılır; başlık en son yazıldığı için yarım kalan
+(çökmede kesilen) kayıt okumada işareti ya da CRC'si tutmadığından kuyruk olarak
+atlanır. Ekleme yalnızca bellek kopyasıdır, kayıt başına sistem çağrısı yapılmaz;
+sayfalar arka planda belirli aralıklarla diske itilir (msync).
+"""
+
+import glob
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .binary_telemetry import BinaryFrameDecoder
+from .serial_manager import ROLE_ROCKET, ROLE_PAYLOAD, ROLE_STAGE, ROLE_JUDGE, split_lines
+from .source_merger import SourceMerger
+
+
+SEGMENT_MAGIC = b'HUMBJRNL'
+SEGMENT_VERSION = 1
+SEGMENT_HEADER_SIZE = 64
+_SEGMENT_HEADER = struct.Struct('<8sHHIqd')
+
+RECORD_MARKER = 0x4A52
+_RECORD = struct.Struct('<HBBIqI')
+RECORD_HEADER_SIZE = _RECORD.size
+
+# Kayıt türleri
+KIND_DATA = 1  # alınan ham bayt parçası
+KIND_MARK = 2  # JSON olay işareti (uçuş başlangıcı/bitişi, bağlantı)
+
+# Kanal baytı: alt dört bit rol sırası, üst bit ikili alım kipi
+JOURNAL_ROLES = (ROLE_ROCKET, ROLE_PAYLOAD, ROLE_STAGE, ROLE_JUDGE)
+_ROLE_INDEX = {role: index for index, role in enumerate(JOURNAL_ROLES)}
+_BINARY_FLAG = 0x80
+
+# İşaret olayları
+MARK_CONNECT = 'connect'
+MARK_FLIGHT_START = 'flight_start'
+MARK_FLIGHT_END = 'flight_end'
+MARK_LINK = 'link'
+
+DEFAULT_JOURNAL_DIR = "raw_journal"
+DEFAULT_SEGMENT_SIZE = 64 * 1024 * 1024
+SEGMENT_PATTERN = 'raw_{:06d}.hjr'
+_SEGMENT_NAME = re.compile(r'raw_(\d{6})\.hjr$')
+
+
+def list_segments(directory: str) -> List[str]:
+    """Dizindeki günlük segmentlerini sıra numarasına göre döndürür"""
+    paths = glob.glob(os.path.join(directory, 'raw_*.hjr'))
+    return sorted(path for path in paths if _SEGMENT_NAME.search(path))
+
+
+class RawJournal:
+    """
+    Yalnızca eklenen ham bayt günlüğü.
+
+    Her oturum mevcut segmentlerin ardından yeni bir segmentle başlar. Segment
+    önceden ayrılır (disk dolduğunda yazma sırasında SIGBUS yerine açılışta hata
+    alınır) ve belleğe eşlenir; dolduğunda bir sonrakine geçilir. Kapatılırken
+    dosya kullanılan uzunluğa kısaltılır.
+    """
+
+    def __init__(self, directory: str, segment_size: int = DEFAULT_SEGMENT_SIZE,
+                 sync_interval: float = 1.0):
+        if segment_size < SEGMENT_HEADER_SIZE + RECORD_HEADER_SIZE + 1024:
+            raise ValueError(f"Segment boyutu çok küçük: {segment_size}")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.segment_size = segment_size
+        self.sync_interval = sync_interval
+        self.path: Optional[str] = None
+
+        # Sayaçlar
+        self.records = 0
+        self.bytes_written = 0
+        self.segments = 0
+
+        self._lock = threading.Lock()
+        self._mmap: Optional[mmap.mmap] = None
+        self._position = 0
+        self._dirty = False
+
+        existing = list_segments(directory)
+        self._index = int(_SEGMENT_NAME.search(existing[-1]).group(1)) + 1 if existing else 1
+        self._open_segment()
+
+        self._stop_event = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if sync_interval > 0:
+            self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+            self._flusher.start()
+
+    def _open_segment(self):
+        """Yeni segment dosyasını önceden ayırır, eşler ve başlığını yazar"""
+        path = os.path.join(self.directory, SEGMENT_PATTERN.format(self._index))
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            try:
+                os.posix_fallocate(fd, 0, self.segment_size)
+            except (AttributeError, OSError):
+                # posix_fallocate yoksa ya da dosya sistemi desteklemiyorsa seyrek dosya
+                os.ftruncate(fd, self.segment_size)
+            mm = mmap.mmap(fd, self.segment_size)
+        finally:
+            os.close(fd)
+
+        _SEGMENT_HEADER.pack_into(mm, 0, SEGMENT_MAGIC, SEGMENT_VERSION, SEGMENT_HEADER_SIZE,
+                                  self._index, time.monotonic_ns(), time.time())
+        self._mmap = mm
+        self._position = SEGMENT_HEADER_SIZE
+        self._dirty = True
+        self.path = path
+        self.segments += 1
+
+    def _close_segment(self):
+        """Segmenti diske iter ve kullanılmayan önceden ayrılmış alanı geri verir"""
+        mm = self._mmap
+        if mm is None:
+            return
+        self._mmap = None
+        try:
+            mm.flush()
+        finally:
+            mm.close()
+        try:
+            os.truncate(self.path, self._position)
+        except OSError as e:
+            print(f"Günlük kısaltma hatası: {e}")
+
+    def append(self, role: str, chunk: bytes, binary: bool = False) -> bool:
+        """Okunan ham bayt parçasını alım zamanıyla günlüğe ekler"""
+        channel = _ROLE_INDEX.get(role, 0) | (_BINARY_FLAG if binary else 0)
+        return self._write(KIND_DATA, channel, chunk)
+
+    def mark(self, event: str, **info) -> bool:
+        """Kurtarmada uçuş sınırlarını bulmak için olay işareti ekler"""
+        info['event'] = event
+        info['time'] = time.time()
+        return self._write(KIND_MARK, 0, json.dumps(info).encode())
+
+    def _write(self, kind: int, channel: int, payload: bytes) -> bool:
+        stamp = time.monotonic_ns()
+        length = len(payload)
+        capacity = self.segment_size - SEGMENT_HEADER_SIZE - RECORD_HEADER_SIZE
+        if length > capacity:
+            # Segmente sığmayan parça bölünür; bayt akışı kurtarmada aynen birleşir
+            view = memoryview(payload)
+            return all(self._write(kind, channel, view[start:start + capacity])
+                       for start in range(0, length, capacity))
+
+        with self._lock:
+            if self._mmap is None:
+                return False
+            if self._position + RECORD_HEADER_SIZE + length > self.segment_size:
+                try:
+                    self._close_segment()
+                    self._index += 1
+                    self._open_segment()
+                except OSError as e:
+                    print(f"Günlük segment hatası: {e}")
+                    self._mmap = None
+                    return False
+            mm = self._mmap
+            position = self._position
+            start = position + RECORD_HEADER_SIZE
+            mm[start:start + length] = payload
+            _RECORD.pack_into(mm, position, RECORD_MARKER, kind, channel, length, stamp,
+                              zlib.crc32(payload))
+            self._position = start + length
+            self._dirty = True
+            self.records += 1
+            self.bytes_written += length
+        return True
+
+    def flush(self):
+        """Yazılan sayfaları diske iter"""
+        with self._lock:
+            if self._mmap is None or not self._dirty:
+                return
+            self._dirty = False
+            try:
+                self._mmap.flush()
+            except OSError as e:
+                print(f"Günlük senkronizasyon hatası: {e}")
+
+    def _flush_loop(self):
+        while not self._stop_event.wait(self.sync_interval):
+            self.flush()
+
+    def close(self):
+        """Arka plan senkronizasyonunu durdurur ve segmenti kapatır"""
+        self._stop_event.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=2.0)
+            self._flusher = None
+        with self._lock:
+            self._close_segment()
+
+    def stats(self) -> Dict[str, Any]:
+        """Günlük sayaçlarını döndürür"""
+        with self._lock:
+            return {
+                'path': self.path,
+                'position': self._position,
+                'records': self.records,
+                'bytes': self.bytes_written,
+                'segments': self.segments,
+                'open': self._mmap is not None
+            }
+
+
+class JournalSegment:
+    """
+    Tek bir segmenti okur.
+
+    Kayıtlar (tür, rol, ikili, monotonik_ns, duvar_saati, veri) demetleri olarak
+    üretilir. Okuma sıfır işarette (önceden ayrılmış boş alan) ya da bozuk kayıtta
+    durur; ikinci durumda torn True olur.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.index = 0
+        self.mono_base_ns = 0
+        self.wall_base = 0.0
+        self.valid = False
+        self.torn = False
+        self.end_offset = 0
+        self.file_size = os.path.getsize(path)
+
+        with open(path, 'rb') as f:
+            header = f.read(SEGMENT_HEADER_SIZE)
+        if len(header) < _SEGMENT_HEADER.size:
+            return
+        magic, version, header_size, index, mono_base_ns, wall_base = _SEGMENT_HEADER.unpack_from(header)
+        if magic != SEGMENT_MAGIC or version != SEGMENT_VERSION:
+            return
+        self.index = index
+        self.mono_base_ns = mono_base_ns
+        self.wall_base = wall_base
+        self.header_size = header_size
+        self.valid = True
+
+    def wall_time(self, mono_ns: int) -> float:
+        """Monotonik kayıt zamanını segment tabanına göre duvar saatine çevirir"""
+        return self.wall_base + (mono_ns - self.mono_base_ns) / 1e9
+
+    def __iter__(self) -> Iterator[Tuple[int, str, bool, int, float, bytes]]:
+        if not self.valid:
+            return
+        with open(self.path, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            size = len(data)
+            position = self.header_size
+            roles = JOURNAL_ROLES
+            while position + RECORD_HEADER_SIZE <= size:
+                marker, kind, channel, length, stamp, crc = _RECORD.unpack_from(data, position)
+                if marker != RECORD_MARKER:
+                    # Sıfır işaret kullanılmamış alandır; başka bir değer bozulmadır
+                    self.torn = marker != 0 or any(data[position:position + RECORD_HEADER_SIZE])
+                    break
+                start = position + RECORD_HEADER_SIZE
+                payload = data[start:start + length]
+                if len(payload) != length or zlib.crc32(payload) != crc:
+                    self.torn = True
+                    break
+                role = roles[channel & 0x0F] if (channel & 0x0F) < len(roles) else ROLE_ROCKET
+                yield (kind, role, bool(channel & _BINARY_FLAG), stamp, self.wall_time(stamp),
+                       payload)
+                position = start + length
+            self.end_offset = position
+        finally:
+            data.close()
+
+
+def iter_journal(paths: Iterable[str]) -> Iterator[Tuple[int, str, bool, int, float, bytes]]:
+    """Segmentlerdeki kayıtları sırayla üretir"""
+    for path in paths:
+        yield from JournalSegment(path)
+
+
+def read_mark(payload: bytes) -> Dict[str, Any]:
+    """İşaret kaydının JSON içeriğini çözer"""
+    try:
+        return json.loads(payload)
+    except (ValueError, UnicodeDecodeError):
+        return {}
+
+
+def scan_journal(directory: str) -> List[Dict[str, Any]]:
+    """Her segment için kayıt, bayt, zaman aralığı, işaret ve kuyruk durumunu özetler"""
+    summaries = []
+    for path in list_segments(directory):
+        segment = JournalSegment(path)
+        summary = {
+            'path': path,
+            'index': segment.index,
+            'valid': segment.valid,
+            'records': 0,
+            'bytes': {},
+            'first_time': None,
+            'last_time': None,
+            'marks': [],
+            'torn': False,
+            'file_size': segment.file_size,
+            'end_offset': 0
+        }
+        for kind, role, binary, stamp, wall_time, payload in segment:
+            summary['records'] += 1
+            if summary['first_time'] is None:
+                summary['first_time'] = wall_time
+            summary['last_time'] = wall_time
+            if kind == KIND_DATA:
+                summary['bytes'][role] = summary['bytes'].get(role, 0) + len(payload)
+            elif kind == KIND_MARK:
+                summary['marks'].append(read_mark(payload))
+        summary['torn'] = segment.torn
+        summary['end_offset'] = segment.end_offset
+        summaries.append(summary)
+    return summaries
+
+
+def _flight_records(paths: Iterable[str], flight_id: Optional[int], result: Dict[str, Any]):
+    """
+    Veri kayıtlarından uçuşa ait olanları üretir. Bağlantı işaretinden uçuş ID'sini
+    taşıyan başlangıç işaretine kadar okunan kayıtlar bekletilir ve uçuş eşleşirse
+    başa eklenir; bitiş işareti yoksa (çökme) bir sonraki oturuma kadar okunur.
+    """
+    active = flight_id is None
+    pending: Optional[list] = None
+    for path in paths:
+        segment = JournalSegment(path)
+        for record in segment:
+            if record[0] == KIND_DATA:
+                if active:
+                    yield record
+                elif pending is not None:
+                    pending.append(record)
+                continue
+            if flight_id is None:
+                continue
+
+            mark = read_mark(record[5])
+            event = mark.get('event')
+            matches = mark.get('flight_id') == flight_id
+            if active and (event == MARK_CONNECT or (event == MARK_FLIGHT_START and not matches)
+                           or (event == MARK_FLIGHT_END and matches)):
+                return
+            if event == MARK_CONNECT:
+                pending = []
+            elif event == MARK_FLIGHT_START:
+                if matches:
+                    active = True
+                    yield from pending or ()
+                pending = None
+        result['torn'] = result['torn'] or segment.torn
+
+
+def reingest_journal(paths: Iterable[str], database_manager, flight_name: str,
+                     flight_id: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Günlükteki ham baytları canlı hat ile aynı bölme, çözme ve kaynak birleştirme
+    adımlarından geçirip yeni bir uçuş olarak kaydeder.
+
+    flight_id verilirse yalnızca günlük işaretlerine göre o uçuşa ait kayıtlar,
+    verilmezse tüm veri alınır. Örnek zamanı olarak kaydın alım anı kullanılır.
+    """
+    result = {'flight_id': -1, 'records': 0, 'bytes': 0, 'samples': 0, 'parse_errors': 0,
+              'torn': False}
+    merger = SourceMerger(primary=ROLE_ROCKET)
+    line_buffers: Dict[str, bytearray] = {}
+    decoders: Dict[str, BinaryFrameDecoder] = {}
+
+    def ingest(role: str, sample: Dict[str, Any], mono_time: float, capture_time: float):
+        if role != ROLE_ROCKET:
+            merger.update(role, sample, receive_time=mono_time)
+            return
+        database_manager.log_telemetry(merger.merge(sample, now=mono_time), capture_time)
+        result['samples'] += 1
+
+    for kind, role, binary, stamp, wall_time, payload in _flight_records(paths, flight_id, result):
+        if result['flight_id'] < 0:
+            result['flight_id'] = database_manager.start_flight(flight_name)
+            if result['flight_id'] < 0:
+                return result
+        result['records'] += 1
+        result['bytes'] += len(payload)
+        mono_time = stamp / 1e9
+
+        if binary:
+            decoder = decoders.get(role)
+            if decoder is None:
+                decoder = decoders[role] = BinaryFrameDecoder()
+            for sample in decoder.feed(payload):
+                ingest(role, sample, mono_time, wall_time)
+            continue
+
+        buffer = line_buffers.get(role)
+        if buffer is None:
+            buffer = line_buffers[role] = bytearray()
+        for line in split_lines(buffer, payload):
+            try:
+                sample = json.loads(line)
+            except json.JSONDecodeError:
+                result['parse_errors'] += 1
+                continue
+            ingest(role, sample, mono_time, wall_time)
+
+    if result['flight_id'] >= 0:
+        database_manager.end_flight(result['flight_id'])
+    return result
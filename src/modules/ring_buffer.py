@@ -0,0 +1,146 @@
+"""
+Halka Tampon Modülü
+Canlı uçuş için kanal başına önceden ayrılmış, sabit kapasiteli NumPy tamponu
+"""
+
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .telemetry_schema import FIELD_NAMES, numeric_value
+
+
+class TelemetryRingBuffer:
+    """
+    Telemetri kanalları için sabit kapasiteli halka tampon.
+
+    Her değer dizide iki kez (i ve i + capacity konumlarına) yazılır; böylece
+    kapasiteyi aşmayan her pencere kopyasız, bitişik bir dilim olarak okunur.
+    Dilimler bir sonraki append çağrısına kadar geçerlidir.
+    """
+
+    def __init__(self, capacity: int = 60000, fields: Iterable[str] = FIELD_NAMES):
+        self.capacity = capacity
+        self.fields = tuple(fields)
+        self._times = np.zeros(2 * capacity, dtype=np.float64)
+        self._sequences = np.zeros(2 * capacity, dtype=np.int64)
+        self._channels = {
+            field: np.full(2 * capacity, np.nan, dtype=np.float64) for field in self.fields
+        }
+        self._lock = threading.Lock()
+        self._head = 0
+        self._count = 0
+        self.total_appended = 0
+
+    def clear(self):
+        """Tamponu yeni bir uçuş için sıfırlar (bellek yeniden ayrılmaz)"""
+        with self._lock:
+            self._head = 0
+            self._count = 0
+            self.total_appended = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, data: Dict[str, Any], capture_time: float):
+        """Bir telemetri örneğini ekler; sayıya çevrilemeyen ya da eksik alanlar NaN yazılır"""
+        with self._lock:
+            i = self._head
+            j = i + self.capacity
+            self._times[i] = self._times[j] = capture_time
+            self._sequences[i] = self._sequences[j] = self.total_appended
+            for field, channel in self._channels.items():
+                value = numeric_value(data.get(field))
+                channel[i] = channel[j] = np.nan if value is None else value
+            self._head = (i + 1) % self.capacity
+            if self._count < self.capacity:
+                self._count += 1
+            self.total_appended += 1
+
+    def _window_bounds(self, count: Optional[int], seconds: Optional[float]) -> Tuple[int, int]:
+        """Son count örneğin ya da son seconds saniyenin dizi sınırları (kilit altında çağrılır)"""
+        end = self._head + self.capacity
+        n = self._count if count is None else min(count, self._count)
+        start = end - n
+        if seconds is not None and n:
+            cutoff = self._times[end - 1] - seconds
+            start += int(np.searchsorted(self._times[start:end], cutoff, side='left'))
+        return start, end
+
+    @staticmethod
+    def _view(array: np.ndarray, start: int, end: int) -> np.ndarray:
+        view = array[start:end]
+        view.flags.writeable = False
+        return view
+
+    def window(self, field: str, count: Optional[int] = None,
+               seconds: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Son pencere için (sıra, zaman, değer) dizilerini kopyasız ve salt okunur döndürür.
+        Dönen dilimler sonraki append ile değişebilir; saklanacaksa kopyalanmalıdır.
+        """
+        with self._lock:
+            start, end = self._window_bounds(count, seconds)
+            return (self._view(self._sequences, start, end),
+                    self._view(self._times, start, end),
+                    self._view(self._channels[field], start, end))
+
+    def graph_data(self, field: str, max_points: int = 0, count: Optional[int] = None,
+                   seconds: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Son pencerenin grafik noktalarını min/max seyreltmesiyle döndürür"""
+        with self._lock:
+            start, end = self._window_bounds(count, seconds)
+            sequences = self._sequences[start:end]
+            times = self._times[start:end]
+            values = self._channels[field][start:end]
+            valid = ~np.isnan(values)
+            if not valid.all():
+                sequences, times, values = sequences[valid], times[valid], values[valid]
+            indices = self._min_max_indices(values, max_points)
+            if indices is not None:
+                sequences, times, values = sequences[indices], times[indices], values[indices]
+            return [
+                {'x': x, 'y': y, 'timestamp': t}
+                for x, t, y in zip(sequences.tolist(), times.tolist(), values.tolist())
+            ]
+
+    @staticmethod
+    def _min_max_indices(values: np.ndarray, max_points: int) -> Optional[np.ndarray]:
+        """Kova başına min ve max indekslerini vektörel olarak hesaplar"""
+        n = len(values)
+        buckets = max_points // 2
+        if max_points <= 0 or n <= max_points or buckets == 0:
+            return None
+        size = n // buckets
+        remainder = n - size * buckets
+        # Kovalara tam bölünmeyen en eski örnekler ilk kovaya katılır; ilk ve son nokta
+        # her zaman korunur, böylece çizgi pencerenin iki ucuna da uzanır
+        first = values[:size + remainder]
+        shaped = values[size + remainder:].reshape(buckets - 1, size)
+        offsets = np.arange(1, buckets) * size + remainder
+        lows = offsets + shaped.argmin(axis=1)
+        highs = offsets + shaped.argmax(axis=1)
+        indices = np.unique(np.concatenate((
+            [0, first.argmin(), first.argmax()], lows, highs, [n - 1]
+        )))
+        return indices
+
+    def statistics(self, field: str, count: Optional[int] = None,
+                   seconds: Optional[float] = None) -> Dict[str, Any]:
+        """Son pencere için sayı/min/max/ortalama/std döndürür"""
+        with self._lock:
+            start, end = self._window_bounds(count, seconds)
+            values = self._channels[field][start:end]
+            valid = values[~np.isnan(values)]
+            if not len(valid):
+                return {'count': 0}
+            duration = float(self._times[end - 1] - self._times[start])
+            return {
+                'count': int(len(valid)),
+                'min': float(valid.min()),
+                'max': float(valid.max()),
+                'avg': float(valid.mean()),
+                'std': float(valid.std(ddof=1)) if len(valid) > 1 else 0.0,
+                'duration': duration
+            }
@@ -1,112 +1,494 @@
 """
 Seri Port Yönetimi Modülü
-Seri port bağlantısı ve veri okuma/yazma işlemleri
+Seri port bağlantıları ve veri okuma/yazma işlemleri
 """
 
+import collections
+import os
+import selectors
+import socket
 import serial
 import serial.tools.list_ports
 import threading
 import time
-from typing import List, Optional, Callable
-from PyQt5.QtCore import QObject, pyqtSignal
+from typing import Any, Dict, List, Optional, Callable, TYPE_CHECKING
 
+from .binary_telemetry import BinaryFrameDecoder
+from .pipeline_metrics import PipelineMetrics, STAGE_READ, STAGE_DECODE
+from .signals import Signal
+
+if TYPE_CHECKING:
+    from .raw_journal import RawJournal
+
+
+# Veri alım kipleri
+INGEST_JSON = 'json'
+INGEST_BINARY = 'binary'
+
+# Bağlantı rolleri
+ROLE_ROCKET = 'rocket'    # roket alıcısı (ana telemetri kaynağı)
+ROLE_PAYLOAD = 'payload'  # görev yükü alıcısı
+ROLE_STAGE = 'stage'      # ayrılan kademe alıcısı
+ROLE_JUDGE = 'judge'      # hakem yer istasyonu çıkışı (yalnızca yazma)
+
+# Seçici kullanılamayan platformlarda (Windows) yoklama aralığı
+POLL_INTERVAL = 0.002
+
+# Satır sonu gelmeden biriken en fazla bayt (bozuk hatta tamponun şişmemesi için)
+MAX_LINE_LENGTH = 65536
+
+
+def split_lines(buffer: bytearray, chunk: bytes) -> List[str]:
+    """
+    Parçayı satır tamponuna ekler ve tamamlanan boş olmayan satırları döndürür.
+    Canlı okuma ve ham günlükten yeniden alım aynı bölmeyi kullanır.
+    """
+    buffer += chunk
+    end = buffer.rfind(b'\n')
+    if end < 0:
+        if len(buffer) > MAX_LINE_LENGTH:
+            buffer.clear()
+        return []
+
+    lines = [
+        line.decode(errors="ignore").strip()
+        for line in bytes(buffer[:end]).split(b'\n')
+    ]
+    del buffer[:end + 1]
+    return [line for line in lines if line]
+
+
+class SerialLink:
+    """Tek bir seri bağlantı: port, rol ve alım kipine özgü çözücü durumu"""
+
+    def __init__(self, role: str, port: serial.Serial, ingest_mode: str = INGEST_JSON):
+        self.role = role
+        self.port = port
+        self.ingest_mode = ingest_mode
+        self.binary_decoder = BinaryFrameDecoder()
+        self.write_lock = threading.Lock()
+        self._line_buffer = bytearray()
+
+        # Sayaçlar
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self.lines_received = 0
+
+    def fileno(self) -> int:
+        return self.port.fileno()
+
+    def read_available(self) -> bytes:
+        """Bekleyen tüm baytları engellemeden okur"""
+        return self.port.read(self.port.in_waiting or 1)
+
+    def split_lines(self, chunk: bytes) -> List[str]:
+        """Parçayı satır tamponuna ekler ve tamamlanan boş olmayan satırları döndürür"""
+        lines = split_lines(self._line_buffer, chunk)
+        self.lines_received += len(lines)
+        return lines
+
+    def close(self):
+        """Portu kapatır"""
+        try:
+            # Başka bir thread'deki yazma bitmeden port kapatılmaz
+            with self.write_lock:
+                if self.port.is_open:
+                    self.port.close()
+        except Exception as e:
+            print(f"Port kapatma hatası ({self.role}): {e}")
+
+    def info(self) -> Dict[str, Any]:
+        """Bağlantı bilgilerini ve sayaçlarını döndürür"""
+        info = {
+            'role': self.role,
+            'port': self.port.port,
+            'baudrate': self.port.baudrate,
+            'ingest_mode': self.ingest_mode,
+            'connected': self.port.is_open,
+            'bytes_received': self.bytes_received,
+            'bytes_sent': self.bytes_sent,
+            'lines': self.lines_received
+        }
+        if self.ingest_mode == INGEST_BINARY:
+            info['binary_stats'] = self.binary_decoder.stats()
+        return info
+
+
+class SerialManager:
+    """
+    Seri port yönetimi sınıfı.
+
+    Roket, görev yükü, kademe alıcıları ve hakem çıkışı gibi birden fazla
+    bağlantıyı yönetir. Tüm alıcı bağlantılar tek bir G/Ç thread'inde,
+    seçici (selectors) ile bekleyen portlar okunarak servis edilir; bağlantı
+    sayısı arttıkça thread sayısı artmaz. Callback'ler örneği hangi bağlantının
+    ürettiğini (rolü) ikinci argüman olarak alır. Sinyaller Qt gerektirmez ve
+    emit eden thread'de çağrılır.
+    """
 
-class SerialManager(QObject):
-    """Seri port yönetimi sınıfı"""
-    
     # Sinyaller
-    data_received = pyqtSignal(str)
-    connection_status_changed = pyqtSignal(bool, str)
-    port_list_changed = pyqtSignal(list)
-    
+    data_received = Signal(str)
+    connection_status_changed = Signal(bool, str)
+    link_status_changed = Signal(str, bool, str)
+    port_list_changed = Signal(list)
+
     def __init__(self):
-        super().__init__()
-        self.serial_port: Optional[serial.Serial] = None
+        self.links: Dict[str, SerialLink] = {}
         self.running = False
         self.team_id = 1
         self.packet_counter = 0
         self.data_callback: Optional[Callable] = None
-        
+        self.sample_callback: Optional[Callable] = None
+
+        # Aşama ölçümleri (GroundStation tarafından atanır)
+        self.metrics: Optional[PipelineMetrics] = None
+
+        # Ham bayt günlüğü: okunan her parça çözülmeden önce buraya yazılır
+        self.journal: Optional["RawJournal"] = None
+
+        self._links_lock = threading.Lock()
+        self._loop_thread: Optional[threading.Thread] = None
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._pending: collections.deque = collections.deque()
+        self._wakeup_reader: Optional[socket.socket] = None
+        self._wakeup_writer: Optional[socket.socket] = None
+
+    @property
+    def serial_port(self) -> Optional[serial.Serial]:
+        """Roket bağlantısının portu (geriye uyumluluk için)"""
+        link = self.links.get(ROLE_ROCKET)
+        return link.port if link else None
+
+    @property
+    def ingest_mode(self) -> str:
+        link = self.links.get(ROLE_ROCKET)
+        return link.ingest_mode if link else INGEST_JSON
+
+    @property
+    def binary_decoder(self) -> Optional[BinaryFrameDecoder]:
+        link = self.links.get(ROLE_ROCKET)
+        return link.binary_decoder if link else None
+
     def get_available_ports(self) -> List[str]:
         """Kullanılabilir seri portları listeler"""
         ports = []
         for port in serial.tools.list_ports.comports():
             ports.append(port.device)
         return ports
-    
-    def connect_to_port(self, port_name: str, baudrate: int = 9600, 
-                       team_id: int = 1) -> bool:
-        """Seri porta bağlanır"""
+
+    def connect_to_port(self, port_name: str, baudrate: int = 9600,
+                       team_id: int = 1, ingest_mode: str = INGEST_JSON) -> bool:
+        """
+        Roket alıcısının seri portuna bağlanır.
+        ingest_mode 'json' (satır başına JSON) ya da 'binary' (ikili çerçeve) olabilir.
+        """
         try:
-            self.serial_port = serial.Serial(port_name, baudrate, timeout=1)
-            self.team_id = team_id
-            self.running = True
-            
-            # Okuma thread'ini başlat
-            threading.Thread(target=self._read_serial, daemon=True).start()
-            
-            self.connection_status_changed.emit(
-                True, f"{port_name} portuna bağlandı ({baudrate} baud)"
-            )
-            return True
-            
+            self._open_link(ROLE_ROCKET, port_name, baudrate, ingest_mode)
         except Exception as e:
             self.connection_status_changed.emit(False, f"Bağlantı hatası: {e}")
             return False
-    
+
+        self.team_id = team_id
+        self.connection_status_changed.emit(
+            True, f"{port_name} portuna bağlandı ({baudrate} baud)"
+        )
+        return True
+
+    def add_link(self, role: str, port_name: str, baudrate: int = 9600,
+                 ingest_mode: str = INGEST_JSON) -> bool:
+        """
+        Ek bir bağlantı açar (ör. 'payload', 'stage' alıcısı ya da 'judge' çıkışı).
+        Aynı roldeki önceki bağlantı kapatılır.
+        """
+        try:
+            self._open_link(role, port_name, baudrate, ingest_mode)
+        except Exception as e:
+            self.link_status_changed.emit(role, False, f"Bağlantı hatası: {e}")
+            return False
+
+        self.link_status_changed.emit(
+            role, True, f"{port_name} portuna bağlandı ({baudrate} baud)"
+        )
+        return True
+
+    def remove_link(self, role: str):
+        """Verilen roldeki bağlantıyı kapatır"""
+        with self._links_lock:
+            link = self.links.pop(role, None)
+        if link:
+            self._release_link(link)
+            self.link_status_changed.emit(role, False, "Bağlantı kesildi")
+
+    def _open_link(self, role: str, port_name: str, baudrate: int, ingest_mode: str):
+        """Portu engellemeyen kipte açar ve bağlantıyı G/Ç döngüsüne ekler"""
+        port = serial.Serial(port_name, baudrate, timeout=0, write_timeout=1)
+        link = SerialLink(role, port, ingest_mode)
+        with self._links_lock:
+            previous = self.links.get(role)
+            self.links[role] = link
+        if previous:
+            self._release_link(previous)
+
+        # Hakem çıkışı yalnızca yazılır, okuma döngüsüne eklenmez
+        if role != ROLE_JUDGE:
+            self._ensure_loop()
+            self._schedule('add', link)
+
+    def _release_link(self, link: SerialLink):
+        """Bağlantıyı döngüden çıkarır ve kapatır"""
+        if self._selector is not None and self._loop_alive():
+            # Seçiciden çıkarma ve kapatma döngü thread'inde yapılır
+            self._schedule('remove', link)
+        else:
+            link.close()
+
     def disconnect_from_port(self):
-        """Seri port bağlantısını keser"""
-        self.running = False
-        if self.serial_port and self.serial_port.is_open:
-            self.serial_port.close()
+        """Tüm seri port bağlantılarını keser"""
+        with self._links_lock:
+            links = list(self.links.values())
+            self.links.clear()
+        self._stop_loop()
+        for link in links:
+            link.close()
         self.connection_status_changed.emit(False, "Bağlantı kesildi")
-    
-    def send_data(self, data: bytes) -> bool:
-        """Seri porta veri gönderir"""
-        if self.serial_port and self.serial_port.is_open:
+
+    def send_data(self, data: bytes, role: Optional[str] = None) -> bool:
+        """
+        Seri porta veri gönderir. Rol verilmezse hakem bağlantısı varsa ona,
+        yoksa roket bağlantısına yazılır.
+        """
+        if role is None:
+            link = self.links.get(ROLE_JUDGE) or self.links.get(ROLE_ROCKET)
+        else:
+            link = self.links.get(role)
+        if link is None:
+            return False
+
+        try:
+            with link.write_lock:
+                if not link.port.is_open:
+                    return False
+                link.port.write(data)
+            link.bytes_sent += len(data)
+            return True
+        except Exception as e:
+            print(f"Veri gönderme hatası: {e}")
+            return False
+
+    def has_output(self, role: Optional[str] = None) -> bool:
+        """send_data() ile aynı seçimle yazılabilecek açık bir bağlantı var mı"""
+        if role is None:
+            link = self.links.get(ROLE_JUDGE) or self.links.get(ROLE_ROCKET)
+        else:
+            link = self.links.get(role)
+        return link is not None and link.port is not None and link.port.is_open
+
+    def _loop_alive(self) -> bool:
+        return self._loop_thread is not None and self._loop_thread.is_alive()
+
+    def _ensure_loop(self):
+        """G/Ç döngüsü çalışmıyorsa başlatır"""
+        if self._loop_alive():
+            return
+
+        self._pending.clear()
+        if os.name == 'posix':
+            self._selector = selectors.DefaultSelector()
+            self._wakeup_reader, self._wakeup_writer = socket.socketpair()
+            self._wakeup_reader.setblocking(False)
+            self._wakeup_writer.setblocking(False)
+            self._selector.register(self._wakeup_reader, selectors.EVENT_READ, None)
+        else:
+            # Windows'ta seri port tutamaçları seçiciye eklenemez; yoklama kullanılır
+            self._selector = None
+
+        self.running = True
+        self._loop_thread = threading.Thread(target=self._read_serial, daemon=True)
+        self._loop_thread.start()
+
+    def _stop_loop(self, timeout: float = 1.0):
+        """G/Ç döngüsünü durdurur ve thread'in bitmesini bekler"""
+        self.running = False
+        self._wakeup()
+        thread = self._loop_thread
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._loop_thread = None
+
+    def _schedule(self, operation: str, link: SerialLink):
+        """Seçici değişikliğini döngü thread'ine iletir"""
+        self._pending.append((operation, link))
+        self._wakeup()
+
+    def _wakeup(self):
+        """select() beklemesini keser"""
+        if self._wakeup_writer is not None:
             try:
-                self.serial_port.write(data)
-                return True
-            except Exception as e:
-                print(f"Veri gönderme hatası: {e}")
-                return False
-        return False
-    
+                self._wakeup_writer.send(b'\0')
+            except (BlockingIOError, OSError):
+                pass
+
     def _read_serial(self):
-        """Seri porttan veri okuma thread'i"""
-        while self.running:
-            try:
-                if not self.serial_port or not self.serial_port.is_open:
-                    print("Seri port kapalı, okuma thread'i sonlandırılıyor.")
+        """Tüm alıcı bağlantıları tek thread'de servis eden G/Ç döngüsü"""
+        if self._selector is None:
+            self._poll_links()
+            return
+
+        selector = self._selector
+        try:
+            while self.running:
+                self._apply_pending(selector)
+                try:
+                    events = selector.select(timeout=0.5)
+                except Exception as e:
+                    print(f"Seri okuma hatası: {e}")
                     break
-                    
-                line = self.serial_port.readline().decode(errors="ignore").strip()
-                if line:
-                    self.data_received.emit(line)
-                    
+
+                for key, _ in events:
+                    link = key.data
+                    if link is None:
+                        self._drain_wakeup()
+                    else:
+                        self._service_link(link)
+        finally:
+            self._apply_pending(selector)
+            selector.close()
+            self._wakeup_reader.close()
+            self._wakeup_writer.close()
+            self._wakeup_reader = self._wakeup_writer = None
+
+    def _apply_pending(self, selector: selectors.BaseSelector):
+        """Bekleyen ekleme/çıkarma işlemlerini uygular (döngü thread'inde çağrılır)"""
+        while self._pending:
+            operation, link = self._pending.popleft()
+            if operation == 'add' and self.running:
+                try:
+                    selector.register(link.fileno(), selectors.EVENT_READ, link)
+                except Exception as e:
+                    print(f"Seri port döngüye eklenemedi ({link.role}): {e}")
+            else:
+                try:
+                    selector.unregister(link.fileno())
+                except (KeyError, ValueError):
+                    pass
+                link.close()
+
+    def _drain_wakeup(self):
+        try:
+            while self._wakeup_reader.recv(4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _poll_links(self):
+        """Seçicisiz döngü: bağlantıları sırayla yoklar, boşta kısa süre uyur"""
+        while self.running:
+            idle = True
+            for link in list(self.links.values()):
+                if link.role == ROLE_JUDGE:
+                    continue
+                try:
+                    waiting = link.port.in_waiting
+                except Exception:
+                    self._service_link(link)
+                    continue
+                if waiting:
+                    idle = False
+                    self._service_link(link)
+            if idle:
+                time.sleep(POLL_INTERVAL)
+
+    def _service_link(self, link: SerialLink):
+        """Hazır bağlantıdan bekleyen baytları okur ve kipine göre çözer"""
+        metrics = self.metrics
+        if metrics is not None and not metrics.enabled:
+            metrics = None
+        if metrics is not None:
+            read_started = metrics.clock()
+        try:
+            chunk = link.read_available()
+        except Exception as e:
+            print(f"Seri okuma hatası ({link.role}): {e}")
+            self._drop_link(link)
+            return
+        if not chunk:
+            return
+
+        link.bytes_received += len(chunk)
+        role = link.role
+        journal = self.journal
+        if journal is not None:
+            journal.append(role, chunk, link.ingest_mode == INGEST_BINARY)
+        if metrics is not None:
+            decode_started = metrics.clock()
+            metrics.record(STAGE_READ, decode_started - read_started, len(chunk))
+            metrics.read_started_ns = read_started
+        try:
+            if link.ingest_mode == INGEST_BINARY:
+                samples = link.binary_decoder.feed(chunk)
+                if metrics is not None:
+                    metrics.record(STAGE_DECODE, metrics.clock() - decode_started, len(samples))
+                if self.sample_callback:
+                    for sample in samples:
+                        self.sample_callback(sample, role)
+            else:
+                lines = link.split_lines(chunk)
+                if metrics is not None:
+                    metrics.record(STAGE_DECODE, metrics.clock() - decode_started, len(lines))
+                for line in lines:
+                    if role == ROLE_ROCKET:
+                        self.data_received.emit(line)
+
                     # Callback varsa çağır
                     if self.data_callback:
-                        self.data_callback(line)
-                        
-            except Exception as e:
-                print(f"Seri okuma hatası: {e}")
-                break
-    
+                        self.data_callback(line, role)
+        except Exception as e:
+            print(f"Veri işleme hatası ({role}): {e}")
+
+    def _drop_link(self, link: SerialLink):
+        """Kopan bağlantıyı döngüden çıkarır (döngü thread'inde çağrılır)"""
+        with self._links_lock:
+            if self.links.get(link.role) is link:
+                del self.links[link.role]
+        if self._selector is not None:
+            try:
+                self._selector.unregister(link.fileno())
+            except (KeyError, ValueError):
+                pass
+        link.close()
+
+        if link.role == ROLE_ROCKET:
+            self.connection_status_changed.emit(False, "Bağlantı koptu")
+        self.link_status_changed.emit(link.role, False, "Bağlantı koptu")
+
+    def set_sample_callback(self, callback: Callable):
+        """İkili kipte çözülen her tipli örnek için çağrılacak callback'i ayarlar: (örnek, rol)"""
+        self.sample_callback = callback
+
     def set_data_callback(self, callback: Callable):
-        """Veri alındığında çağrılacak callback fonksiyonunu ayarlar"""
+        """Satır alındığında çağrılacak callback fonksiyonunu ayarlar: (satır, rol)"""
         self.data_callback = callback
-    
+
     def is_connected(self) -> bool:
-        """Bağlantı durumunu kontrol eder"""
-        return self.serial_port is not None and self.serial_port.is_open
-    
+        """Roket bağlantısının durumunu kontrol eder"""
+        port = self.serial_port
+        return port is not None and port.is_open
+
+    def get_links(self) -> Dict[str, Dict[str, Any]]:
+        """Rol başına bağlantı bilgilerini döndürür"""
+        return {role: link.info() for role, link in list(self.links.items())}
+
     def get_connection_info(self) -> dict:
         """Bağlantı bilgilerini döndürür"""
         if self.is_connected():
+            port = self.serial_port
             return {
-                'port': self.serial_port.port,
-                'baudrate': self.serial_port.baudrate,
+                'port': port.port,
+                'baudrate': port.baudrate,
                 'team_id': self.team_id,
+                'ingest_mode': self.ingest_mode,
+                'binary_stats': self.binary_decoder.stats(),
+                'links': self.get_links(),
                 'connected': True
             }
         return {'connected': False}
@@ -0,0 +1,59 @@
+"""
+Sinyal Modülü
+Qt gerektirmeyen çekirdek sınıflar için basit sinyal/callback mekanizması
+"""
+
+import threading
+from typing import Any, Callable, List, Optional
+
+
+class BoundSignal:
+    """Bir nesneye bağlı sinyal: bağlı callback'leri emit eden thread'de çağırır"""
+
+    def __init__(self, name: str = ""):
+        self.name = name
+        self._lock = threading.Lock()
+        self._slots: List[Callable] = []
+
+    def connect(self, slot: Callable):
+        """Callback ekler"""
+        with self._lock:
+            self._slots = self._slots + [slot]
+
+    def disconnect(self, slot: Optional[Callable] = None):
+        """Verilen callback'i (verilmezse tümünü) çıkarır"""
+        with self._lock:
+            if slot is None:
+                self._slots = []
+            else:
+                self._slots = [s for s in self._slots if s != slot]
+
+    def emit(self, *args: Any):
+        """Bağlı callback'leri sırayla çağırır; bir callback'teki hata diğerlerini engellemez"""
+        for slot in self._slots:
+            try:
+                slot(*args)
+            except Exception as e:
+                print(f"Sinyal işleme hatası ({self.name}): {e}")
+
+
+class Signal:
+    """
+    pyqtSignal benzeri sınıf özniteliği; her nesne için ayrı bir BoundSignal üretir.
+    Qt köprüsü gerektiğinde bir pyqtSignal'in emit'i doğrudan bağlanabilir.
+    """
+
+    def __init__(self, *types: Any):
+        self.types = types
+        self.name = ""
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        bound = instance.__dict__.get(self.name)
+        if bound is None:
+            bound = instance.__dict__.setdefault(self.name, BoundSignal(self.name))
+        return bound
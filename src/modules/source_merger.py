@@ -0,0 +1,69 @@
+"""
+Kaynak Birleştirici Modülü
+Roket, görev yükü ve kademe alıcılarından gelen örnekleri tek bir telemetri örneğinde birleştirir
+"""
+
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+
+# Yardımcı kaynaklardan ana örneğe taşınan konum alanları
+POSITION_FIELDS = ('gps_irtifa', 'enlem', 'boylam')
+
+
+class SourceMerger:
+    """
+    Birden fazla alıcıdan gelen örnekleri birleştirir.
+
+    Yardımcı kaynakların (görev yükü, kademe) son örneği saklanır; ana kaynaktan
+    gelen her örneğe '<kaynak>_<alan>' anahtarlarıyla eklenir. max_age saniyeden
+    eski kaynak verisi eklenmez, böylece kopan bir alıcının son konumu sonsuza
+    kadar tekrar edilmez.
+    """
+
+    def __init__(self, primary: str = 'rocket', fields: Iterable[str] = POSITION_FIELDS,
+                 max_age: float = 5.0):
+        self.primary = primary
+        self.fields = tuple(fields)
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._latest: Dict[str, tuple] = {}
+        self._counts: Dict[str, int] = {}
+
+    def clear(self):
+        """Saklanan kaynak verisini siler (yeni uçuş için)"""
+        with self._lock:
+            self._latest.clear()
+            self._counts.clear()
+
+    def update(self, source: str, sample: Dict[str, Any], receive_time: Optional[float] = None):
+        """Yardımcı kaynağın son örneğini günceller"""
+        values = {field: sample[field] for field in self.fields if field in sample}
+        prefix = f"{source}_"
+        keys = {prefix + field: value for field, value in values.items()}
+        with self._lock:
+            self._latest[source] = (receive_time or time.monotonic(), keys)
+            self._counts[source] = self._counts.get(source, 0) + 1
+
+    def merge(self, sample: Dict[str, Any], now: Optional[float] = None) -> Dict[str, Any]:
+        """Ana kaynak örneğine güncel yardımcı kaynak alanlarını ekler"""
+        if not self._latest:
+            return sample
+
+        now = now or time.monotonic()
+        merged = dict(sample)
+        with self._lock:
+            for received, keys in self._latest.values():
+                if now - received <= self.max_age:
+                    merged.update(keys)
+        return merged
+
+    def stats(self) -> Dict[str, Any]:
+        """Kaynak başına alınan örnek sayısını ve son örneğin yaşını döndürür"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                source: {'samples': self._counts.get(source, 0), 'age': now - received}
+                for source, (received, _) in self._latest.items()
+            }
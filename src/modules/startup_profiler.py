@@ -0,0 +1,69 @@
+"""
+Başlangıç Profilleyici Modülü
+Uygulama açılışındaki aşamaların (import, motor oluşturma, QML yükleme...) sürelerini ölçer
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+
+
+class StartupProfiler:
+    """
+    Açılış aşamalarını sırayla ölçen basit profilleyici.
+    Kapalıyken phase() ve mark() yalnızca boş işlem yapar.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._origin = time.perf_counter()
+        self._last = self._origin
+        self.phases: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """with bloğunun süresini verilen ad ile kaydeder"""
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._last = time.perf_counter()
+            self.phases.append((name, self._last - started))
+
+    def mark(self, name: str):
+        """Son ölçümden bu yana geçen süreyi verilen ad ile kaydeder"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases.append((name, now - self._last))
+        self._last = now
+
+    def total(self) -> float:
+        """Profilleyicinin oluşturulmasından bu yana geçen süre (saniye)"""
+        return time.perf_counter() - self._origin
+
+    @staticmethod
+    def peak_rss_mb() -> float:
+        """Sürecin en yüksek bellek kullanımı (MB); ölçülemiyorsa 0"""
+        try:
+            import resource
+        except ImportError:
+            return 0.0
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux kB, macOS bayt döndürür
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+    def report(self) -> str:
+        """Aşama sürelerini tablo olarak döndürür"""
+        lines = ["Başlangıç profili:"]
+        for name, duration in self.phases:
+            lines.append(f"  {name:<28} {duration * 1000:9.1f} ms")
+        lines.append(f"  {'toplam':<28} {self.total() * 1000:9.1f} ms")
+        rss = self.peak_rss_mb()
+        if rss:
+            lines.append(f"  {'en yüksek bellek':<28} {rss:9.1f} MB")
+        return "\n".join(lines)
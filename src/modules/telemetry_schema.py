@@ -0,0 +1,126 @@
+"""
+Telemetri Şeması Modülü
+Bilinen telemetri alanlarının tipli sütun karşılıkları ve satır dönüşümleri
+"""
+
+import json
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+# Bilinen telemetri anahtarları ve SQLite sütun tipleri
+TELEMETRY_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ('irtifa', 'REAL'),
+    ('gps_irtifa', 'REAL'),
+    ('enlem', 'REAL'),
+    ('boylam', 'REAL'),
+    ('hiz', 'REAL'),
+    ('ivme_x', 'REAL'),
+    ('ivme_y', 'REAL'),
+    ('ivme_z', 'REAL'),
+    ('jiroskop_x', 'REAL'),
+    ('jiroskop_y', 'REAL'),
+    ('jiroskop_z', 'REAL'),
+    ('aci', 'REAL'),
+    ('durum', 'INTEGER'),
+)
+
+FIELD_NAMES: Tuple[str, ...] = tuple(name for name, _ in TELEMETRY_COLUMNS)
+FIELD_TYPES: Dict[str, str] = dict(TELEMETRY_COLUMNS)
+
+# Bilinmeyen anahtarların JSON olarak saklandığı taşma sütunu
+EXTRA_COLUMN = 'extra'
+
+COLUMN_DEFINITIONS = ",\n".join(f"{name} {sql_type}" for name, sql_type in TELEMETRY_COLUMNS)
+COLUMN_LIST = ", ".join(FIELD_NAMES)
+
+INSERT_SQL = (
+    f"INSERT INTO telemetry_logs (flight_id, sequence, capture_time, {COLUMN_LIST}, {EXTRA_COLUMN}) "
+    f"VALUES ({', '.join('?' * (len(FIELD_NAMES) + 4))})"
+)
+
+# Sayfalı okumalarda seçilen sütunlar (row_to_log ile aynı sırada)
+LOG_SELECT_COLUMNS = f"sequence, capture_time, timestamp, {COLUMN_LIST}, {EXTRA_COLUMN}"
+
+
+def _fits_column(value: Any, sql_type: str) -> bool:
+    """Değer tipli sütuna kayıpsız yazılabilir mi"""
+    # bool, int'in alt sınıfıdır; JSON'daki true/false korunabilsin diye taşmaya gider
+    if isinstance(value, bool):
+        return False
+    if sql_type == 'INTEGER':
+        return isinstance(value, int)
+    return isinstance(value, (int, float))
+
+
+def numeric_value(value: Any) -> Optional[float]:
+    """
+    Değerin sayısal karşılığı; tipli sütuna uymayıp taşma sütununa yazılan değerler
+    (1.0 durum, "12.5" gibi sayısal metin, true/false) de okunabilsin diye kullanılır.
+    Sayıya çevrilemeyen değerler için None döner (channel_expression ile aynı kural).
+    """
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            number = float(value)
+        except ValueError:
+            return None
+        return number if math.isfinite(number) else None
+    return None
+
+
+def channel_expression(name: str) -> str:
+    """
+    Tipli kanalın SQL ifadesi: sütun boşsa taşma sütunundaki değer sayıya
+    çevrilebiliyorsa kullanılır (REAL'e dönüşümü kendisine eşit olan değerler).
+    """
+    value = f"json_extract({EXTRA_COLUMN}, '$.\"{name}\"')"
+    return f"COALESCE({name}, CASE WHEN CAST({value} AS REAL) = {value} THEN CAST({value} AS REAL) END)"
+
+
+def split_sample(data: Dict[str, Any]) -> Tuple[List[Any], Optional[str]]:
+    """
+    Telemetri sözlüğünü tipli sütun değerleri ve taşma JSON'u olarak ayırır.
+    Tipli sütuna uymayan ya da bilinmeyen anahtarlar taşma sütununa yazılır.
+    """
+    values: List[Any] = []
+    extra: Dict[str, Any] = {}
+    for name, sql_type in TELEMETRY_COLUMNS:
+        value = data.get(name)
+        if value is None or _fits_column(value, sql_type):
+            values.append(value)
+        else:
+            values.append(None)
+            extra[name] = value
+    for key, value in data.items():
+        if key not in FIELD_TYPES:
+            extra[key] = value
+    return values, (json.dumps(extra) if extra else None)
+
+
+def insert_params(flight_id: int, sequence: int, capture_time: float,
+                  data: Dict[str, Any]) -> Tuple[Any, ...]:
+    """INSERT_SQL için parametre demetini hazırlar"""
+    values, extra = split_sample(data)
+    return (flight_id, sequence, capture_time, *values, extra)
+
+
+def build_sample(values: Sequence[Any], extra: Optional[str]) -> Dict[str, Any]:
+    """Tipli sütun değerleri ve taşma JSON'undan telemetri sözlüğünü yeniden kurar"""
+    sample = {name: value for name, value in zip(FIELD_NAMES, values) if value is not None}
+    if extra:
+        sample.update(json.loads(extra))
+    return sample
+
+
+def row_to_log(row: Sequence[Any]) -> Dict[str, Any]:
+    """LOG_SELECT_COLUMNS ile okunan satırı log sözlüğüne çevirir"""
+    return {
+        'sequence': row[0],
+        'capture_time': row[1],
+        'timestamp': row[2],
+        'data': build_sample(row[3:-1], row[-1])
+    }
@@ -0,0 +1,256 @@
+"""
+Telemetri Simülatörü Modülü
+İtki / süzülme / tepe noktası / iniş evreli, gürültülü ve tekrarlanabilir sentetik telemetri üretir
+"""
+
+import json
+import math
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from .binary_telemetry import encode_frame
+
+
+# Uçuş evreleri (telemetrideki 'durum' alanı)
+PHASE_PAD = 0      # rampada
+PHASE_BOOST = 1    # motor yanıyor
+PHASE_COAST = 2    # süzülme
+PHASE_DROGUE = 3   # tepe noktası sonrası sürüklenme paraşütü
+PHASE_MAIN = 4     # ana paraşüt
+PHASE_LANDED = 5   # yere indi
+
+# Çıkış biçimleri
+FORMAT_DICT = 'dict'
+FORMAT_JSON = 'json'
+FORMAT_BINARY = 'binary'
+
+GRAVITY = 9.80665
+METERS_PER_DEGREE = 111320.0
+
+
+class TelemetrySimulator:
+    """
+    Basit fizik modeliyle roket uçuşu simülatörü.
+
+    Dikey hareket itki, yerçekimi ve hızın karesiyle orantılı sürükleme ile
+    tümlevlenir; iniş paraşüt limit hızlarına yaklaşır, yatay konum rüzgârla
+    sürüklenir. Simülasyon zamanı sabit adımla ilerlediği için aynı tohum
+    (seed) her zaman aynı örnek dizisini üretir; gerçek zamanlı çalıştırmada
+    bekleme süresi değişse de çıktı değişmez.
+    """
+
+    def __init__(self, rate_hz: float = 100.0, seed: Optional[int] = None,
+                 launch_latitude: float = 39.9254, launch_longitude: float = 32.8667,
+                 pad_time: float = 2.0, burn_time: float = 3.5,
+                 boost_acceleration: float = 90.0, drag_coefficient: float = 0.0011,
+                 drogue_rate: float = 25.0, main_rate: float = 7.0,
+                 main_altitude: float = 500.0, wind: Tuple[float, float] = (3.0, 1.5),
+                 noise: float = 1.0):
+        self.rate_hz = rate_hz
+        self.dt = 1.0 / rate_hz
+        self.seed = seed
+        self.launch_latitude = launch_latitude
+        self.launch_longitude = launch_longitude
+        self.pad_time = pad_time
+        self.burn_time = burn_time
+        self.boost_acceleration = boost_acceleration
+        self.drag_coefficient = drag_coefficient
+        self.drogue_rate = drogue_rate
+        self.main_rate = main_rate
+        self.main_altitude = main_altitude
+        self.wind = wind
+        self.noise = noise
+
+        self._longitude_scale = METERS_PER_DEGREE * math.cos(math.radians(launch_latitude))
+        self.late_ticks = 0
+        self.reset()
+
+    def reset(self):
+        """Simülasyonu rampadaki başlangıç durumuna döndürür"""
+        self._rng = random.Random(self.seed)
+        self.time = 0.0
+        self.altitude = 0.0
+        self.vertical_speed = 0.0
+        self.east = 0.0
+        self.north = 0.0
+        self.max_altitude = 0.0
+        self.phase = PHASE_PAD
+        self.sample_count = 0
+
+    def _gauss(self, sigma: float) -> float:
+        return self._rng.gauss(0.0, sigma * self.noise) if self.noise else 0.0
+
+    def _advance(self, dt: float) -> float:
+        """Durumu dt kadar ilerletir ve dikey ivmeyi (m/s²) döndürür"""
+        t = self.time
+        v = self.vertical_speed
+        phase = self.phase
+        acceleration = 0.0
+
+        if phase == PHASE_PAD:
+            if t >= self.pad_time:
+                phase = PHASE_BOOST
+
+        if phase == PHASE_BOOST:
+            if t >= self.pad_time + self.burn_time:
+                phase = PHASE_COAST
+            else:
+                acceleration = self.boost_acceleration - GRAVITY - self.drag_coefficient * v * abs(v)
+
+        if phase == PHASE_COAST:
+            acceleration = -GRAVITY - self.drag_coefficient * v * abs(v)
+            if v + acceleration * dt <= 0.0:
+                # Tepe noktası: sürüklenme paraşütü açılır
+                phase = PHASE_DROGUE
+                self.max_altitude = self.altitude
+
+        if phase in (PHASE_DROGUE, PHASE_MAIN):
+            if phase == PHASE_DROGUE and self.altitude <= self.main_altitude:
+                phase = PHASE_MAIN
+            target = -(self.drogue_rate if phase == PHASE_DROGUE else self.main_rate)
+            # Limit hıza birinci dereceden yaklaşma (paraşüt açılma şoku yumuşatılır)
+            acceleration = (target - v) * 1.5
+
+        if phase == PHASE_LANDED:
+            self.time = t + dt
+            return 0.0
+
+        v += acceleration * dt
+        self.altitude += v * dt
+        if phase in (PHASE_DROGUE, PHASE_MAIN):
+            # İnişte rüzgârla sürüklenme
+            self.east += self.wind[0] * dt
+            self.north += self.wind[1] * dt
+        elif phase in (PHASE_BOOST, PHASE_COAST):
+            # Hafif eğik fırlatma: yatay hız dikey hızın küçük bir kesri
+            self.east += 0.04 * v * dt
+            self.north += 0.02 * v * dt
+
+        if self.altitude <= 0.0 and phase != PHASE_PAD and phase != PHASE_BOOST:
+            self.altitude = 0.0
+            v = 0.0
+            acceleration = 0.0
+            phase = PHASE_LANDED
+
+        self.max_altitude = max(self.max_altitude, self.altitude)
+        self.vertical_speed = v
+        self.phase = phase
+        self.time = t + dt
+        return acceleration
+
+    def step(self, dt: Optional[float] = None) -> Dict[str, Any]:
+        """Simülasyonu bir adım ilerletir ve gürültülü telemetri örneğini döndürür"""
+        acceleration = self._advance(self.dt if dt is None else dt)
+        phase = self.phase
+        gauss = self._gauss
+
+        # İvmeölçer özgül kuvveti ölçer: süzülmede yalnızca sürükleme, rampada ve inişte ~g
+        if phase == PHASE_COAST:
+            specific_force = -self.drag_coefficient * self.vertical_speed * abs(self.vertical_speed)
+        else:
+            specific_force = acceleration + GRAVITY
+        spin = 180.0 if phase == PHASE_BOOST else (40.0 if phase == PHASE_COAST else 0.0)
+        swing = 15.0 if phase in (PHASE_DROGUE, PHASE_MAIN) else 0.0
+        tilt = 3.0 + min(self.time, 60.0) * 0.5 if phase in (PHASE_BOOST, PHASE_COAST) else 0.0
+        if phase in (PHASE_DROGUE, PHASE_MAIN):
+            tilt = 90.0 + swing * math.sin(self.time * 1.3)
+
+        if phase in (PHASE_DROGUE, PHASE_MAIN):
+            horizontal = math.hypot(*self.wind)
+        else:
+            horizontal = 0.045 * abs(self.vertical_speed)
+        self.sample_count += 1
+        return {
+            'irtifa': self.altitude + gauss(0.5),
+            'gps_irtifa': self.altitude + gauss(3.0),
+            'enlem': self.launch_latitude + (self.north + gauss(1.5)) / METERS_PER_DEGREE,
+            'boylam': self.launch_longitude + (self.east + gauss(1.5)) / self._longitude_scale,
+            'hiz': math.hypot(self.vertical_speed, horizontal) + gauss(0.2),
+            'ivme_x': gauss(0.3) + (swing * 0.05 * math.cos(self.time * 1.3)),
+            'ivme_y': gauss(0.3),
+            'ivme_z': specific_force + gauss(0.4),
+            'jiroskop_x': gauss(1.0) + swing * math.cos(self.time * 1.3),
+            'jiroskop_y': gauss(1.0),
+            'jiroskop_z': spin + gauss(2.0),
+            'aci': tilt + gauss(0.5),
+            'durum': phase
+        }
+
+    def samples(self, count: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Beklemeden sabit adımlı örnek üretir (count None ise iniş tamamlanana kadar)"""
+        produced = 0
+        while count is None or produced < count:
+            if count is None and self.phase == PHASE_LANDED:
+                return
+            yield self.step()
+            produced += 1
+
+    @staticmethod
+    def encode(sample: Dict[str, Any], fmt: str, counter: int = 0) -> bytes:
+        """Örneği seri hat biçimine (JSON satırı ya da ikili çerçeve) kodlar"""
+        if fmt == FORMAT_BINARY:
+            return encode_frame(sample, counter)
+        return (json.dumps(sample) + "\n").encode()
+
+    def run(self, sink: Callable[[Any], Any], fmt: str = FORMAT_DICT,
+            duration: Optional[float] = None, count: Optional[int] = None,
+            stop: Optional[threading.Event] = None, until_landed: bool = False) -> int:
+        """
+        Örnekleri rate_hz hızında gerçek zamanlı üretip sink'e iletir (until_landed
+        ile iniş örneğinden sonra durur).
+        Her tikin hedef zamanı başlangıçtan mutlak olarak (start + n * dt) hesaplanır,
+        böylece uyku hataları birikmez; geride kalınırsa beklemeden devam edilir.
+        Üretilen örnek sayısını döndürür.
+        """
+        dt = self.dt
+        start = time.monotonic()
+        produced = 0
+        while count is None or produced < count:
+            if stop is not None and stop.is_set():
+                break
+            deadline = start + produced * dt
+            if duration is not None and deadline - start >= duration:
+                break
+
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                if stop is not None:
+                    if stop.wait(delay):
+                        break
+                else:
+                    time.sleep(delay)
+            elif delay < -dt:
+                self.late_ticks += 1
+
+            sample = self.step()
+            sink(sample if fmt == FORMAT_DICT else self.encode(sample, fmt, produced))
+            produced += 1
+            if until_landed and self.phase == PHASE_LANDED:
+                break
+        return produced
+
+
+def open_pty() -> Tuple[int, str]:
+    """
+    Ham kipte bir sözde terminal çifti açar (yalnızca POSIX).
+    Ana uçtaki (master) dosya tanımlayıcısını ve SerialManager'ın bağlanacağı
+    yardımcı uç (slave) yolunu döndürür.
+    """
+    import pty
+    import tty
+    master, slave = pty.openpty()
+    tty.setraw(slave)
+    return master, os.ttyname(slave)
+
+
+def fd_writer(fd: int) -> Callable[[bytes], None]:
+    """Baytların tamamını verilen dosya tanımlayıcısına yazan sink döndürür"""
+    def write(data: bytes):
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    return write
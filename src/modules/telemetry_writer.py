@@ -0,0 +1,212 @@
+"""
+Telemetri Yazıcı Modülü
+Telemetri kayıtlarını arka planda toplu (group commit) olarak SQLite'a yazar
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .pipeline_metrics import PipelineMetrics, STAGE_DB_COMMIT, STAGE_DB_LAG
+from .telemetry_schema import INSERT_SQL, insert_params
+
+
+class TelemetryWriter:
+    """
+    Write-behind telemetri yazıcısı.
+
+    Tek bir uzun ömürlü bağlantı yalnızca yazıcı thread'ine aittir. Kayıtlar
+    sınırlı bir kuyrukta biriktirilir ve boyut ya da süre eşiği dolduğunda
+    tek bir transaction içinde yazılır.
+    """
+
+    _STOP = object()
+
+    def __init__(self, db_path: str, batch_size: int = 200,
+                 flush_interval: float = 0.25, max_queue_size: int = 10000,
+                 on_commit: Optional[Callable[[int], None]] = None):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.on_commit = on_commit
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.written_count = 0
+        self.commit_count = 0
+        # Tek tek denendiğinde de yazılamayıp atılan kayıtlar
+        self.failed_count = 0
+        self.metrics: Optional[PipelineMetrics] = None
+
+    def start(self):
+        """Yazıcı thread'ini başlatır"""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def is_running(self) -> bool:
+        """Yazıcı thread'i çalışıyor mu"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def submit(self, flight_id: int, sequence: int, capture_time: float,
+               data: Dict[str, Any]):
+        """
+        Bir kaydı yazma kuyruğuna ekler.
+        Kuyruk doluysa örnek kaybetmemek için yer açılana kadar bekler.
+        """
+        self._queue.put((flight_id, sequence, capture_time, data))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Kuyruktaki tüm kayıtlar diske yazılana kadar bekler"""
+        if not self.is_running():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0):
+        """Bekleyen kayıtları yazar ve yazıcı thread'ini durdurur"""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is None or not thread.is_alive():
+            return
+        self._queue.put(self._STOP)
+        thread.join(timeout)
+
+    def pending(self) -> int:
+        """Kuyrukta bekleyen kayıt sayısı"""
+        return self._queue.qsize()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Yazıcı bağlantısını açar ve WAL kipine alır"""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _run(self):
+        """Yazıcı thread'i: kuyruğu boşaltır ve toplu commit yapar"""
+        try:
+            conn = self._connect()
+        except Exception as e:
+            print(f"Telemetri yazıcı bağlantı hatası: {e}")
+            return
+
+        batch: List[Tuple[int, int, float, Dict[str, Any]]] = []
+        waiters: List[threading.Event] = []
+        deadline = None
+        stop = False
+
+        while not stop:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is self._STOP:
+                stop = True
+            elif isinstance(item, threading.Event):
+                waiters.append(item)
+            elif item is not None:
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            due = (len(batch) >= self.batch_size or stop or waiters
+                   or (deadline is not None and time.monotonic() >= deadline))
+            if not due:
+                continue
+
+            if batch:
+                self._write_batch(conn, batch)
+                batch = []
+            deadline = None
+            for waiter in waiters:
+                waiter.set()
+            waiters = []
+
+        conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        """Yazılan, yazılamayan ve bekleyen kayıt sayaçlarını döndürür"""
+        return {
+            'written': self.written_count,
+            'commits': self.commit_count,
+            'failed': self.failed_count,
+            'pending': self.pending()
+        }
+
+    def _write_batch(self, conn: sqlite3.Connection,
+                     batch: List[Tuple[int, int, float, Dict[str, Any]]]):
+        """Bir grup kaydı tek transaction içinde yazar"""
+        metrics = self.metrics
+        if metrics is not None and not metrics.enabled:
+            metrics = None
+        if metrics is not None:
+            started = metrics.clock()
+        try:
+            conn.executemany(
+                INSERT_SQL,
+                [insert_params(*item) for item in batch]
+            )
+            conn.commit()
+            written = len(batch)
+        except Exception as e:
+            print(f"Telemetri toplu yazma hatası: {e}")
+            conn.rollback()
+            # Hatalı tek bir kayıt gruptaki diğer kayıtları da götürmesin
+            written = self._write_rows(conn, batch)
+            if not written:
+                return
+
+        self.written_count += written
+        self.commit_count += 1
+        if metrics is not None:
+            metrics.record(STAGE_DB_COMMIT, metrics.clock() - started, written)
+            # Gruptaki en eski kaydın yakalanmasından commit'e kadar geçen süre
+            metrics.record(STAGE_DB_LAG, max(0, int((time.time() - batch[0][2]) * 1e9)), written)
+
+        if self.on_commit:
+            try:
+                self.on_commit(written)
+            except Exception as e:
+                print(f"Telemetri commit callback hatası: {e}")
+
+    def _write_rows(self, conn: sqlite3.Connection,
+                    batch: List[Tuple[int, int, float, Dict[str, Any]]]) -> int:
+        """
+        Grubu kayıt kayıt yazar; yazılamayan kayıtlar atlanıp sayılır.
+        Geçici hatalarda (ör. kilitli veritabanı) kayıt bir kez daha denenir.
+        Yazılan kayıt sayısını döndürür.
+        """
+        written = 0
+        for item in batch:
+            for attempt in range(2):
+                try:
+                    conn.execute(INSERT_SQL, insert_params(*item))
+                    written += 1
+                    break
+                except sqlite3.OperationalError as e:
+                    if attempt == 0:
+                        time.sleep(0.05)
+                        continue
+                    print(f"Telemetri kaydı yazma hatası (uçuş {item[0]}, sıra {item[1]}): {e}")
+                except Exception as e:
+                    print(f"Telemetri kaydı yazma hatası (uçuş {item[0]}, sıra {item[1]}): {e}")
+                    break
+        failed = len(batch) - written
+        try:
+            conn.commit()
+        except Exception as e:
+            print(f"Telemetri kaydı commit hatası: {e}")
+            conn.rollback()
+            failed = len(batch)
+            written = 0
+        self.failed_count += failed
+        return written
@@ -3,44 +3,66 @@ UI Bridge Modülü
 QML ile Python arasındaki köprü sınıfları
 """
 
-import json
-import random
 import time
 import threading
-from typing import Dict, Any
-from PyQt5.QtCore import QObject, pyqtSlot, pyqtSignal, QVariant
-from PyQt5.QtTextToSpeech import QTextToSpeech
-from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
-from PyQt5.QtCore import QUrl
+from typing import Dict, Any, Optional
+from PyQt5.QtCore import QObject, QTimer, pyqtSlot, pyqtSignal, QVariant
 
-from .serial_manager import SerialManager
 from .database_manager import DatabaseManager
-from .protocol import HYIProtocol
+from .ground_station import GroundStation
+from .flight_export import FlightExporter
+from .flight_replay import FlightReplay
+from .flight_track import view_tolerance
+from .query_service import QueryService
+from .raw_journal import DEFAULT_JOURNAL_DIR, list_segments, reingest_journal
+from .telemetry_simulator import TelemetrySimulator
+from .ui_publisher import TelemetryPublisher
 
 
 class TelemetryBridge(QObject):
-    """Telemetri verilerini QML'e bağlayan köprü sınıfı"""
+    """Telemetri verilerini QML'e bağlayan köprü sınıfı (GroundStation çekirdeği üzerinde)"""
     
     # Sinyaller
     telemetry_updated = pyqtSignal('QVariant')
     packet_sent = pyqtSignal(str, str)
     port_list_changed = pyqtSignal(list)
     connection_status_changed = pyqtSignal(bool, str)
+    link_status_changed = pyqtSignal(str, bool, str)
+    replay_finished = pyqtSignal('QVariant')
+    pipeline_metrics_updated = pyqtSignal('QVariant')
     
-    def __init__(self):
+    def __init__(self, ui_rate: float = 30.0, journal_dir: Optional[str] = None):
         super().__init__()
-        self.serial_manager = SerialManager()
-        self.database_manager = DatabaseManager()
-        self.packet_counter = 0
-        self.fake_telemetry_running = False
+        # Veritabanı şeması açılışı bekletmeden arka planda hazırlanır; journal_dir
+        # verildiyse alınan ham baytlar çökme sonrası kurtarma için günlüğe de yazılır
+        self.station = GroundStation(background_init=True, journal_dir=journal_dir)
+        self.serial_manager = self.station.serial_manager
+        self.database_manager = self.station.database_manager
+        self.judge_transmitter = self.station.judge_transmitter
+        self.source_merger = self.station.source_merger
+        self.fake_telemetry_rate = 20.0
+        self._fake_telemetry_stop = threading.Event()
+        self._fake_telemetry_thread = None
         
-        # Sinyal bağlantıları
-        self.serial_manager.data_received.connect(self._on_data_received)
-        self.serial_manager.connection_status_changed.connect(self.connection_status_changed.emit)
-        self.serial_manager.port_list_changed.connect(self.port_list_changed.emit)
+        # Kayıtlı uçuşlar tam hattan (kayıt, arayüz, hakem) yeniden geçirilir
+        self.replay = FlightReplay(self.database_manager, self._process_telemetry_data,
+                                   on_finished=self._on_replay_finished)
         
-        # Veri işleme callback'i
-        self.serial_manager.set_data_callback(self._process_telemetry_data)
+        # QML'e giden güncellemeler arayüz hızında birleştirilir
+        self.ui_publisher = TelemetryPublisher(self._publish_telemetry, ui_rate)
+        
+        # Hat aşama ölçümleri; tanı paneli için belirli aralıklarla yayınlanır
+        self.metrics = self.station.metrics
+        self.ui_publisher.metrics = self.metrics
+        self._metrics_timer = QTimer(self)
+        self._metrics_timer.timeout.connect(self._emit_pipeline_metrics)
+        
+        # Çekirdek sinyalleri G/Ç thread'inde gelir; Qt sinyalleri GUI thread'ine taşır
+        self.station.telemetry_received.connect(self.ui_publisher.submit)
+        self.station.packet_sent.connect(self._on_packet_sent)
+        self.station.connection_status_changed.connect(self.connection_status_changed.emit)
+        self.station.link_status_changed.connect(self.link_status_changed.emit)
+        self.serial_manager.port_list_changed.connect(self.port_list_changed.emit)
     
     @pyqtSlot(result=list)
     def get_ports(self):
@@ -48,13 +70,10 @@ class TelemetryBridge(QObject):
         return self.serial_manager.get_available_ports()
     
     @pyqtSlot(str, int, int)
-    def connect_port(self, port_name: str, team_id: int, baudrate: int):
-        """Seri porta bağlanır"""
-        success = self.serial_manager.connect_to_port(port_name, baudrate, team_id)
-        if success:
-            # Uçuş başlat
-            flight_name = f"Uçuş_{int(time.time())}"
-            self.database_manager.start_flight(flight_name)
+    @pyqtSlot(str, int, int, str)
+    def connect_port(self, port_name: str, team_id: int, baudrate: int, ingest_mode: str = 'json'):
+        """Seri porta bağlanır ve uçuş başlatır (ingest_mode: 'json' ya da 'binary')"""
+        self.station.connect(port_name, team_id, baudrate, ingest_mode)
     
     @pyqtSlot()
     def disconnect_port(self):
@@ -62,60 +81,212 @@ class TelemetryBridge(QObject):
         # Fake telemetriyi durdur
         self.fake_telemetry_running = False
         
-        self.serial_manager.disconnect_from_port()
-        # Mevcut uçuşu sonlandır
-        if self.database_manager.current_flight_id:
-            self.database_manager.end_flight(self.database_manager.current_flight_id)
+        # Bağlantıları kes ve mevcut uçuşu sonlandır
+        self.station.disconnect()
     
-    def _on_data_received(self, data: str):
-        """Seri porttan veri alındığında çağrılır"""
-        try:
-            # JSON verisini parse et
-            telemetry_data = json.loads(data)
-            self._process_telemetry_data(telemetry_data)
-        except json.JSONDecodeError:
-            print(f"JSON parse hatası: {data}")
+    @pyqtSlot(str, str, int)
+    @pyqtSlot(str, str, int, str)
+    def add_link(self, role: str, port_name: str, baudrate: int, ingest_mode: str = 'json'):
+        """Ek alıcı ('payload', 'stage') ya da hakem çıkışı ('judge') bağlantısı açar"""
+        self.station.add_link(role, port_name, baudrate, ingest_mode)
+    
+    @pyqtSlot(str)
+    def remove_link(self, role: str):
+        """Verilen roldeki bağlantıyı kapatır"""
+        self.station.remove_link(role)
+    
+    @pyqtSlot(result='QVariant')
+    def get_links(self):
+        """Rol başına bağlantı bilgilerini ve kaynak birleştirici durumunu döndürür"""
+        return QVariant({
+            'links': self.serial_manager.get_links(),
+            'sources': self.source_merger.stats()
+        })
+    
+    def shutdown(self):
+        """Uygulama kapanırken veri akışını durdurur ve bekleyen kayıtları yazar"""
+        self.fake_telemetry_running = False
+        self.replay.stop()
+        self.ui_publisher.stop()
+        self._metrics_timer.stop()
+        self.metrics.stop_dump()
+        self.station.shutdown()
     
     def _process_telemetry_data(self, data: Dict[str, Any]):
-        """Telemetri verisini işler"""
-        # Veritabanına logla
-        self.database_manager.log_telemetry(data)
-        
-        # QML'e gönder
+        """Telemetri verisini çekirdek hatta işler"""
+        self.station.process_telemetry(data)
+    
+    def _publish_telemetry(self, data: Dict[str, Any]):
+        """Birleştirilmiş son örneği QML'e iletir (GUI thread'inde çağrılır)"""
         self.telemetry_updated.emit(QVariant(data))
-        
-        # Hakem yer istasyonuna gönder
-        self._send_to_judge(data)
     
-    def _send_to_judge(self, data: Dict[str, Any]):
-        """Hakem yer istasyonuna veri gönderir"""
-        if not self.serial_manager.is_connected():
-            return
-        
+    @pyqtSlot(float)
+    def set_ui_rate(self, ui_rate: float):
+        """QML telemetri güncelleme hızını (Hz) ayarlar"""
+        self.ui_publisher.set_rate(ui_rate)
+    
+    @pyqtSlot(bool)
+    def set_change_detection(self, enabled: bool):
+        """Açıkken değişmeyen örnekler QML'e gönderilmez"""
+        self.ui_publisher.change_detection = enabled
+    
+    @pyqtSlot(result='QVariant')
+    def get_ui_publisher_stats(self):
+        """Yayıncı sayaçlarını (alınan/yayınlanan/birleştirilen/bastırılan) döndürür"""
+        return QVariant(self.ui_publisher.stats())
+    
+    @pyqtSlot(result='QVariant')
+    def get_journal_stats(self):
+        """Açık ham bayt günlüğünün segment ve kayıt sayaçlarını döndürür"""
+        journal = self.station.journal
+        return QVariant(journal.stats() if journal is not None else {})
+    
+    def _on_packet_sent(self, packet_counter: int):
+        """Gönderici thread'i bir paketi yazdığında çağrılır"""
+        self.packet_sent.emit("HYI", f"Paket {packet_counter} gönderildi")
+    
+    @pyqtSlot(float)
+    def set_judge_rate(self, rate_hz: float):
+        """Hakem paket gönderim hızını (Hz) ayarlar; 0 hız sınırını kaldırır"""
+        self.judge_transmitter.set_rate(rate_hz)
+    
+    @pyqtSlot(result='QVariant')
+    def get_judge_stats(self):
+        """Kuyruğa alınan/gönderilen/atılan paket sayaçlarını ve bekleme sürelerini döndürür"""
+        return QVariant(self.judge_transmitter.stats())
+    
+    @pyqtSlot(str, result=bool)
+    def set_ingest_policy(self, policy: str):
+        """Alım kuyruğu taşma politikasını ayarlar ('block', 'drop_oldest', 'keep_latest')"""
+        if self.station.ingest_queue is None:
+            return False
         try:
-            # Veriyi HYI protokolü formatına çevir
-            parsed_data = HYIProtocol.parse_telemetry_data(data)
-            
-            # HYI paketi oluştur
-            packet = HYIProtocol.create_hyi_packet(
-                team_id=self.serial_manager.team_id,
-                packet_counter=self.packet_counter,
-                **parsed_data
-            )
-            
-            # Paketi gönder
-            if self.serial_manager.send_data(packet):
-                self.packet_counter += 1
-                self.packet_sent.emit("HYI", f"Paket {self.packet_counter} gönderildi")
-            
-        except Exception as e:
-            print(f"Hakem veri gönderme hatası: {e}")
+            self.station.ingest_queue.set_policy(policy)
+            return True
+        except ValueError as e:
+            print(f"Alım kuyruğu politika hatası: {e}")
+            return False
+    
+    @pyqtSlot(result='QVariant')
+    def get_ingest_stats(self):
+        """Alım kuyruğu derinliği, en yüksek doluluk ve atlanan örnek sayaçlarını döndürür"""
+        queue = self.station.ingest_queue
+        return QVariant(queue.stats() if queue is not None else {})
+    
+    @pyqtSlot(result='QVariant')
+    def get_pipeline_metrics(self):
+        """Hat aşamalarının kayan gecikme yüzdelikleri ve hızları"""
+        return QVariant(self.metrics.snapshot())
+    
+    @pyqtSlot(bool)
+    def set_pipeline_metrics_enabled(self, enabled: bool):
+        """Aşama ölçümlerini açar/kapatır"""
+        self.metrics.enabled = enabled
+    
+    @pyqtSlot(float)
+    def set_pipeline_metrics_interval(self, seconds: float):
+        """pipeline_metrics_updated sinyalinin aralığını ayarlar (0: durdur)"""
+        if seconds > 0:
+            self._metrics_timer.start(max(100, int(seconds * 1000)))
+        else:
+            self._metrics_timer.stop()
+    
+    @pyqtSlot()
+    def reset_pipeline_metrics(self):
+        """Aşama ölçümlerini sıfırlar"""
+        self.metrics.reset()
+    
+    @pyqtSlot(str, float, result=bool)
+    def start_pipeline_metrics_dump(self, path: str, seconds: float):
+        """Ölçümleri seconds saniyede bir dosyaya JSON satırı olarak ekler"""
+        return self.metrics.start_dump(path, seconds)
     
     @pyqtSlot()
-    def start_fake_telemetry(self):
-        """Sahte telemetri verisi üretir (test için)"""
-        # Fake telemetri için özel bir durum oluştur
-        self.fake_telemetry_running = True
+    def stop_pipeline_metrics_dump(self):
+        """Dosyaya dökümü durdurur"""
+        self.metrics.stop_dump()
+    
+    def _emit_pipeline_metrics(self):
+        self.pipeline_metrics_updated.emit(QVariant(self.metrics.snapshot()))
+    
+    @pyqtSlot(str, float, int, result='QVariant')
+    def get_live_graph_data(self, field: str, seconds: float, max_points: int):
+        """Canlı uçuşun son seconds saniyesini bellekten döndürür (seconds <= 0: tüm tampon)"""
+        return QVariant(self.database_manager.get_live_window(
+            field, seconds if seconds > 0 else None, max_points=max_points
+        ))
+    
+    @pyqtSlot(str, float, result='QVariant')
+    def get_live_statistics(self, field: str, seconds: float):
+        """Canlı uçuşun son seconds saniyesi için istatistikleri döndürür"""
+        return QVariant(self.database_manager.get_live_window_statistics(
+            field, seconds if seconds > 0 else None
+        ))
+    
+    @pyqtSlot(int, float, result=bool)
+    def start_replay(self, flight_id: int, speed: float):
+        """
+        Kayıtlı uçuşu yeni bir uçuş olarak tam hattan yeniden oynatır.
+        speed 1 gerçek zaman, N N kat hız, 0 beklemesiz en yüksek hızdır.
+        """
+        if self.serial_manager.is_connected() or self.replay.is_running():
+            print("Tekrar oynatma başlatılamadı: canlı bağlantı ya da oynatma sürüyor")
+            return False
+        
+        self.fake_telemetry_running = False
+        if self.database_manager.current_flight_id:
+            self.database_manager.end_flight(self.database_manager.current_flight_id)
+        self.database_manager.start_flight(f"Tekrar_{flight_id}_{int(time.time())}")
+        
+        self.replay.start(flight_id, speed)
+        self.connection_status_changed.emit(True, f"Uçuş {flight_id} tekrar oynatılıyor ({speed:g}x)")
+        return True
+    
+    @pyqtSlot()
+    def stop_replay(self):
+        """Tekrar oynatmayı durdurur"""
+        self.replay.stop()
+    
+    @pyqtSlot(bool)
+    def pause_replay(self, paused: bool):
+        """Tekrar oynatmayı duraklatır ya da sürdürür"""
+        if paused:
+            self.replay.pause()
+        else:
+            self.replay.resume()
+    
+    @pyqtSlot(float)
+    def set_replay_speed(self, speed: float):
+        """Tekrar oynatma hızını değiştirir"""
+        self.replay.set_speed(speed)
+    
+    @pyqtSlot(result='QVariant')
+    def get_replay_stats(self):
+        """Oynatılan örnek sayısını, konumu, hızı ve ulaşılan örnek/saniye değerini döndürür"""
+        return QVariant(self.replay.stats())
+    
+    def _on_replay_finished(self, stats: Dict[str, Any]):
+        """Oynatma bittiğinde ya da durdurulduğunda oynatıcı thread'inde çağrılır"""
+        if self.database_manager.current_flight_id:
+            self.database_manager.end_flight(self.database_manager.current_flight_id)
+        self.connection_status_changed.emit(False, "Tekrar oynatma bitti")
+        self.replay_finished.emit(QVariant(stats))
+    
+    @property
+    def fake_telemetry_running(self) -> bool:
+        return self._fake_telemetry_thread is not None and not self._fake_telemetry_stop.is_set()
+    
+    @fake_telemetry_running.setter
+    def fake_telemetry_running(self, running: bool):
+        if not running:
+            self._fake_telemetry_stop.set()
+    
+    @pyqtSlot()
+    @pyqtSlot(float)
+    def start_fake_telemetry(self, rate_hz: float = 0.0):
+        """Fizik tabanlı sahte telemetri üretir (test için); rate_hz verilmezse varsayılan hız"""
+        if self.fake_telemetry_running:
+            return
         
         # Fake telemetri için uçuş başlat
         flight_name = f"Fake_Uçuş_{int(time.time())}"
@@ -124,48 +295,52 @@ class TelemetryBridge(QObject):
         # Bağlantı durumunu güncelle
         self.connection_status_changed.emit(True, "Fake telemetri başlatıldı")
         
+        simulator = TelemetrySimulator(rate_hz=rate_hz or self.fake_telemetry_rate)
+        stop = threading.Event()
+        self._fake_telemetry_stop = stop
+        
         def fake_loop():
-            while self.fake_telemetry_running:
-                fake_data = {
-                    'irtifa': random.uniform(1000, 2000),
-                    'gps_irtifa': random.uniform(995, 2005),
-                    'enlem': 39.9254 + random.uniform(-0.001, 0.001),
-                    'boylam': 32.8667 + random.uniform(-0.001, 0.001),
-                    'ivme_x': random.uniform(-1, 1),
-                    'ivme_y': random.uniform(-1, 1),
-                    'ivme_z': random.uniform(9.5, 10.5),
-                    'jiroskop_x': random.uniform(-5, 5),
-                    'jiroskop_y': random.uniform(-5, 5),
-                    'jiroskop_z': random.uniform(-5, 5),
-                    'aci': random.uniform(0, 90),
-                    'durum': random.randint(0, 3)
-                }
-                
-                self._process_telemetry_data(fake_data)
-                time.sleep(1)
+            # İniş sonrası yeni bir uçuş profiliyle devam edilir
+            while not stop.is_set():
+                simulator.run(self._process_telemetry_data, stop=stop, until_landed=True)
+                simulator.reset()
         
-        threading.Thread(target=fake_loop, daemon=True).start()
+        self._fake_telemetry_thread = threading.Thread(target=fake_loop, daemon=True)
+        self._fake_telemetry_thread.start()
+    
+    @pyqtSlot(float)
+    def set_fake_telemetry_rate(self, rate_hz: float):
+        """Sonraki sahte telemetri oturumunun örnek hızını (Hz) ayarlar"""
+        self.fake_telemetry_rate = max(rate_hz, 0.1)
 
 
 class SpeechHelper(QObject):
-    """Sesli okuma yardımcı sınıfı"""
+    """Sesli okuma yardımcı sınıfı (ses motoru ilk kullanımda yüklenir)"""
     
     def __init__(self):
         super().__init__()
-        self.speech = QTextToSpeech()
+        self._speech = None
         self.muted = False
-        
-        # Türkçe dil desteği ekle
-        try:
-            from PyQt5.QtCore import QLocale
-            self.speech.setLocale(QLocale("tr_TR"))
-        except Exception as e:
-            print(f"Türkçe dil ayarı yapılamadı: {e}")
-        
-        # Ses ayarları
-        self.speech.setRate(0.0)  # Normal hız
-        self.speech.setPitch(0.0)  # Normal ton
-        self.speech.setVolume(1.0)  # Tam ses
+    
+    @property
+    def speech(self):
+        """QTextToSpeech nesnesi; modül ve ses motoru ilk erişimde yüklenir"""
+        if self._speech is None:
+            from PyQt5.QtTextToSpeech import QTextToSpeech
+            self._speech = QTextToSpeech()
+            
+            # Türkçe dil desteği ekle
+            try:
+                from PyQt5.QtCore import QLocale
+                self._speech.setLocale(QLocale("tr_TR"))
+            except Exception as e:
+                print(f"Türkçe dil ayarı yapılamadı: {e}")
+            
+            # Ses ayarları
+            self._speech.setRate(0.0)  # Normal hız
+            self._speech.setPitch(0.0)  # Normal ton
+            self._speech.setVolume(1.0)  # Tam ses
+        return self._speech
     
     @pyqtSlot(str)
     def speak(self, text: str):
@@ -186,8 +361,10 @@ class SpeechHelper(QObject):
     @pyqtSlot()
     def stop_speaking(self):
         """Sesli okumayı durdurur"""
+        if self._speech is None:
+            return
         try:
-            self.speech.stop()
+            self._speech.stop()
             print("Sesli okuma durduruldu")
         except Exception as e:
             print(f"Sesli okuma durdurma hatası: {e}")
@@ -195,6 +372,7 @@ class SpeechHelper(QObject):
     @pyqtSlot(result=bool)
     def is_available(self):
         """Sesli okuma kullanılabilir mi kontrol eder"""
+        from PyQt5.QtTextToSpeech import QTextToSpeech
         return self.speech.state() != QTextToSpeech.NotReady
 
 
@@ -204,14 +382,42 @@ class LogManager(QObject):
     # Sinyaller
     log_updated = pyqtSignal()
     flight_list_updated = pyqtSignal()
+    export_finished = pyqtSignal('QVariant')
+    maintenance_finished = pyqtSignal('QVariant')
+    # QML işleyicileri parametrelere adlarıyla erişir; üç ve daha fazla parametreli
+    # sinyallerde adlar verilmezse PyQt5 Connections nesnesi oluşturulurken çöker
+    query_finished = pyqtSignal(int, str, 'QVariant', arguments=['requestId', 'query', 'result'])
+    query_failed = pyqtSignal(int, str, str, arguments=['requestId', 'query', 'message'])
     
-    def __init__(self):
+    def __init__(self, database_manager: Optional[DatabaseManager] = None,
+                 journal_dir: Optional[str] = None):
         super().__init__()
-        self.database_manager = DatabaseManager()
+        # Uygulamada TelemetryBridge'in DatabaseManager'ı paylaşılır; böylece aktif uçuş
+        # durumu tek yerde tutulur. Verilmezse (tek başına kullanım) kendi nesnesi açılır.
+        self._owns_database = database_manager is None
+        self.database_manager = database_manager or DatabaseManager(background_init=True)
+        # Kurtarmada okunacak ham bayt günlüğü (verilmezse varsayılan dizin)
+        self.journal_dir = journal_dir or DEFAULT_JOURNAL_DIR
+        
+        # request_* slotları sorguyu işçi thread'lerinde çalıştırır; sonuç istek ID'siyle
+        # query_finished üzerinden GUI thread'ine gelir
+        self.query_service = QueryService(self.database_manager)
         
         # Sinyal bağlantıları
         self.database_manager.log_updated.connect(self.log_updated.emit)
         self.database_manager.flight_list_updated.connect(self.flight_list_updated.emit)
+        self.query_service.query_finished.connect(self._on_query_finished)
+        self.query_service.query_failed.connect(self.query_failed.emit)
+    
+    def shutdown(self):
+        """Sorgu işçilerini durdurur; veritabanı bu nesneye aitse kapatır"""
+        self.query_service.stop()
+        if self._owns_database:
+            self.database_manager.close()
+    
+    def _on_query_finished(self, request_id: int, query: str, result: Any):
+        """İşçi thread'inde çağrılır; Qt sinyali sonucu GUI thread'ine kuyruklar"""
+        self.query_finished.emit(request_id, query, QVariant(result))
     
     @property
     def current_flight_id(self):
@@ -233,11 +439,26 @@ class LogManager(QObject):
         """Uçuş listesini döndürür"""
         return QVariant(self.database_manager.get_flight_list())
     
+    @pyqtSlot(int, int, result='QVariant')
+    def get_flight_list_page(self, offset: int, limit: int):
+        """Önbellekteki uçuş listesinin [offset, offset + limit) sayfasını döndürür"""
+        return QVariant(self.database_manager.get_flight_list(offset, limit))
+    
+    @pyqtSlot(result=int)
+    def get_flight_count(self):
+        """Kayıtlı uçuş sayısını döndürür"""
+        return self.database_manager.get_flight_count()
+    
     @pyqtSlot(int, result='QVariant')
     def get_logs_for_flight(self, flight_id: int):
         """Uçuş loglarını döndürür"""
         return QVariant(self.database_manager.get_logs_for_flight(flight_id))
     
+    @pyqtSlot(int, int, int, result='QVariant')
+    def get_logs_page(self, flight_id: int, after: int, page_size: int):
+        """Uçuş loglarını sayfa sayfa döndürür ({'logs': [...], 'next_cursor': n})"""
+        return QVariant(self.database_manager.get_logs_page(flight_id, after, page_size))
+    
     @pyqtSlot(int, result='QVariant')
     def get_flight_statistics(self, flight_id: int):
         """Uçuş istatistiklerini döndürür"""
@@ -248,12 +469,166 @@ class LogManager(QObject):
         """Mevcut uçuş istatistiklerini döndürür"""
         return QVariant(self.database_manager.get_current_flight_statistics())
     
-    @pyqtSlot(int, result='QVariant')
+    @pyqtSlot(int, str, result='QVariant')
     def get_flight_data_for_graph(self, flight_id: int, field: str):
         """Grafik verilerini döndürür"""
         return QVariant(self.database_manager.get_flight_data_for_graph(flight_id, field))
     
+    @pyqtSlot(int, str, int, int, int, result='QVariant')
+    def get_flight_graph_window(self, flight_id: int, field: str, start: int, end: int,
+                                max_points: int):
+        """Sıra aralığındaki grafik verisini en fazla max_points noktaya seyreltir (end < 0: sona kadar)"""
+        return QVariant(self.database_manager.get_flight_data_for_graph(
+            flight_id, field, max_points, max(start, 0), end if end >= 0 else None
+        ))
+    
     @pyqtSlot(str, result='QVariant')
     def get_current_flight_data_for_graph(self, field: str):
         """Mevcut uçuş grafik verilerini döndürür"""
         return QVariant(self.database_manager.get_current_flight_data_for_graph(field))
+    
+    @pyqtSlot(int, float, float, float, float, int, int, result='QVariant')
+    def get_flight_track(self, flight_id: int, min_lat: float, max_lat: float,
+                         min_lon: float, max_lon: float, width: int, height: int):
+        """Uçuş rotasının görünüme giren, width x height piksele göre sadeleştirilmiş parçaları"""
+        bounds = (min_lat, max_lat, min_lon, max_lon)
+        return QVariant(self.database_manager.get_flight_track(
+            flight_id, view_tolerance(bounds, width, height), bounds
+        ))
+    
+    @pyqtSlot(float, float, float, float, int, int, result='QVariant')
+    def get_current_flight_track(self, min_lat: float, max_lat: float, min_lon: float,
+                                 max_lon: float, width: int, height: int):
+        """Mevcut uçuşun canlı rotasını görünüm için döndürür"""
+        bounds = (min_lat, max_lat, min_lon, max_lon)
+        return QVariant(self.database_manager.get_current_flight_track(
+            view_tolerance(bounds, width, height), bounds
+        ))
+    
+    @pyqtSlot(result=int)
+    def request_flight_list(self):
+        """Uçuş listesini arka planda sorgular; istek ID'si döner, sonuç query_finished ile gelir"""
+        return self.query_service.submit('get_flight_list')
+    
+    @pyqtSlot(int, int, result=int)
+    def request_flight_list_page(self, offset: int, limit: int):
+        """Uçuş listesinin bir sayfasını arka planda sorgular"""
+        return self.query_service.submit('get_flight_list', offset, limit)
+    
+    @pyqtSlot(int, result=int)
+    def request_logs_for_flight(self, flight_id: int):
+        """Uçuşun tüm loglarını arka planda sorgular"""
+        return self.query_service.submit('get_logs_for_flight', flight_id)
+    
+    @pyqtSlot(int, int, int, result=int)
+    def request_logs_page(self, flight_id: int, after: int, page_size: int):
+        """Tek bir log sayfasını arka planda sorgular"""
+        return self.query_service.submit('get_logs_page', flight_id, after, page_size)
+    
+    @pyqtSlot(int, result=int)
+    def request_flight_statistics(self, flight_id: int):
+        """Uçuş istatistiklerini arka planda sorgular"""
+        return self.query_service.submit('get_flight_statistics', flight_id)
+    
+    @pyqtSlot(int, str, result=int)
+    def request_flight_data_for_graph(self, flight_id: int, field: str):
+        """Grafik verisini arka planda sorgular"""
+        return self.query_service.submit('get_flight_data_for_graph', flight_id, field)
+    
+    @pyqtSlot(int, str, int, int, int, result=int)
+    def request_flight_graph_window(self, flight_id: int, field: str, start: int, end: int,
+                                    max_points: int):
+        """Seyreltilmiş grafik penceresini arka planda sorgular (end < 0: sona kadar)"""
+        return self.query_service.submit(
+            'get_flight_data_for_graph', flight_id, field, max_points, max(start, 0),
+            end if end >= 0 else None
+        )
+    
+    @pyqtSlot(int, float, float, float, float, int, int, result=int)
+    def request_flight_track(self, flight_id: int, min_lat: float, max_lat: float,
+                             min_lon: float, max_lon: float, width: int, height: int):
+        """Uçuş rotasını görünüm için arka planda sorgular"""
+        bounds = (min_lat, max_lat, min_lon, max_lon)
+        return self.query_service.submit(
+            'get_flight_track', flight_id, view_tolerance(bounds, width, height), bounds
+        )
+    
+    @pyqtSlot(float, float, float, float, int, int, int, result=int)
+    def request_tracks_in_bounds(self, min_lat: float, max_lat: float, min_lon: float,
+                                 max_lon: float, width: int, height: int, limit: int):
+        """Görünümdeki tüm uçuşların rotalarını arka planda sorgular (çoklu uçuş katmanı)"""
+        bounds = (min_lat, max_lat, min_lon, max_lon)
+        return self.query_service.submit(
+            'get_tracks_in_bounds', bounds, view_tolerance(bounds, width, height), limit
+        )
+    
+    @pyqtSlot(int)
+    def cancel_request(self, request_id: int):
+        """Henüz çalışmaya başlamamış sorguyu iptal eder"""
+        if request_id > 0:
+            self.query_service.cancel(request_id)
+    
+    @pyqtSlot(result='QVariant')
+    def get_query_stats(self):
+        """Sorgu servisi sayaçlarını ve okuma bağlantı havuzu durumunu döndürür"""
+        return QVariant(self.query_service.stats())
+    
+    @pyqtSlot(int, str, str)
+    def export_flight(self, flight_id: int, path: str, fmt: str):
+        """Uçuşu arka planda dışa aktarır; bitince export_finished özeti yayınlanır"""
+        def run():
+            try:
+                if flight_id == self.database_manager.current_flight_id:
+                    self.database_manager.flush()
+                summary = FlightExporter(self.database_manager, flight_id).export(path, fmt)
+            except Exception as e:
+                print(f"Dışa aktarma hatası: {e}")
+                summary = {'flight_id': flight_id, 'format': fmt, 'path': path,
+                           'rows': 0, 'error': str(e)}
+            self.export_finished.emit(QVariant(summary))
+        
+        threading.Thread(target=run, daemon=True).start()
+    
+    def _run_maintenance(self, operation: str, task):
+        """Bakım işini arka planda çalıştırır; sonuç maintenance_finished ile yayınlanır"""
+        def run():
+            try:
+                result = task()
+            except Exception as e:
+                print(f"Veritabanı bakım hatası: {e}")
+                result = {}
+            self.maintenance_finished.emit(QVariant({'operation': operation, 'result': result}))
+        
+        threading.Thread(target=run, daemon=True).start()
+    
+    @pyqtSlot(int)
+    def compact_flight(self, flight_id: int):
+        """Tamamlanmış uçuşu sıkıştırılmış arşive taşır"""
+        self._run_maintenance('compact', lambda: self.database_manager.compact_flight(flight_id))
+    
+    @pyqtSlot(float, float, int)
+    def apply_retention(self, archive_after_days: float, delete_after_days: float, keep_flights: int):
+        """Saklama politikasını uygular (negatif değerler o kuralı kapatır)"""
+        self._run_maintenance('retention', lambda: self.database_manager.apply_retention(
+            archive_after_days if archive_after_days >= 0 else None,
+            delete_after_days if delete_after_days >= 0 else None,
+            keep_flights if keep_flights >= 0 else None
+        ))
+    
+    @pyqtSlot()
+    def vacuum(self):
+        """Boş sayfaları dosyadan geri verir"""
+        self._run_maintenance('vacuum', self.database_manager.vacuum)
+    
+    @pyqtSlot(int)
+    def recover_flight(self, flight_id: int):
+        """Uçuşu ham bayt günlüğünden yeni bir uçuş olarak yeniden kurar"""
+        self._run_maintenance('recover', lambda: reingest_journal(
+            list_segments(self.journal_dir), self.database_manager,
+            f"Kurtarılan_{flight_id}", flight_id
+        ))
+    
+    @pyqtSlot(result='QVariant')
+    def get_storage_stats(self):
+        """Veritabanı depolama özetini döndürür"""
+        return QVariant(self.database_manager.get_storage_stats())
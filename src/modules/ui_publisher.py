@@ -0,0 +1,108 @@
+"""
+Arayüz Yayıncı Modülü
+Telemetri örneklerini birleştirip QML'e sabit bir arayüz hızında iletir
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional
+from PyQt5.QtCore import QObject, QTimer
+
+from .pipeline_metrics import PipelineMetrics, STAGE_UI_PUBLISH
+
+
+class TelemetryPublisher(QObject):
+    """
+    Birleştirici (coalescing) telemetri yayıncısı.
+
+    submit() herhangi bir thread'den çağrılabilir ve yalnızca en son örneği
+    saklar. GUI thread'indeki zamanlayıcı her tikte bekleyen son örneği
+    yayınlar; aradaki örnekler birleştirilmiş sayılır.
+    """
+
+    def __init__(self, publish: Callable[[Dict[str, Any]], None], ui_rate: float = 30.0,
+                 change_detection: bool = False,
+                 tolerances: Optional[Dict[str, float]] = None):
+        super().__init__()
+        self._publish = publish
+        self._lock = threading.Lock()
+        self._latest: Optional[Dict[str, Any]] = None
+        self._last_published: Optional[Dict[str, Any]] = None
+        self.change_detection = change_detection
+        self.tolerances: Dict[str, float] = dict(tolerances or {})
+
+        # Sayaçlar
+        self.received_count = 0
+        self.published_count = 0
+        self.coalesced_count = 0
+        self.suppressed_count = 0
+
+        # QML'e yayın süresi ölçümü (TelemetryBridge tarafından atanır)
+        self.metrics: Optional[PipelineMetrics] = None
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._on_tick)
+        self.set_rate(ui_rate)
+
+    def set_rate(self, ui_rate: float):
+        """Arayüz yayın hızını (Hz) ayarlar"""
+        self.ui_rate = max(ui_rate, 0.1)
+        self._timer.start(max(1, int(1000 / self.ui_rate)))
+
+    def stop(self):
+        """Zamanlayıcıyı durdurur"""
+        self._timer.stop()
+
+    def submit(self, data: Dict[str, Any]):
+        """Yeni bir örneği yayın için bırakır; önceki yayınlanmamış örnek birleştirilir"""
+        with self._lock:
+            self.received_count += 1
+            if self._latest is not None:
+                self.coalesced_count += 1
+            self._latest = data
+
+    def _on_tick(self):
+        """Zamanlayıcı tiki: bekleyen son örneği yayınlar"""
+        with self._lock:
+            data = self._latest
+            self._latest = None
+        if data is None:
+            return
+
+        if self.change_detection and not self._has_changed(data):
+            self.suppressed_count += 1
+            return
+
+        self._last_published = data
+        self.published_count += 1
+        metrics = self.metrics
+        if metrics is not None and metrics.enabled:
+            started = metrics.clock()
+            self._publish(data)
+            metrics.lap(STAGE_UI_PUBLISH, started)
+        else:
+            self._publish(data)
+
+    def _has_changed(self, data: Dict[str, Any]) -> bool:
+        """Son yayınlanan örneğe göre tolerans üstünde değişen alan var mı"""
+        previous = self._last_published
+        if previous is None or previous.keys() != data.keys():
+            return True
+        for key, value in data.items():
+            old = previous[key]
+            if isinstance(value, (int, float)) and isinstance(old, (int, float)):
+                if abs(value - old) > self.tolerances.get(key, 0.0):
+                    return True
+            elif value != old:
+                return True
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        """Yayıncı sayaçlarını döndürür"""
+        return {
+            'ui_rate': self.ui_rate,
+            'change_detection': self.change_detection,
+            'received': self.received_count,
+            'published': self.published_count,
+            'coalesced': self.coalesced_count,
+            'suppressed': self.suppressed_count
+        }
@@ -0,0 +1,106 @@
+"""
+Humbaba Yer İstasyonu - Ham Günlükten Kurtarma
+Ham bayt günlüğünü listeler ve bir uçuşu günlükten SQLite'a yeniden kurar
+
+Kullanım:
+    python src/recover_journal.py --list
+    python src/recover_journal.py --flight 3
+    python src/recover_journal.py --flight 3 --replace --journal raw_journal --db flight_logs.db
+    python src/recover_journal.py --all --name "Tüm günlük"
+"""
+
+import argparse
+import datetime
+import os
+import sys
+
+from modules.database_manager import DatabaseManager
+from modules.raw_journal import DEFAULT_JOURNAL_DIR, list_segments, reingest_journal, scan_journal
+
+
+def format_time(timestamp) -> str:
+    """Duvar saati zamanını okunur biçime çevirir"""
+    if timestamp is None:
+        return "-"
+    return datetime.datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def print_segments(directory: str) -> int:
+    """Segmentleri, işaretleri ve kesik kuyrukları yazdırır"""
+    summaries = scan_journal(directory)
+    if not summaries:
+        print(f"Günlük segmenti bulunamadı: {directory}")
+        return 1
+    for summary in summaries:
+        name = os.path.basename(summary['path'])
+        if not summary['valid']:
+            print(f"{name}: geçersiz segment başlığı")
+            continue
+        data = ", ".join(f"{role} {size / 1024:.1f} KB" for role, size in summary['bytes'].items())
+        tail = "  KESİK KUYRUK" if summary['torn'] else ""
+        unused = summary['file_size'] - summary['end_offset']
+        print(
+            f"{name}: {summary['records']} kayıt, {format_time(summary['first_time'])} → "
+            f"{format_time(summary['last_time'])}, {data or 'veri yok'}"
+            f"{f', kapatılmamış ({unused / 1048576:.1f} MB boş)' if unused else ''}{tail}"
+        )
+        for mark in summary['marks']:
+            details = " ".join(f"{key}={value}" for key, value in mark.items()
+                               if key not in ('event', 'time'))
+            print(f"    {format_time(mark.get('time'))} {mark.get('event')} {details}")
+    return 0
+
+
+def main() -> int:
+    """Kurtarma ana fonksiyonu"""
+    parser = argparse.ArgumentParser(description="Humbaba ham günlükten kurtarma")
+    parser.add_argument("--journal", default=DEFAULT_JOURNAL_DIR, help="Günlük dizini")
+    parser.add_argument("--db", default="flight_logs.db", help="Veritabanı dosyası")
+    parser.add_argument("--list", action="store_true", help="Segmentleri ve uçuş işaretlerini listeler")
+    parser.add_argument("--flight", type=int, default=None, metavar="UÇUŞ_ID",
+                        help="Günlükteki işaretlere göre bu uçuşu yeniden kurar")
+    parser.add_argument("--all", action="store_true",
+                        help="Günlükteki tüm veriyi tek bir uçuş olarak yeniden kurar")
+    parser.add_argument("--name", default=None, help="Kurulan uçuşun adı")
+    parser.add_argument("--replace", action="store_true",
+                        help="Kurtarma başarılıysa veritabanındaki eski uçuşu siler")
+    args = parser.parse_args()
+
+    if args.list:
+        return print_segments(args.journal)
+    if args.flight is None and not args.all:
+        parser.error("--list, --flight ya da --all verilmelidir")
+
+    paths = list_segments(args.journal)
+    if not paths:
+        print(f"Günlük segmenti bulunamadı: {args.journal}")
+        return 1
+
+    database_manager = DatabaseManager(args.db, live_buffer_capacity=0)
+    try:
+        name = args.name or (f"Kurtarılan_{args.flight}" if args.flight is not None
+                             else "Kurtarılan_günlük")
+        result = reingest_journal(paths, database_manager, name,
+                                  None if args.all else args.flight)
+        if result['flight_id'] < 0:
+            print("Günlükte bu uçuşa ait veri bulunamadı")
+            return 1
+
+        print(
+            f"Uçuş {result['flight_id']} ({name}): {result['samples']} örnek, "
+            f"{result['records']} kayıt / {result['bytes'] / 1024:.1f} KB ham veri, "
+            f"{result['parse_errors']} ayrıştırma hatası"
+            f"{', kesik kuyruk atlandı' if result['torn'] else ''}",
+            flush=True
+        )
+        if args.replace and args.flight is not None and result['samples']:
+            database_manager.wait_background()
+            if database_manager.delete_flight(args.flight):
+                print(f"Eski uçuş {args.flight} silindi", flush=True)
+        return 0 if result['samples'] else 1
+    finally:
+        database_manager.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
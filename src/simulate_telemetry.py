@@ -0,0 +1,87 @@
+"""
+Humbaba Yer İstasyonu - Telemetri Simülatörü
+Fizik tabanlı sentetik telemetriyi bir sözde terminale ya da seri porta yazar
+
+Kullanım:
+    python src/simulate_telemetry.py --rate 500 --format binary --seed 42
+    # Yazdırılan /dev/pts/N yoluna yer istasyonu ya da headless.py ile bağlanın
+"""
+
+import argparse
+import os
+import signal
+import sys
+import threading
+
+from modules.telemetry_simulator import (
+    FORMAT_BINARY, FORMAT_JSON, TelemetrySimulator, fd_writer, open_pty
+)
+
+
+def main() -> int:
+    """Simülatör ana fonksiyonu"""
+    parser = argparse.ArgumentParser(description="Humbaba telemetri simülatörü")
+    parser.add_argument("--rate", type=float, default=100.0, help="Örnek hızı (Hz)")
+    parser.add_argument("--seed", type=int, default=None, help="Tekrarlanabilir çıktı için tohum")
+    parser.add_argument("--format", choices=(FORMAT_JSON, FORMAT_BINARY), default=FORMAT_JSON,
+                        help="Hat biçimi")
+    parser.add_argument("--port", default=None,
+                        help="Yazılacak seri port (verilmezse bir sözde terminal açılır)")
+    parser.add_argument("--baud", type=int, default=115200, help="Seri port baud hızı")
+    parser.add_argument("--duration", type=float, default=None, help="Süre (saniye)")
+    parser.add_argument("--loop", action="store_true", help="İniş sonrası yeni uçuşa başla")
+    args = parser.parse_args()
+
+    simulator = TelemetrySimulator(rate_hz=args.rate, seed=args.seed)
+    port = None
+    returned = [0]
+    if args.port:
+        import serial
+        port = serial.Serial(args.port, args.baud, write_timeout=1)
+        sink = port.write
+        print(f"{args.port} portuna yazılıyor ({args.rate:g} Hz, {args.format})", flush=True)
+    else:
+        master, slave_name = open_pty()
+        sink = fd_writer(master)
+        print(f"Sözde terminal: {slave_name} ({args.rate:g} Hz, {args.format})", flush=True)
+
+        def drain():
+            # Yer istasyonunun aynı porta yazdığı hakem paketleri okunup sayılır;
+            # okunmazsa terminal tamponu dolar ve karşı taraf yazarken bekler
+            while True:
+                try:
+                    data = os.read(master, 65536)
+                except OSError:
+                    break
+                if not data:
+                    break
+                returned[0] += len(data)
+
+        threading.Thread(target=drain, daemon=True).start()
+
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+
+    produced = 0
+    try:
+        while not stop.is_set():
+            # Bir uçuş ~2 dakika sürer; --loop yoksa iniş sonrası da yerdeki örnekler gönderilir
+            produced += simulator.run(sink, args.format, duration=args.duration, stop=stop,
+                                      until_landed=args.loop)
+            if not args.loop:
+                break
+            simulator.reset()
+    except OSError as e:
+        print(f"Yazma hatası: {e}")
+    finally:
+        if port:
+            port.close()
+
+    print(f"{produced} örnek gönderildi, {simulator.late_ticks} tik gecikti, "
+          f"geri gelen {returned[0]} bayt", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
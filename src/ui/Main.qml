@@ -86,6 +86,10 @@ ApplicationWindow {
     property string connectionStatus: "Bağlı değil"
     property var telemetryData: ({})
     property var selectedFlightStats: ({})
+    property int flightListRequest: -1
+    property int flightListOffset: 0
+    property int flightPageSize: 50
+    property int flightStatsRequest: -1
     property int currentTab: 0
     property var packetStats: ({total: 0, success: 0, failed: 0, successRate: 0})
     property int lastAltitudeAnnouncement: 0
@@ -639,6 +643,46 @@ ApplicationWindow {
                                         }
                                     }
                                     
+                                    // Uçuş rotası: yalnızca görünüme giren, piksel çözünürlüğüne
+                                    // sadeleştirilmiş köşeler çizilir
+                                    Canvas {
+                                        id: trackCanvas
+                                        anchors.fill: parent
+                                        property var segments: []
+                                        onPaint: {
+                                            var ctx = getContext("2d")
+                                            var map = parent
+                                            ctx.clearRect(0, 0, width, height)
+                                            ctx.strokeStyle = "#f1c40f"
+                                            ctx.lineWidth = 2
+                                            for (var i = 0; i < segments.length; i++) {
+                                                var path = segments[i]
+                                                ctx.beginPath()
+                                                for (var j = 0; j < path.length; j++) {
+                                                    var px = (path[j].longitude - map.minLon) / (map.maxLon - map.minLon) * width
+                                                    var py = (1.0 - (path[j].latitude - map.minLat) / (map.maxLat - map.minLat)) * height
+                                                    if (j === 0)
+                                                        ctx.moveTo(px, py)
+                                                    else
+                                                        ctx.lineTo(px, py)
+                                                }
+                                                ctx.stroke()
+                                            }
+                                        }
+                                        Timer {
+                                            interval: 1000
+                                            repeat: true
+                                            running: trackCanvas.visible
+                                            onTriggered: {
+                                                var map = trackCanvas.parent
+                                                trackCanvas.segments = logManager.get_current_flight_track(
+                                                    map.minLat, map.maxLat, map.minLon, map.maxLon,
+                                                    trackCanvas.width, trackCanvas.height)
+                                                trackCanvas.requestPaint()
+                                            }
+                                        }
+                                    }
+                                    
                                     // Roket konumu
                                     Rectangle {
                                         id: rocketPosition
@@ -1147,6 +1191,29 @@ ApplicationWindow {
                     Rectangle {
             color: mainBg
             anchors.fill: parent
+            // Geçmiş sorguları arka planda çalışır; sonuç istek ID'siyle eşleştirilir.
+            // Uçuş listesi sayfa sayfa yüklenir, liste sonuna gelindikçe devamı istenir.
+            function requestFlightPage(offset) {
+                flightListOffset = offset
+                flightListRequest = logManager.request_flight_list_page(offset, flightPageSize)
+            }
+            Component.onCompleted: requestFlightPage(0)
+            Connections {
+                target: logManager
+                function onQuery_finished(requestId, query, result) {
+                    if (requestId === flightListRequest) {
+                        flightListRequest = -1
+                        flightList = flightListOffset === 0 ? result : flightList.concat(result)
+                    } else if (requestId === flightStatsRequest) {
+                        selectedFlightStats = result
+                        statsLoader.active = false
+                        statsLoader.active = true
+                    }
+                }
+                function onFlight_list_updated() {
+                    requestFlightPage(0)
+                }
+            }
                         Column {
                 anchors.fill: parent
                 anchors.margins: 20
@@ -1179,7 +1246,13 @@ ApplicationWindow {
                         ListView {
                             width: parent.width
                             height: 300
-                            model: logManager.get_flight_list()
+                            model: flightList
+                            onAtYEndChanged: {
+                                if (atYEnd && flightListRequest < 0
+                                        && flightList.length === flightListOffset + flightPageSize) {
+                                    requestFlightPage(flightList.length)
+                                }
+                            }
                             delegate: Rectangle {
                                 width: parent.width
                                 height: 60
@@ -1215,9 +1288,8 @@ ApplicationWindow {
                                         }
                                         onClicked: {
                                             selectedFlightStats = {}
-                                            selectedFlightStats = logManager.get_flight_statistics(modelData.id)
-                                            statsLoader.active = false
-                                            statsLoader.active = true
+                                            logManager.cancel_request(flightStatsRequest)
+                                            flightStatsRequest = logManager.request_flight_statistics(modelData.id)
                                         }
                                     }
                                 }